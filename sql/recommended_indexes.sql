@@ -0,0 +1,61 @@
+-- Recommended indexes for the Wait Wait... Don't Tell Me! Stats Page
+-- Database, based on the queries run by the wwdtm library.
+--
+-- Show date filters in the show module use half-open date ranges
+-- (showdate >= start AND showdate < end), which can use an index on
+-- ww_shows.showdate. Most other queries join the show map tables on
+-- showid, or filter them by the entity ID, before joining ww_shows.
+--
+-- Review the existing indexes on each table before running this file.
+-- Skip any statement where the table already has an index (or primary
+-- or unique key) that starts with the same columns.
+
+-- Shows
+CREATE INDEX ix_ww_shows_showdate
+    ON ww_shows (showdate);
+CREATE INDEX ix_ww_shows_repeatshowid
+    ON ww_shows (repeatshowid);
+
+-- Panelists
+CREATE INDEX ix_ww_showpnlmap_showid
+    ON ww_showpnlmap (showid);
+CREATE INDEX ix_ww_showpnlmap_panelistid_showid
+    ON ww_showpnlmap (panelistid, showid);
+
+-- Bluff the Listener
+CREATE INDEX ix_ww_showbluffmap_showid
+    ON ww_showbluffmap (showid);
+CREATE INDEX ix_ww_showbluffmap_chosenbluffpnlid
+    ON ww_showbluffmap (chosenbluffpnlid);
+CREATE INDEX ix_ww_showbluffmap_correctbluffpnlid
+    ON ww_showbluffmap (correctbluffpnlid);
+
+-- Guests
+CREATE INDEX ix_ww_showguestmap_showid
+    ON ww_showguestmap (showid);
+CREATE INDEX ix_ww_showguestmap_guestid_showid
+    ON ww_showguestmap (guestid, showid);
+
+-- Hosts
+CREATE INDEX ix_ww_showhostmap_showid
+    ON ww_showhostmap (showid);
+CREATE INDEX ix_ww_showhostmap_hostid_showid
+    ON ww_showhostmap (hostid, showid);
+
+-- Scorekeepers
+CREATE INDEX ix_ww_showskmap_showid
+    ON ww_showskmap (showid);
+CREATE INDEX ix_ww_showskmap_scorekeeperid_showid
+    ON ww_showskmap (scorekeeperid, showid);
+
+-- Locations
+CREATE INDEX ix_ww_showlocationmap_showid
+    ON ww_showlocationmap (showid);
+CREATE INDEX ix_ww_showlocationmap_locationid_showid
+    ON ww_showlocationmap (locationid, showid);
+
+-- Show descriptions and notes
+CREATE INDEX ix_ww_showdescriptions_showid
+    ON ww_showdescriptions (showid);
+CREATE INDEX ix_ww_shownotes_showid
+    ON ww_shownotes (showid);
@@ -7,8 +7,215 @@ import time
 import json
 import os
 import mysql.connector
-from tests import (test_guest, test_host, test_location, test_panelist,
-                   test_scorekeeper, test_show)
+from tests import (test_aio, test_cache, test_executor, test_export,
+                   test_fanout, test_guest, test_host, test_location,
+                   test_panelist, test_pool, test_records, test_scorekeeper,
+                   test_show, test_showmap, test_slug_index, test_streaming)
+
+def test_aio_module(database_connection: mysql.connector.connect):
+    """Run tests against aio module"""
+
+    print("Testing wwdtm.aio module")
+
+    # Start Time
+    start_time = time.perf_counter()
+
+    # Testing concurrent retrieve functions
+    test_aio.test_retrieve_show_details_by_id(1083, database_connection)
+    test_aio.test_retrieve_panelist_details_by_id(2, database_connection)
+
+    # Testing multiple calls sharing a database connection
+    test_aio.test_gather([1081, 1082, 1083], database_connection)
+    test_aio.test_iter_all_details(database_connection)
+
+    # Calculate time elapsed
+    end_time = time.perf_counter()
+    elapsed_time = end_time - start_time
+    print("Time Elapsed: {}s\n".format(round(elapsed_time, 5)))
+
+def test_cache_module(database_connection: mysql.connector.connect):
+    """Run tests against cache module"""
+
+    print("Testing wwdtm.cache module")
+
+    # Start Time
+    start_time = time.perf_counter()
+
+    # Testing cached retrieve functions
+    test_cache.test_cached_retrieve_by_id(1, database_connection)
+    test_cache.test_cached_details_by_slug("faith-salie", database_connection)
+
+    # Testing cache invalidation and eviction
+    test_cache.test_invalidate(1, database_connection)
+    test_cache.test_invalidate_by_id(1, database_connection)
+    test_cache.test_invalidate_by_slug(1, database_connection)
+    test_cache.test_max_entries(database_connection)
+
+    # Calculate time elapsed
+    end_time = time.perf_counter()
+    elapsed_time = end_time - start_time
+    print("Time Elapsed: {}s\n".format(round(elapsed_time, 5)))
+
+def test_slug_index_module(database_connection: mysql.connector.connect):
+    """Run tests against slug_index module"""
+
+    print("Testing wwdtm.slug_index module")
+
+    # Start Time
+    start_time = time.perf_counter()
+
+    # Testing indexed utility functions
+    test_slug_index.test_convert_slug_to_id("faith-salie", database_connection)
+    test_slug_index.test_validate_slug("tina-fey", database_connection)
+    test_slug_index.test_invalid_slug("-tina-fey-", database_connection)
+
+    # Testing index refresh
+    test_slug_index.test_refresh(database_connection)
+
+    # Calculate time elapsed
+    end_time = time.perf_counter()
+    elapsed_time = end_time - start_time
+    print("Time Elapsed: {}s\n".format(round(elapsed_time, 5)))
+
+def test_executor_module(database_connection: mysql.connector.connect):
+    """Run tests against executor module"""
+
+    print("Testing wwdtm.executor module")
+
+    # Start Time
+    start_time = time.perf_counter()
+
+    # Testing retrieve functions using prepared statements
+    test_executor.test_retrieve_show_details_by_id(1083, database_connection)
+    test_executor.test_retrieve_appearances_by_id(2, database_connection)
+    test_executor.test_retrieve_show_details_by_ids([47, 1082, 1083],
+                                                    database_connection)
+
+    # Calculate time elapsed
+    end_time = time.perf_counter()
+    elapsed_time = end_time - start_time
+    print("Time Elapsed: {}s\n".format(round(elapsed_time, 5)))
+
+def test_records_module(database_connection: mysql.connector.connect):
+    """Run tests against records module"""
+
+    print("Testing wwdtm.records module")
+
+    # Start Time
+    start_time = time.perf_counter()
+
+    # Testing bulk retrieve functions returning records
+    test_records.test_retrieve_all_show_details(database_connection)
+    test_records.test_retrieve_all_panelist_details(database_connection)
+    test_records.test_retrieve_all_recordings(database_connection)
+    test_records.test_invalid_return_type(database_connection)
+
+    # Calculate time elapsed
+    end_time = time.perf_counter()
+    elapsed_time = end_time - start_time
+    print("Time Elapsed: {}s\n".format(round(elapsed_time, 5)))
+
+def test_showmap_module(database_connection: mysql.connector.connect):
+    """Run tests against showmap module"""
+
+    print("Testing wwdtm.showmap module")
+
+    # Start Time
+    start_time = time.perf_counter()
+
+    # Testing grouped entity-to-show map retrieval
+    test_showmap.test_retrieve_grouped(database_connection)
+    test_showmap.test_retrieve_host_appearances_all(database_connection)
+    test_showmap.test_retrieve_scorekeeper_appearances_all(database_connection)
+
+    # Calculate time elapsed
+    end_time = time.perf_counter()
+    elapsed_time = end_time - start_time
+    print("Time Elapsed: {}s\n".format(round(elapsed_time, 5)))
+
+def test_streaming_module(database_connection: mysql.connector.connect):
+    """Run tests against streaming module"""
+
+    print("Testing wwdtm.streaming module")
+
+    # Start Time
+    start_time = time.perf_counter()
+
+    # Testing batched retrieval
+    test_streaming.test_iter_batches()
+    test_streaming.test_iter_by_ids(database_connection)
+    test_streaming.test_invalid_batch_size(database_connection)
+
+    # Calculate time elapsed
+    end_time = time.perf_counter()
+    elapsed_time = end_time - start_time
+    print("Time Elapsed: {}s\n".format(round(elapsed_time, 5)))
+
+def test_pool_module(database_config: dict):
+    """Run tests against pool module"""
+
+    print("Testing wwdtm.pool module")
+
+    # Start Time
+    start_time = time.perf_counter()
+
+    # Testing retrieve functions using a connection pool
+    test_pool.test_retrieve_by_id(1083, database_config)
+    test_pool.test_connection(2, database_config)
+    test_pool.test_close(1083, database_config)
+
+    # Calculate time elapsed
+    end_time = time.perf_counter()
+    elapsed_time = end_time - start_time
+    print("Time Elapsed: {}s\n".format(round(elapsed_time, 5)))
+
+def test_export_module(database_config: dict):
+    """Run tests against export module"""
+
+    print("Testing wwdtm.export module")
+
+    # Start Time
+    start_time = time.perf_counter()
+
+    # Testing export functions
+    test_export.test_write_entries()
+
+    database_connection = mysql.connector.connect(**database_config)
+    for entity in ("shows", "panelists", "guests", "hosts", "scorekeepers",
+                   "locations"):
+        test_export.test_export_entity(entity, database_connection)
+
+    test_export.test_export_entity("hosts", database_connection, "json")
+    test_export.test_export_shows_since("2018-10-27", database_connection)
+    test_export.test_invalid_entity(database_connection)
+    test_export.test_since_unsupported_entity("panelists", "2018-10-27",
+                                              database_connection)
+    database_connection.close()
+
+    test_export.test_export_all(database_config)
+    test_export.test_export_all(database_config, workers=3)
+
+    # Calculate time elapsed
+    end_time = time.perf_counter()
+    elapsed_time = end_time - start_time
+    print("Time Elapsed: {}s\n".format(round(elapsed_time, 5)))
+
+def test_fanout_module(database_config: dict):
+    """Run tests against fanout module"""
+
+    print("Testing wwdtm.fanout module")
+
+    # Start Time
+    start_time = time.perf_counter()
+
+    # Testing detail functions with fan-out enabled
+    test_fanout.test_retrieve_show_details_by_id(1083, database_config)
+    test_fanout.test_retrieve_panelist_details_by_id(2, database_config)
+
+    # Calculate time elapsed
+    end_time = time.perf_counter()
+    elapsed_time = end_time - start_time
+    print("Time Elapsed: {}s\n".format(round(elapsed_time, 5)))
 
 def test_guest_module(database_connection: mysql.connector.connect):
     """Run tests against guest module"""
@@ -30,6 +237,7 @@ def test_guest_module(database_connection: mysql.connector.connect):
     test_guest.test_retrieve_all(database_connection)
     test_guest.test_retrieve_all_ids(database_connection)
     test_guest.test_retrieve_all_details(database_connection)
+    test_guest.test_iter_all_details(database_connection)
 
     # Testing retrieve individual guest
     test_guest.test_retrieve_by_id(2, database_connection)
@@ -37,6 +245,7 @@ def test_guest_module(database_connection: mysql.connector.connect):
 
     # Testing retrieve guest appearances
     test_guest.test_retrieve_details_by_id(36, database_connection)
+    test_guest.test_retrieve_details_by_invalid_id(-54, database_connection)
     test_guest.test_retrieve_details_by_slug("tina-fey", database_connection)
 
     # Calculate time elapsed
@@ -64,13 +273,16 @@ def test_host_module(database_connection: mysql.connector.connect):
     test_host.test_retrieve_all(database_connection)
     test_host.test_retrieve_all_ids(database_connection)
     test_host.test_retrieve_all_details(database_connection)
+    test_host.test_iter_all_details(database_connection)
 
     # Testing retrieve individual host
     test_host.test_retrieve_by_id(3, database_connection)
+    test_host.test_retrieve_by_ids([18, 3], database_connection)
     test_host.test_retrieve_by_slug("adam-felber", database_connection)
 
     # Testing retrieve host details
     test_host.test_retrieve_details_by_id(18, database_connection)
+    test_host.test_retrieve_details_by_invalid_id(-1, database_connection)
     test_host.test_retrieve_details_by_slug("faith-salie",
                                             database_connection)
 
@@ -120,6 +332,10 @@ def test_location_module(database_connection: mysql.connector.connect):
                                                sort_by_venue=True)
     test_location.test_retrieve_all_recordings(database_connection,
                                                sort_by_venue=False)
+    test_location.test_iter_all_recordings(database_connection,
+                                           sort_by_venue=True)
+    test_location.test_iter_all_recordings(database_connection,
+                                           sort_by_venue=False)
 
     # Calculate time elapsed
     end_time = time.perf_counter()
@@ -146,6 +362,11 @@ def test_panelist_module(database_connection: mysql.connector.connect):
     test_panelist.test_retrieve_all(database_connection)
     test_panelist.test_retrieve_all_ids(database_connection)
     test_panelist.test_retrieve_all_details(database_connection)
+    test_panelist.test_retrieve_details_info_all(database_connection)
+    test_panelist.test_retrieve_details_info_by_ids([30, 2, 14, -10],
+                                                    database_connection)
+    test_panelist.test_retrieve_statistics_all(database_connection)
+    test_panelist.test_iter_all_details(database_connection)
 
     # Testing retrieve individual panelist
     test_panelist.test_retrieve_by_id(14, database_connection)
@@ -153,6 +374,7 @@ def test_panelist_module(database_connection: mysql.connector.connect):
 
     # Testing retrieve panelist details
     test_panelist.test_retrieve_details_by_id(2, database_connection)
+    test_panelist.test_retrieve_details_by_invalid_id(-10, database_connection)
     test_panelist.test_retrieve_details_by_slug("tom-bodett",
                                                 database_connection)
 
@@ -161,6 +383,7 @@ def test_panelist_module(database_connection: mysql.connector.connect):
                                                           database_connection)
     test_panelist.test_retrieve_scores_grouped_list_by_slug("luke-burbank",
                                                             database_connection)
+    test_panelist.test_retrieve_scores_grouped_list_all(database_connection)
     test_panelist.test_retrieve_scores_grouped_ordered_pair_by_id(14,
                                                                   database_connection)
     test_panelist.test_retrieve_scores_grouped_ordered_pair_by_slug("luke-burbank",
@@ -177,6 +400,12 @@ def test_panelist_module(database_connection: mysql.connector.connect):
     test_panelist.test_retrieve_yearly_appearances_by_id(14, database_connection)
     test_panelist.test_retrieve_yearly_appearances_by_slug("luke-burbank",
                                                            database_connection)
+    test_panelist.test_retrieve_yearly_appearances_matrix(database_connection)
+    test_panelist.test_retrieve_appearance_columns_by_id(14,
+                                                         database_connection)
+    test_panelist.test_retrieve_appearance_columns_by_slug("luke-burbank",
+                                                           database_connection)
+    test_panelist.test_retrieve_appearance_columns_all(database_connection)
 
     # Calculate time elapsed
     end_time = time.perf_counter()
@@ -203,6 +432,7 @@ def test_scorekeeper_module(database_connection: mysql.connector.connect):
     test_scorekeeper.test_retrieve_all(database_connection)
     test_scorekeeper.test_retrieve_all_ids(database_connection)
     test_scorekeeper.test_retrieve_all_details(database_connection)
+    test_scorekeeper.test_iter_all_details(database_connection)
 
     # Testing retrieve individual scorekeeper
     test_scorekeeper.test_retrieve_by_id(11, database_connection)
@@ -210,6 +440,7 @@ def test_scorekeeper_module(database_connection: mysql.connector.connect):
 
     # Testing retrieve scorekeeper details
     test_scorekeeper.test_retrieve_details_by_id(2, database_connection)
+    test_scorekeeper.test_retrieve_details_by_invalid_id(-1, database_connection)
     test_scorekeeper.test_retrieve_details_by_slug("korva-coleman",
                                                    database_connection)
 
@@ -252,6 +483,7 @@ def test_show_module(database_connection: mysql.connector.connect):
     test_show.test_retrieve_all_dates(database_connection)
     test_show.test_retrieve_all_dates_tuple(database_connection)
     test_show.test_retrieve_all_ids(database_connection)
+    test_show.test_retrieve_ids_since("2018-10-27", database_connection)
     test_show.test_retrieve_all_years_months(database_connection)
     test_show.test_retrieve_all_years_months_tuple(database_connection)
 
@@ -265,6 +497,7 @@ def test_show_module(database_connection: mysql.connector.connect):
     # Testing retrieve show details
     test_show.test_retrieve_details_by_id(1083, database_connection)
     test_show.test_retrieve_details_by_invalid_id(-1083, database_connection)
+    test_show.test_retrieve_details_by_ids([1083, 47, -1083], database_connection)
 
     test_show.test_retrieve_details_by_date(2018, 10, 27, database_connection)
     test_show.test_retrieve_details_by_invalid_date(2018,
@@ -280,7 +513,12 @@ def test_show_module(database_connection: mysql.connector.connect):
     # Testing retrieve multiple show details
     test_show.test_retrieve_details_by_year(2006, database_connection)
     test_show.test_retrieve_details_by_year_month(2006, 12, database_connection)
+    test_show.test_retrieve_core_info_by_date_range("2007-03-01",
+                                                    "2007-03-24",
+                                                    database_connection)
+    test_show.test_retrieve_by_year_without_shows(9999, database_connection)
     test_show.test_retrieve_all_details(database_connection)
+    test_show.test_iter_all_details(database_connection)
 
     # Testing retrieve recent show details
     test_show.test_retrieve_recent_details(database_connection)
@@ -335,9 +573,20 @@ def main():
     test_panelist_module(database_connection)
     test_scorekeeper_module(database_connection)
     test_show_module(database_connection)
+    test_cache_module(database_connection)
+    test_slug_index_module(database_connection)
+    test_aio_module(database_connection)
+    test_executor_module(database_connection)
+    test_records_module(database_connection)
+    test_showmap_module(database_connection)
+    test_streaming_module(database_connection)
 
     database_connection.close()
 
+    test_pool_module(config["database"])
+    test_fanout_module(config["database"])
+    test_export_module(config["database"])
+
     # Calculate time elapsed
     end_time = time.perf_counter()
     elapsed_time = end_time - start_time
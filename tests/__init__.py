@@ -3,4 +3,4 @@
 # wwdtm is relased under the terms of the Apache License 2.0
 """Explicitly listing all modules in this package"""
 
-from tests import test_guest, test_host, test_location, test_panelist, test_scorekeeper, test_show
+from tests import test_aio, test_cache, test_executor, test_export, test_fanout, test_guest, test_host, test_location, test_panelist, test_pool, test_records, test_scorekeeper, test_show, test_showmap, test_slug_index, test_streaming
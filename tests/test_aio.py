@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""Testing module for wwdtm.aio"""
+
+import asyncio
+import json
+import mysql.connector
+from wwdtm import aio
+from wwdtm.panelist import details as panelist_details
+from wwdtm.show import details as show_details
+
+def test_retrieve_show_details_by_id(show_id: int,
+                                     database_connection: mysql.connector.connect,
+                                     print_response: bool = False):
+    """Testing response from aio.show.details.retrieve_by_id matches
+    the response from show.details.retrieve_by_id"""
+    show_dict = asyncio.run(aio.show.details.retrieve_by_id(show_id,
+                                                            database_connection))
+    assert show_dict is not None
+    assert show_dict == show_details.retrieve_by_id(show_id,
+                                                    database_connection)
+    if print_response:
+        print(json.dumps(show_dict, indent=2))
+
+def test_retrieve_panelist_details_by_id(panelist_id: int,
+                                         database_connection: mysql.connector.connect,
+                                         print_response: bool = False):
+    """Testing response from aio.panelist.details.retrieve_by_id
+    matches the response from panelist.details.retrieve_by_id"""
+    panelist_dict = asyncio.run(
+        aio.panelist.details.retrieve_by_id(panelist_id, database_connection))
+    assert panelist_dict is not None
+    assert panelist_dict == panelist_details.retrieve_by_id(panelist_id,
+                                                            database_connection)
+    if print_response:
+        print(json.dumps(panelist_dict, indent=2))
+
+def test_gather(show_ids: list,
+                database_connection: mysql.connector.connect,
+                print_response: bool = False):
+    """Testing multiple aio.show.info.retrieve_by_id calls awaited
+    together using the same database connection"""
+    async def retrieve_shows():
+        return await asyncio.gather(
+            *[aio.show.info.retrieve_by_id(show_id, database_connection)
+              for show_id in show_ids])
+
+    shows = asyncio.run(retrieve_shows())
+    assert len(shows) == len(show_ids)
+    assert all(shows)
+    if print_response:
+        print(json.dumps(shows, indent=2))
+
+def test_iter_all_details(database_connection: mysql.connector.connect,
+                          batch_size: int = 25,
+                          print_response: bool = False):
+    """Testing entries yielded by aio.show.details.iter_all match the
+    response from show.details.retrieve_all"""
+    async def collect_shows():
+        return [show async for show
+                in aio.show.details.iter_all(database_connection,
+                                             batch_size=batch_size)]
+
+    shows = asyncio.run(collect_shows())
+    assert shows == show_details.retrieve_all(database_connection)
+    if print_response:
+        print(json.dumps(shows[:batch_size], indent=2))
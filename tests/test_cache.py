@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""Testing module for wwdtm.cache"""
+
+import json
+import mysql.connector
+from wwdtm import cache
+from wwdtm.host import details as host_details, info as host_info
+from wwdtm.panelist import details as panelist_details
+
+def test_cached_retrieve_by_id(host_id: int,
+                               database_connection: mysql.connector.connect,
+                               print_response: bool = False):
+    """Testing cached responses from host.info.retrieve_by_id"""
+    cache.enable()
+    first_response = host_info.retrieve_by_id(host_id, database_connection)
+    second_response = host_info.retrieve_by_id(host_id, database_connection)
+    statistics = cache.statistics()
+    cache.disable()
+
+    assert first_response == second_response
+    assert statistics["hits"] == 1
+    assert statistics["misses"] == 1
+    if print_response:
+        print(json.dumps(statistics, indent=2))
+
+def test_cached_details_by_slug(panelist_slug: str,
+                                database_connection: mysql.connector.connect,
+                                print_response: bool = False):
+    """Testing cached responses from panelist.details.retrieve_by_slug
+    are not affected by changes made to previously returned values"""
+    cache.enable()
+    first_response = panelist_details.retrieve_by_slug(panelist_slug,
+                                                       database_connection)
+    first_response["appearances"] = None
+    second_response = panelist_details.retrieve_by_slug(panelist_slug,
+                                                        database_connection)
+    statistics = cache.statistics()
+    cache.disable()
+
+    assert second_response["appearances"] is not None
+    assert statistics["hits"] == 1
+    if print_response:
+        print(json.dumps(statistics, indent=2))
+
+def test_invalidate(host_id: int,
+                    database_connection: mysql.connector.connect,
+                    print_response: bool = False):
+    """Testing cache.invalidate"""
+    cache.enable()
+    host_info.retrieve_by_id(host_id, database_connection)
+    removed = cache.invalidate("host", host_id)
+    statistics = cache.statistics()
+    cache.disable()
+
+    assert removed == 1
+    assert statistics["entries"] == 0
+    if print_response:
+        print(json.dumps(statistics, indent=2))
+
+def test_max_entries(database_connection: mysql.connector.connect,
+                     print_response: bool = False):
+    """Testing LRU eviction once the cache is full"""
+    cache.enable(max_entries=2)
+    for host_id in host_info.retrieve_all_ids(database_connection)[:3]:
+        host_info.retrieve_by_id(host_id, database_connection)
+    statistics = cache.statistics()
+    cache.disable()
+
+    assert statistics["entries"] <= 2
+    if print_response:
+        print(json.dumps(statistics, indent=2))
+
+def test_invalidate_by_id(host_id: int,
+                          database_connection: mysql.connector.connect,
+                          print_response: bool = False):
+    """Testing cache.invalidate removes entries cached by slug and by
+    ID passed as a string for the same host"""
+    cache.enable()
+    host = host_info.retrieve_by_id(host_id, database_connection)
+    host_info.retrieve_by_id(str(host_id), database_connection)
+    host_info.retrieve_by_slug(host["slug"], database_connection)
+    host_details.retrieve_by_slug(host["slug"], database_connection)
+    cached_statistics = cache.statistics()
+    removed = cache.invalidate("host", host_id)
+    statistics = cache.statistics()
+    cache.disable()
+
+    assert cached_statistics["entries"] > 1
+    assert removed == cached_statistics["entries"]
+    assert statistics["entries"] == 0
+    if print_response:
+        print(json.dumps(statistics, indent=2))
+
+def test_invalidate_by_slug(host_id: int,
+                            database_connection: mysql.connector.connect,
+                            print_response: bool = False):
+    """Testing cache.invalidate with a slug removes entries cached by
+    ID for the same host"""
+    cache.enable()
+    host = host_info.retrieve_by_id(host_id, database_connection)
+    host_details.retrieve_by_id(host_id, database_connection)
+    host_info.retrieve_by_slug(host["slug"], database_connection)
+    cached_statistics = cache.statistics()
+    removed = cache.invalidate("host", host["slug"])
+    statistics = cache.statistics()
+    cache.disable()
+
+    assert removed == cached_statistics["entries"]
+    assert statistics["entries"] == 0
+    if print_response:
+        print(json.dumps(statistics, indent=2))
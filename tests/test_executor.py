@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""Testing module for wwdtm.executor"""
+
+import json
+from typing import List
+import mysql.connector
+from wwdtm import executor
+from wwdtm.panelist import core as panelist_core
+from wwdtm.show import details as show_details
+
+def test_retrieve_show_details_by_id(show_id: int,
+                                     database_connection: mysql.connector.connect,
+                                     print_response: bool = False):
+    """Testing response from show.details.retrieve_by_id with prepared
+    statements enabled matches the response with prepared statements
+    disabled"""
+    executor.disable_prepared_statements()
+    expected_dict = show_details.retrieve_by_id(show_id, database_connection)
+
+    executor.enable_prepared_statements()
+    show_dict = show_details.retrieve_by_id(show_id, database_connection)
+    repeat_dict = show_details.retrieve_by_id(show_id, database_connection)
+    executor.disable_prepared_statements()
+
+    assert show_dict is not None
+    assert show_dict == expected_dict
+    assert repeat_dict == expected_dict
+    if print_response:
+        print(json.dumps(show_dict, indent=2))
+
+def test_retrieve_appearances_by_id(panelist_id: int,
+                                    database_connection: mysql.connector.connect,
+                                    print_response: bool = False):
+    """Testing response from panelist.core.retrieve_appearances_by_id
+    with prepared statements enabled matches the response with prepared
+    statements disabled, including for an invalid panelist ID"""
+    executor.disable_prepared_statements()
+    expected_dict = panelist_core.retrieve_appearances_by_id(panelist_id,
+                                                             database_connection)
+
+    executor.enable_prepared_statements(max_statements=2)
+    appearance_dict = panelist_core.retrieve_appearances_by_id(panelist_id,
+                                                               database_connection)
+    invalid_dict = panelist_core.retrieve_appearances_by_id(-panelist_id,
+                                                            database_connection)
+    executor.disable_prepared_statements()
+
+    assert appearance_dict is not None
+    assert appearance_dict == expected_dict
+    assert invalid_dict is None
+    if print_response:
+        print(json.dumps(appearance_dict, indent=2))
+
+def test_retrieve_show_details_by_ids(show_ids: List[int],
+                                      database_connection: mysql.connector.connect,
+                                      print_response: bool = False):
+    """Testing response from show.details.retrieve_by_ids, which builds
+    its queries at runtime, with prepared statements enabled matches the
+    response with prepared statements disabled"""
+    expected_list = show_details.retrieve_by_ids(show_ids, database_connection)
+
+    executor.enable_prepared_statements()
+    show_list = show_details.retrieve_by_ids(show_ids, database_connection)
+    repeat_list = show_details.retrieve_by_ids(show_ids[:-1],
+                                               database_connection)
+    executor.disable_prepared_statements()
+
+    assert show_list == expected_list
+    assert repeat_list == expected_list[:-1]
+    if print_response:
+        print(json.dumps(show_list, indent=2))
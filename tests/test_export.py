@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""Testing module for wwdtm.export"""
+
+import json
+import os
+import tempfile
+from typing import Dict, List
+import mysql.connector
+from wwdtm import export
+from wwdtm.show import details, info
+
+def _read_entries(output_path: str, output_format: str) -> List[Dict]:
+    """Returns the entries written to an export file"""
+    with open(output_path, "r", encoding="utf-8") as output_file:
+        if output_format == "json":
+            return json.load(output_file)
+
+        return [json.loads(line) for line in output_file]
+
+def test_write_entries(print_response: bool = False):
+    """Testing export.write_entries writes NDJSON and JSON files that
+    contain the entries in order"""
+    entries = [{"id": 1, "name": "One"}, {"id": 2, "name": "Two"}]
+    with tempfile.TemporaryDirectory() as output_dir:
+        for output_format in export.OUTPUT_FORMATS:
+            output_path = os.path.join(output_dir,
+                                       "entries.{}".format(output_format))
+            count = export.write_entries(iter(entries), output_path,
+                                         output_format)
+            assert count == len(entries)
+            assert _read_entries(output_path, output_format) == entries
+
+            count = export.write_entries(iter([]), output_path, output_format)
+            assert count == 0
+            assert _read_entries(output_path, output_format) == []
+
+        assert not [file_name for file_name in os.listdir(output_dir)
+                    if file_name.endswith(".tmp")]
+
+    if print_response:
+        print(json.dumps(entries, indent=2))
+
+def test_export_entity(entity: str,
+                       database_connection: mysql.connector.connect,
+                       output_format: str = "ndjson",
+                       print_response: bool = False):
+    """Testing export.export_entity writes the same entries as the
+    iter_all functions"""
+    with tempfile.TemporaryDirectory() as output_dir:
+        stage = export.export_entity(entity, database_connection,
+                                     output_dir=output_dir,
+                                     output_format=output_format)
+        entries = _read_entries(stage["path"], output_format)
+
+    expected = json.loads(json.dumps(list(
+        export.ENTITIES[entity](database_connection, 100))))
+    assert stage["entity"] == entity
+    assert stage["count"] == len(expected)
+    assert entries == expected
+    if print_response:
+        print(json.dumps(stage, indent=2))
+
+def test_export_shows_since(show_date: str,
+                            database_connection: mysql.connector.connect,
+                            print_response: bool = False):
+    """Testing export.export_entity only writes shows on or after the
+    requested date to a separate file"""
+    with tempfile.TemporaryDirectory() as output_dir:
+        stage = export.export_entity("shows", database_connection,
+                                     output_dir=output_dir,
+                                     since=show_date)
+        entries = _read_entries(stage["path"], "ndjson")
+        assert os.path.basename(stage["path"]) == \
+            "shows-since-{}.ndjson".format(show_date)
+
+    show_ids = info.retrieve_ids_since(show_date, database_connection)
+    expected = json.loads(json.dumps(details.retrieve_by_ids(
+        show_ids, database_connection)))
+    assert entries == expected
+    if print_response:
+        print(json.dumps(stage, indent=2))
+
+def test_export_all(database_config: Dict,
+                    workers: int = 1,
+                    print_response: bool = False):
+    """Testing export.export_all writes one file per entity type and
+    returns the results in the order requested"""
+    with tempfile.TemporaryDirectory() as output_dir:
+        stages = export.export_all(database_config, output_dir=output_dir,
+                                   workers=workers)
+        assert [stage["entity"] for stage in stages] == \
+            list(export.ENTITIES.keys())
+        for stage in stages:
+            assert os.path.exists(stage["path"])
+            assert stage["count"] > 0
+
+    if print_response:
+        print(json.dumps(stages, indent=2))
+
+def test_invalid_entity(database_connection: mysql.connector.connect):
+    """Testing export.export_entity rejects an unknown entity type"""
+    try:
+        export.export_entity("episodes", database_connection)
+    except ValueError:
+        return
+
+    assert False, "Invalid entity was accepted"
+
+def test_since_unsupported_entity(entity: str,
+                                  show_date: str,
+                                  database_connection: mysql.connector.connect):
+    """Testing export.export_entity and the command line arguments
+    reject a since date for entity types other than shows"""
+    try:
+        export.export_entity(entity, database_connection, since=show_date)
+        since_accepted = True
+    except ValueError:
+        since_accepted = False
+
+    try:
+        export.parse_arguments(["--entities", entity, "--since", show_date])
+        arguments_accepted = True
+    except SystemExit:
+        arguments_accepted = False
+
+    assert not since_accepted, "Since date was accepted for " + entity
+    assert not arguments_accepted, "--since was accepted for " + entity
+    options = export.parse_arguments(["--since", show_date])
+    assert options.since == show_date
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""Testing module for wwdtm.fanout"""
+
+from typing import Dict
+import json
+from wwdtm import fanout
+from wwdtm.pool import ConnectionPool
+from wwdtm.panelist import details as panelist_details
+from wwdtm.show import details as show_details
+
+def test_retrieve_show_details_by_id(show_id: int,
+                                     database_config: Dict,
+                                     print_response: bool = False):
+    """Testing response from show.details.retrieve_by_id with fan-out
+    enabled matches the response with fan-out disabled"""
+    pool = ConnectionPool.from_config(database_config, pool_size=4)
+    expected_dict = show_details.retrieve_by_id(show_id, pool)
+
+    fanout.enable()
+    active = fanout.is_active(pool)
+    show_dict = show_details.retrieve_by_id(show_id, pool)
+    fanout.disable()
+
+    assert active
+    assert show_dict is not None
+    assert show_dict == expected_dict
+    if print_response:
+        print(json.dumps(show_dict, indent=2))
+
+def test_retrieve_panelist_details_by_id(panelist_id: int,
+                                         database_config: Dict,
+                                         print_response: bool = False):
+    """Testing response from panelist.details.retrieve_by_id with
+    fan-out enabled matches the response with fan-out disabled"""
+    pool = ConnectionPool.from_config(database_config, pool_size=4)
+    expected_dict = panelist_details.retrieve_by_id(panelist_id, pool)
+
+    fanout.enable()
+    panelist_dict = panelist_details.retrieve_by_id(panelist_id, pool)
+    invalid_dict = panelist_details.retrieve_by_id(-panelist_id, pool)
+    fanout.disable()
+
+    assert panelist_dict is not None
+    assert panelist_dict == expected_dict
+    assert invalid_dict is None
+    if print_response:
+        print(json.dumps(panelist_dict, indent=2))
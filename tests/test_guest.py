@@ -90,6 +90,16 @@ def test_retrieve_details_by_id(guest_id: int,
     if print_response:
         print(json.dumps(guest_dict, indent=2))
 
+def test_retrieve_details_by_invalid_id(guest_id: int,
+                                        database_connection: mysql.connector.connect,
+                                        print_response: bool = False):
+    """Testing response from details.retrieve_by_id with an
+    invalid ID"""
+    guest_dict = details.retrieve_by_id(guest_id, database_connection)
+    assert guest_dict is None
+    if print_response:
+        print(json.dumps(guest_dict, indent=2))
+
 def test_retrieve_details_by_slug(guest_slug: str,
                                   database_connection: mysql.connector.connect,
                                   print_response: bool = False):
@@ -106,5 +116,20 @@ def test_retrieve_all_details(database_connection: mysql.connector.connect,
     """Testing response from details.retrieve_all"""
     guests_dict = details.retrieve_all(database_connection)
     assert guests_dict is not None
+    assert ([guest["id"] for guest in guests_dict]
+            == info.retrieve_all_ids(database_connection))
+    for guest in guests_dict:
+        assert guest == details.retrieve_by_id(guest["id"],
+                                               database_connection)
     if print_response:
         print(json.dumps(guests_dict, indent=2))
+
+def test_iter_all_details(database_connection: mysql.connector.connect,
+                          batch_size: int = 25,
+                          print_response: bool = False):
+    """Testing response from details.iter_all matches the response
+    from details.retrieve_all"""
+    guests = list(details.iter_all(database_connection, batch_size))
+    assert guests == details.retrieve_all(database_connection)
+    if print_response:
+        print(json.dumps(guests, indent=2))
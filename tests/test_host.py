@@ -4,6 +4,7 @@
 """Testing module for wwdtm.host"""
 
 import json
+from typing import List
 import mysql.connector
 from wwdtm.host import info, details, utility
 
@@ -69,6 +70,16 @@ def test_retrieve_by_id(host_id: int,
     if print_response:
         print(json.dumps(host_dict, indent=2))
 
+def test_retrieve_by_ids(host_ids: List[int],
+                         database_connection: mysql.connector.connect,
+                         print_response: bool = False):
+    """Testing response from info.retrieve_by_ids"""
+    hosts_list = info.retrieve_by_ids(host_ids, database_connection)
+    assert hosts_list is not None
+    assert [host["id"] for host in hosts_list] == host_ids
+    if print_response:
+        print(json.dumps(hosts_list, indent=2))
+
 def test_retrieve_by_slug(host_slug: str,
                           database_connection: mysql.connector.connect,
                           print_response: bool = False):
@@ -89,6 +100,16 @@ def test_retrieve_details_by_id(host_id: int,
     if print_response:
         print(json.dumps(host_dict, indent=2))
 
+def test_retrieve_details_by_invalid_id(host_id: int,
+                                        database_connection: mysql.connector.connect,
+                                        print_response: bool = False):
+    """Testing response from details.retrieve_by_id with an
+    invalid ID"""
+    host_dict = details.retrieve_by_id(host_id, database_connection)
+    assert host_dict is None
+    if print_response:
+        print(json.dumps(host_dict, indent=2))
+
 def test_retrieve_details_by_slug(host_slug: str,
                                   database_connection: mysql.connector.connect,
                                   print_response: bool = False):
@@ -104,5 +125,20 @@ def test_retrieve_all_details(database_connection: mysql.connector.connect,
     """Testing response from details.retrieve_all"""
     hosts_dict = details.retrieve_all(database_connection)
     assert hosts_dict is not None
+    assert ([host["id"] for host in hosts_dict]
+            == info.retrieve_all_ids(database_connection))
+    for host in hosts_dict:
+        assert host == details.retrieve_by_id(host["id"],
+                                              database_connection)
     if print_response:
         print(json.dumps(hosts_dict, indent=2))
+
+def test_iter_all_details(database_connection: mysql.connector.connect,
+                          batch_size: int = 25,
+                          print_response: bool = False):
+    """Testing response from details.iter_all matches the response
+    from details.retrieve_all"""
+    hosts = list(details.iter_all(database_connection, batch_size))
+    assert hosts == details.retrieve_all(database_connection)
+    if print_response:
+        print(json.dumps(hosts, indent=2))
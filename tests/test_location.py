@@ -120,5 +120,24 @@ def test_retrieve_all_recordings(database_connection: mysql.connector.connect,
     locations_dict = details.retrieve_all_recordings(database_connection,
                                                      sort_by_venue)
     assert locations_dict is not None
+    location_ids = info.retrieve_all_ids(database_connection, sort_by_venue)
+    assert [location["id"] for location in locations_dict] == location_ids
+    for location in locations_dict:
+        assert location == details.retrieve_recordings_by_id(location["id"],
+                                                             database_connection)
     if print_response:
         print(json.dumps(locations_dict, indent=2))
+
+def test_iter_all_recordings(database_connection: mysql.connector.connect,
+                             sort_by_venue: bool = False,
+                             batch_size: int = 25,
+                             print_response: bool = False):
+    """Testing response from details.iter_all_recordings matches the
+    response from details.retrieve_all_recordings"""
+    locations = list(details.iter_all_recordings(database_connection,
+                                                 sort_by_venue,
+                                                 batch_size))
+    assert locations == details.retrieve_all_recordings(database_connection,
+                                                        sort_by_venue)
+    if print_response:
+        print(json.dumps(locations, indent=2))
@@ -4,8 +4,10 @@
 """Testing module for wwdtm.panelist"""
 
 import json
+from typing import List
 import mysql.connector
-from wwdtm.panelist import details, info, utility
+import numpy
+from wwdtm.panelist import core, details, info, utility
 
 def test_id_exists(panelist_id: int,
                    database_connection: mysql.connector.connect,
@@ -93,6 +95,16 @@ def test_retrieve_details_by_id(panelist_id: int,
     if print_response:
         print(json.dumps(panelist_dict, indent=2))
 
+def test_retrieve_details_by_invalid_id(panelist_id: int,
+                                        database_connection: mysql.connector.connect,
+                                        print_response: bool = False):
+    """Testing response from details.retrieve_by_id with an
+    invalid ID"""
+    panelist_dict = details.retrieve_by_id(panelist_id, database_connection)
+    assert panelist_dict is None
+    if print_response:
+        print(json.dumps(panelist_dict, indent=2))
+
 def test_retrieve_details_by_slug(panelist_slug: str,
                                   database_connection: mysql.connector.connect,
                                   print_response: bool = False):
@@ -108,12 +120,81 @@ def test_retrieve_details_by_slug(panelist_slug: str,
 
 def test_retrieve_all_details(database_connection: mysql.connector.connect,
                               print_response: bool = False):
-    """Testing response from details.retrieve_all"""
+    """Testing response from details.retrieve_all matches the response
+    from details.retrieve_by_id for each panelist"""
     panelists_dict = details.retrieve_all(database_connection)
     assert panelists_dict is not None
+    expected = [details.retrieve_by_id(panelist_id, database_connection)
+                for panelist_id in info.retrieve_all_ids(database_connection)]
+    assert json.dumps(panelists_dict) == json.dumps(expected)
     if print_response:
         print(json.dumps(panelists_dict, indent=2))
 
+def test_retrieve_details_info_all(database_connection: mysql.connector.connect,
+                                   print_response: bool = False):
+    """Testing response from core.retrieve_details_info_all matches the
+    responses from core.retrieve_statistics_by_id,
+    core.retrieve_bluffs_by_id and core.retrieve_appearances_by_id"""
+    details_info = core.retrieve_details_info_all(database_connection)
+    assert details_info
+    for panelist_id, panelist_info in details_info.items():
+        assert panelist_info["statistics"] == core.retrieve_statistics_by_id(
+            panelist_id, database_connection, pre_validated_id=True)
+        assert panelist_info["bluffs"] == core.retrieve_bluffs_by_id(
+            panelist_id, database_connection, pre_validated_id=True)
+        assert panelist_info["appearances"] == core.retrieve_appearances_by_id(
+            panelist_id, database_connection, pre_validated_id=True)
+    if print_response:
+        print(json.dumps(details_info, indent=2))
+
+def test_retrieve_details_info_by_ids(panelist_ids: List[int],
+                                      database_connection: mysql.connector.connect,
+                                      print_response: bool = False):
+    """Testing response from core.retrieve_details_info_by_ids matches
+    the response from core.retrieve_details_info_all for the requested
+    panelist IDs, skipping unknown IDs"""
+    details_info = core.retrieve_details_info_by_ids(panelist_ids,
+                                                     database_connection)
+    all_details_info = core.retrieve_details_info_all(database_connection)
+    expected_ids = [panelist_id for panelist_id in sorted(set(panelist_ids))
+                    if panelist_id in all_details_info]
+    assert list(details_info.keys()) == expected_ids
+    for panelist_id, panelist_info in details_info.items():
+        assert panelist_info == all_details_info[panelist_id]
+    if print_response:
+        print(json.dumps(details_info, indent=2))
+
+def test_retrieve_statistics_all(database_connection: mysql.connector.connect,
+                                 print_response: bool = False):
+    """Testing response from core.retrieve_statistics_all matches the
+    response from core.retrieve_statistics_by_id for each panelist,
+    including the rounded mean, median and standard deviation"""
+    statistics = core.retrieve_statistics_all(database_connection)
+    assert statistics
+    for panelist_id in info.retrieve_all_ids(database_connection):
+        expected = core.retrieve_statistics_by_id(panelist_id,
+                                                  database_connection,
+                                                  pre_validated_id=True)
+        if not expected:
+            assert panelist_id not in statistics
+            continue
+
+        panelist_statistics = statistics[panelist_id]
+        assert panelist_statistics["scoring"] == expected["scoring"]
+        assert panelist_statistics == expected
+    if print_response:
+        print(json.dumps(statistics, indent=2))
+
+def test_iter_all_details(database_connection: mysql.connector.connect,
+                          batch_size: int = 25,
+                          print_response: bool = False):
+    """Testing response from details.iter_all matches the response
+    from details.retrieve_all"""
+    panelists = list(details.iter_all(database_connection, batch_size))
+    assert panelists == details.retrieve_all(database_connection)
+    if print_response:
+        print(json.dumps(panelists, indent=2))
+
 def test_retrieve_scores_grouped_list_by_id(panelist_id: int,
                                             database_connection: mysql.connector.connect,
                                             print_response: bool = False):
@@ -127,6 +208,16 @@ def test_retrieve_scores_grouped_list_by_id(panelist_id: int,
     if print_response:
         print(json.dumps(score_list, indent=2))
 
+def test_retrieve_scores_grouped_list_all(database_connection: mysql.connector.connect,
+                                          print_response: bool = False):
+    """Testing response from info.retrieve_scores_grouped_list_all"""
+    scores_dict = info.retrieve_scores_grouped_list_all(database_connection)
+    assert scores_dict
+    for score_list in scores_dict.values():
+        assert len(score_list["score"]) == len(score_list["count"])
+    if print_response:
+        print(json.dumps(scores_dict, indent=2))
+
 def test_retrieve_scores_grouped_list_by_slug(panelist_slug: str,
                                               database_connection: mysql.connector.connect,
                                               print_response: bool = False):
@@ -227,3 +318,55 @@ def test_retrieve_yearly_appearances_by_slug(panelist_slug: str,
     assert appearances is not None
     if print_response:
         print(json.dumps(appearances, indent=2))
+
+def test_retrieve_yearly_appearances_matrix(database_connection: mysql.connector.connect,
+                                            print_response: bool = False):
+    """Testing response from info.retrieve_yearly_appearances_matrix"""
+    matrix = info.retrieve_yearly_appearances_matrix(database_connection)
+    assert matrix is not None
+    assert matrix["appearances"].shape == (len(matrix["panelist_ids"]),
+                                           len(matrix["years"]))
+    assert len(matrix["panelist_ids"]) == len(matrix["panelist_slugs"])
+    panelist_slugs = {panelist["id"]: panelist["slug"] for panelist
+                      in info.retrieve_all(database_connection)}
+    assert matrix["panelist_slugs"] == [panelist_slugs[panelist_id]
+                                        for panelist_id
+                                        in matrix["panelist_ids"]]
+    if print_response:
+        print(matrix["appearances"])
+
+def test_retrieve_appearance_columns_by_id(panelist_id: int,
+                                           database_connection: mysql.connector.connect,
+                                           print_response: bool = False):
+    """Testing response from info.retrieve_appearance_columns_by_id"""
+    columns = info.retrieve_appearance_columns_by_id(panelist_id,
+                                                     database_connection)
+    assert columns is not None
+    assert columns["dates"].dtype == numpy.dtype("datetime64[D]")
+    assert all(len(column) == len(columns["show_ids"])
+               for column in columns.values())
+    assert (columns["panelist_ids"] == panelist_id).all()
+    if print_response:
+        print(columns)
+
+def test_retrieve_appearance_columns_by_slug(panelist_slug: str,
+                                             database_connection: mysql.connector.connect,
+                                             print_response: bool = False):
+    """Testing response from info.retrieve_appearance_columns_by_slug"""
+    columns = info.retrieve_appearance_columns_by_slug(panelist_slug,
+                                                       database_connection)
+    assert columns is not None
+    assert all(len(column) == len(columns["show_ids"])
+               for column in columns.values())
+    if print_response:
+        print(columns)
+
+def test_retrieve_appearance_columns_all(database_connection: mysql.connector.connect,
+                                         print_response: bool = False):
+    """Testing response from info.retrieve_appearance_columns_all"""
+    columns = info.retrieve_appearance_columns_all(database_connection)
+    assert columns is not None
+    assert all(len(column) == len(columns["show_ids"])
+               for column in columns.values())
+    if print_response:
+        print(columns)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""Testing module for wwdtm.pool"""
+
+from typing import Dict
+import json
+from mysql.connector.errors import PoolError
+from wwdtm.pool import ConnectionPool
+from wwdtm.panelist import details as panelist_details
+from wwdtm.show import info as show_info
+
+def test_retrieve_by_id(show_id: int,
+                        database_config: Dict,
+                        print_response: bool = False):
+    """Testing response from show.info.retrieve_by_id using a
+    connection pool"""
+    pool = ConnectionPool.from_config(database_config, pool_size=2)
+    show_dict = show_info.retrieve_by_id(show_id, pool)
+    statistics = pool.statistics()
+
+    assert show_dict is not None
+    assert statistics["checkouts"] == 1
+    assert statistics["checked_out"] == 0
+    if print_response:
+        print(json.dumps(statistics, indent=2))
+
+def test_connection(panelist_id: int,
+                    database_config: Dict,
+                    print_response: bool = False):
+    """Testing that ConnectionPool.connection keeps a single connection
+    checked out across multiple function calls"""
+    pool = ConnectionPool.from_config(database_config, pool_size=2)
+    with pool.connection():
+        panelist_dict = panelist_details.retrieve_by_id(panelist_id, pool)
+        checked_out = pool.statistics()["checked_out"]
+
+    statistics = pool.statistics()
+
+    assert panelist_dict is not None
+    assert checked_out == 1
+    assert statistics["checkouts"] == 1
+    assert statistics["checked_out"] == 0
+    if print_response:
+        print(json.dumps(statistics, indent=2))
+
+def test_close(show_id: int,
+               database_config: Dict,
+               print_response: bool = False):
+    """Testing that ConnectionPool.close closes the idle connections
+    and that no more connections can be checked out"""
+    pool = ConnectionPool.from_config(database_config, pool_size=2)
+    show_dict = show_info.retrieve_by_id(show_id, pool)
+    closed = pool.close()
+    statistics = pool.statistics()
+
+    try:
+        show_info.retrieve_by_id(show_id, pool)
+        closed_pool_used = True
+    except PoolError:
+        closed_pool_used = False
+
+    assert show_dict is not None
+    assert closed == pool.pool_size
+    assert statistics["checked_out"] == 0
+    assert not closed_pool_used
+    if print_response:
+        print(json.dumps(statistics, indent=2))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""Testing module for wwdtm.records"""
+
+import json
+import mysql.connector
+from wwdtm import records
+from wwdtm.location import details as location_details
+from wwdtm.panelist import details as panelist_details
+from wwdtm.show import details as show_details
+
+def test_retrieve_all_show_details(database_connection: mysql.connector.connect,
+                                   print_response: bool = False):
+    """Testing response from show.details.retrieve_all with records
+    matches the response with OrderedDicts"""
+    expected_list = show_details.retrieve_all(database_connection)
+    shows = show_details.retrieve_all(database_connection,
+                                      return_type="record")
+    assert shows is not None
+    assert all(isinstance(show, records.Show) for show in shows)
+    assert [show.to_dict() for show in shows] == expected_list
+    if print_response:
+        print(json.dumps(shows[-1].to_dict(), indent=2))
+
+def test_retrieve_all_panelist_details(database_connection: mysql.connector.connect,
+                                       print_response: bool = False):
+    """Testing response from panelist.details.retrieve_all with records
+    matches the response with OrderedDicts"""
+    expected_list = panelist_details.retrieve_all(database_connection)
+    panelists = panelist_details.retrieve_all(database_connection,
+                                              return_type="record")
+    assert panelists is not None
+    assert all(isinstance(panelist, records.Panelist)
+               for panelist in panelists)
+    assert [panelist.to_dict() for panelist in panelists] == expected_list
+    if print_response:
+        print(json.dumps(panelists[0].to_dict(), indent=2))
+
+def test_retrieve_all_recordings(database_connection: mysql.connector.connect,
+                                 print_response: bool = False):
+    """Testing response from location.details.retrieve_all_recordings
+    with records matches the response with OrderedDicts"""
+    expected_list = location_details.retrieve_all_recordings(database_connection)
+    locations = location_details.retrieve_all_recordings(database_connection,
+                                                         return_type="record")
+    assert locations is not None
+    assert [location.to_dict() for location in locations] == expected_list
+    if print_response:
+        print(json.dumps(locations[0].to_dict(), indent=2))
+
+def test_invalid_return_type(database_connection: mysql.connector.connect):
+    """Testing bulk retrieval functions reject an invalid return type"""
+    try:
+        show_details.retrieve_all(database_connection, return_type="tuple")
+    except ValueError:
+        return
+
+    assert False, "Invalid return type was accepted"
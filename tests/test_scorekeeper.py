@@ -91,6 +91,16 @@ def test_retrieve_details_by_id(scorekeeper_id: int,
     if print_response:
         print(json.dumps(scorekeeper_dict, indent=2))
 
+def test_retrieve_details_by_invalid_id(scorekeeper_id: int,
+                                        database_connection: mysql.connector.connect,
+                                        print_response: bool = False):
+    """Testing response from details.retrieve_by_id with an
+    invalid ID"""
+    scorekeeper_dict = details.retrieve_by_id(scorekeeper_id, database_connection)
+    assert scorekeeper_dict is None
+    if print_response:
+        print(json.dumps(scorekeeper_dict, indent=2))
+
 def test_retrieve_details_by_slug(scorekeeper_slug: str,
                                   database_connection: mysql.connector.connect,
                                   print_response: bool = False):
@@ -107,5 +117,20 @@ def test_retrieve_all_details(database_connection: mysql.connector.connect,
     """Testing response from details.retrieve_all"""
     scorekeepers_dict = details.retrieve_all(database_connection)
     assert scorekeepers_dict is not None
+    assert ([scorekeeper["id"] for scorekeeper in scorekeepers_dict]
+            == info.retrieve_all_ids(database_connection))
+    for scorekeeper in scorekeepers_dict:
+        assert scorekeeper == details.retrieve_by_id(scorekeeper["id"],
+                                                     database_connection)
     if print_response:
         print(json.dumps(scorekeepers_dict, indent=2))
+
+def test_iter_all_details(database_connection: mysql.connector.connect,
+                          batch_size: int = 25,
+                          print_response: bool = False):
+    """Testing response from details.iter_all matches the response
+    from details.retrieve_all"""
+    scorekeepers = list(details.iter_all(database_connection, batch_size))
+    assert scorekeepers == details.retrieve_all(database_connection)
+    if print_response:
+        print(json.dumps(scorekeepers, indent=2))
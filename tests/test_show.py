@@ -5,7 +5,7 @@
 
 import json
 import mysql.connector
-from wwdtm.show import details, info, utility
+from wwdtm.show import core, details, info, utility
 
 def test_id_exists(show_id: int,
                    database_connection: mysql.connector.connect,
@@ -183,6 +183,17 @@ def test_retrieve_all_ids(database_connection: mysql.connector.connect,
     if print_response:
         print(json.dumps(show_ids, indent=2))
 
+def test_retrieve_ids_since(show_date: str,
+                            database_connection: mysql.connector.connect,
+                            print_response: bool = False):
+    """Testing response from info.retrieve_ids_since"""
+    show_ids = info.retrieve_ids_since(show_date, database_connection)
+    assert show_ids is not None
+    all_show_ids = info.retrieve_all_ids(database_connection)
+    assert show_ids == all_show_ids[len(all_show_ids) - len(show_ids):]
+    if print_response:
+        print(json.dumps(show_ids, indent=2))
+
 def test_retrieve_all_dates(database_connection: mysql.connector.connect,
                             print_response: bool = False):
     """Testing response from info.retrieve_all_dates"""
@@ -258,6 +269,18 @@ def test_retrieve_details_by_invalid_id(show_id: int,
     if print_response:
         print(json.dumps(show_details, indent=2))
 
+def test_retrieve_details_by_ids(show_ids: list,
+                                 database_connection: mysql.connector.connect,
+                                 print_response: bool = False):
+    """Testing response from details.retrieve_by_ids"""
+    show_details = details.retrieve_by_ids(show_ids, database_connection)
+    assert show_details is not None
+    for show in show_details:
+        assert "host" in show
+        assert "panelists" in show
+    if print_response:
+        print(json.dumps(show_details, indent=2))
+
 def test_retrieve_details_by_date(show_year: int,
                                   show_month: int,
                                   show_day: int,
@@ -344,6 +367,35 @@ def test_retrieve_details_by_year_month(show_year: int,
     if print_response:
         print(json.dumps(show_details, indent=2))
 
+def test_retrieve_core_info_by_date_range(start_date: str,
+                                          end_date: str,
+                                          database_connection: mysql.connector.connect,
+                                          print_response: bool = False):
+    """Testing response from core.retrieve_core_info_by_date_range
+    includes shows on the end date"""
+    show_info = core.retrieve_core_info_by_date_range(start_date,
+                                                      end_date,
+                                                      database_connection)
+    assert show_info
+    show_dates = [show["date"] for show in show_info.values()]
+    assert show_dates[0] >= start_date
+    assert show_dates[-1] == end_date
+    if print_response:
+        print(json.dumps(show_info, indent=2))
+
+def test_retrieve_by_year_without_shows(show_year: int,
+                                        database_connection: mysql.connector.connect):
+    """Testing responses from the info and details year and month
+    functions for a year without any shows, including the last year
+    that can be represented"""
+    assert not info.retrieve_by_year(show_year, database_connection)
+    assert not info.retrieve_by_year_month(show_year, 12, database_connection)
+    assert not info.retrieve_months_by_year(show_year, database_connection)
+    assert not info.retrieve_scores_by_year(show_year, database_connection)
+    assert not details.retrieve_by_year(show_year, database_connection)
+    assert not details.retrieve_by_year_month(show_year, 12,
+                                              database_connection)
+
 def test_retrieve_all_details(database_connection: mysql.connector.connect,
                               print_response: bool = False):
     """Testing response from details.retrieve_all"""
@@ -352,6 +404,16 @@ def test_retrieve_all_details(database_connection: mysql.connector.connect,
     if print_response:
         print(json.dumps(show_details, indent=2))
 
+def test_iter_all_details(database_connection: mysql.connector.connect,
+                          batch_size: int = 25,
+                          print_response: bool = False):
+    """Testing response from details.iter_all matches the response
+    from details.retrieve_all"""
+    show_details = list(details.iter_all(database_connection, batch_size))
+    assert show_details == details.retrieve_all(database_connection)
+    if print_response:
+        print(json.dumps(show_details, indent=2))
+
 def test_retrieve_recent_details(database_connection: mysql.connector.connect,
                                  print_response: bool = False):
     """Testing response from details.retrieve_recent"""
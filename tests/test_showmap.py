@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""Testing module for wwdtm.showmap"""
+
+import json
+import mysql.connector
+from wwdtm import showmap
+from wwdtm.host import core as host_core
+from wwdtm.scorekeeper import core as scorekeeper_core
+
+def test_retrieve_grouped(database_connection: mysql.connector.connect,
+                          print_response: bool = False):
+    """Testing response from showmap.retrieve_grouped"""
+    query = ("SELECT hm.hostid, hm.showid, s.showdate, s.bestof, "
+             "s.repeatshowid FROM ww_showhostmap hm "
+             "JOIN ww_shows s ON s.showid = hm.showid "
+             "ORDER BY hm.hostid ASC, s.showdate ASC;")
+    appearances = showmap.retrieve_grouped(database_connection, query,
+                                           "hostid")
+    assert appearances
+    for appearance_info in appearances.values():
+        assert (appearance_info["count"]["all_shows"]
+                == len(appearance_info["shows"]))
+    if print_response:
+        print(json.dumps(appearances, indent=2))
+
+def test_retrieve_host_appearances_all(database_connection: mysql.connector.connect,
+                                       print_response: bool = False):
+    """Testing response from host.core.retrieve_appearances_all matches
+    host.core.retrieve_appearances_by_id"""
+    appearances = host_core.retrieve_appearances_all(database_connection)
+    assert appearances
+    for host_id, appearance_info in appearances.items():
+        assert appearance_info == host_core.retrieve_appearances_by_id(
+            host_id, database_connection)
+    if print_response:
+        print(json.dumps(appearances, indent=2))
+
+def test_retrieve_scorekeeper_appearances_all(database_connection: mysql.connector.connect,
+                                              print_response: bool = False):
+    """Testing response from scorekeeper.core.retrieve_appearances_all
+    matches scorekeeper.core.retrieve_appearances_by_id"""
+    appearances = scorekeeper_core.retrieve_appearances_all(database_connection)
+    assert appearances
+    for scorekeeper_id, appearance_info in appearances.items():
+        assert appearance_info == scorekeeper_core.retrieve_appearances_by_id(
+            scorekeeper_id, database_connection)
+    if print_response:
+        print(json.dumps(appearances, indent=2))
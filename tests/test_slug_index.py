@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""Testing module for wwdtm.slug_index"""
+
+import mysql.connector
+from wwdtm import slug_index
+from wwdtm.guest import utility as guest_utility
+from wwdtm.panelist import utility as panelist_utility
+
+def test_convert_slug_to_id(panelist_slug: str,
+                            database_connection: mysql.connector.connect,
+                            print_response: bool = False):
+    """Testing indexed response from panelist.utility.convert_slug_to_id
+    matches the response from the database"""
+    expected_id = panelist_utility.convert_slug_to_id(panelist_slug,
+                                                      database_connection)
+    slug_index.enable()
+    indexed_id = panelist_utility.convert_slug_to_id(panelist_slug,
+                                                     database_connection)
+    slug_index.disable()
+
+    assert expected_id is not None
+    assert indexed_id == expected_id
+    if print_response:
+        print(indexed_id)
+
+def test_validate_slug(guest_slug: str,
+                       database_connection: mysql.connector.connect,
+                       print_response: bool = False):
+    """Testing indexed responses from guest.utility.validate_slug and
+    guest.utility.validate_id"""
+    slug_index.enable()
+    valid_slug = guest_utility.validate_slug(guest_slug, database_connection)
+    guest_id = guest_utility.convert_slug_to_id(guest_slug, database_connection)
+    valid_id = guest_utility.validate_id(guest_id, database_connection)
+    slug_index.disable()
+
+    assert valid_slug
+    assert valid_id
+    if print_response:
+        print(guest_id)
+
+def test_invalid_slug(guest_slug: str,
+                      database_connection: mysql.connector.connect,
+                      print_response: bool = False):
+    """Testing indexed response from guest.utility.validate_slug with
+    an invalid slug"""
+    slug_index.enable()
+    valid_slug = guest_utility.validate_slug(guest_slug, database_connection)
+    guest_id = guest_utility.convert_slug_to_id(guest_slug, database_connection)
+    slug_index.disable()
+
+    assert not valid_slug
+    assert guest_id is None
+    if print_response:
+        print(valid_slug)
+
+def test_refresh(database_connection: mysql.connector.connect,
+                 print_response: bool = False):
+    """Testing slug_index.refresh"""
+    slug_index.enable()
+    slug_index.refresh(database_connection=database_connection)
+    index = slug_index.get_index("host", database_connection)
+    slug_index.disable()
+
+    assert len(index) > 0
+    if print_response:
+        print(len(index))
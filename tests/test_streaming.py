@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""Testing module for wwdtm.streaming"""
+
+import json
+import mysql.connector
+from wwdtm import streaming
+from wwdtm.show import details, info
+
+def test_iter_batches(print_response: bool = False):
+    """Testing response from streaming.iter_batches"""
+    batches = list(streaming.iter_batches(list(range(10)), 4))
+    assert batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    if print_response:
+        print(json.dumps(batches, indent=2))
+
+def test_iter_by_ids(database_connection: mysql.connector.connect,
+                     batch_size: int = 10,
+                     print_response: bool = False):
+    """Testing response from streaming.iter_by_ids matches the response
+    from show.details.retrieve_by_ids"""
+    show_ids = info.retrieve_all_ids(database_connection)[:50]
+    shows = list(streaming.iter_by_ids(
+        show_ids,
+        lambda batch_ids: details.retrieve_by_ids(batch_ids,
+                                                  database_connection),
+        batch_size))
+    assert shows == details.retrieve_by_ids(show_ids, database_connection)
+    if print_response:
+        print(json.dumps(shows, indent=2))
+
+def test_invalid_batch_size(database_connection: mysql.connector.connect):
+    """Testing streaming.iter_by_ids rejects a batch size less than 1"""
+    try:
+        streaming.iter_by_ids([1, 2, 3],
+                              lambda batch_ids: details.retrieve_by_ids(
+                                  batch_ids, database_connection),
+                              0)
+    except ValueError:
+        return
+
+    assert False, "Invalid batch size was accepted"
@@ -3,6 +3,8 @@
 # wwdtm is relased under the terms of the Apache License 2.0
 """Explicitly listing all modules in this package"""
 
-from wwdtm import guest, host, location, panelist, scorekeeper, show
+from wwdtm import (cache, executor, fanout, guest, host, location, panelist,
+                   pool, records, scorekeeper, show, showmap, slug_index,
+                   streaming, aio)
 
 VERSION = "1.2.1.5"
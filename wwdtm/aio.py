@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""This module provides asyncio versions of the functions in the guest,
+host, location, panelist, scorekeeper and show modules.
+
+The wwdtm.aio namespace mirrors the layout of the wwdtm package, for
+example, wwdtm.aio.show.details.retrieve_by_id. Each function runs its
+synchronous counterpart in an executor so that database queries do not
+block the event loop.
+
+The iter_all and iter_all_recordings functions are asynchronous
+generators. Each batch of entries is retrieved in the executor and the
+entries are then yielded one at a time.
+
+Calls that use the same database connection are run one at a time. Pass
+a wwdtm.pool.ConnectionPool as the database connection to allow calls,
+and the independent queries run by show.details.retrieve_by_id and
+panelist.details.retrieve_by_id, to run concurrently.
+"""
+
+import asyncio
+from concurrent.futures import Executor
+import functools
+import importlib
+import inspect
+import itertools
+import sys
+import threading
+import types
+from typing import (Any, AsyncIterator, Callable, Dict, Iterator, List,
+                    Tuple)
+import weakref
+import mysql.connector
+from wwdtm import cache, streaming
+from wwdtm.panelist import details as panelist_details
+from wwdtm.pool import ConnectionPool
+from wwdtm.show import details as show_details
+
+#region Constants
+ENTITY_MODULES = ("guest", "host", "location", "panelist", "scorekeeper",
+                  "show")
+SUBMODULES = ("core", "details", "info", "utility")
+
+# Functions that do not query the database and are not mirrored
+UNWRAPPED_FUNCTIONS = ("assemble_details", "detail_calls")
+#endregion
+
+_executor = None
+_connection_locks = weakref.WeakKeyDictionary()
+_connection_locks_by_id = {}
+_connection_locks_lock = threading.Lock()
+
+#region Executor Functions
+def set_executor(executor: Executor = None) -> None:
+    """Sets the executor used to run database queries. The event loop's
+    default executor is used if no executor is provided.
+
+    Arguments:
+        executor (concurrent.futures.Executor)
+    """
+    global _executor
+    _executor = executor
+
+def _connection_lock(database_connection: mysql.connector.connect
+                    ) -> threading.Lock:
+    """Returns the lock used to run calls that share a database
+    connection one at a time
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    with _connection_locks_lock:
+        try:
+            lock = _connection_locks.get(database_connection)
+            if lock is None:
+                lock = threading.Lock()
+                _connection_locks[database_connection] = lock
+        except TypeError:
+            lock = _connection_locks_by_id.setdefault(id(database_connection),
+                                                      threading.Lock())
+
+        return lock
+
+def _call(function: Callable,
+          database_connection: mysql.connector.connect,
+          args: tuple,
+          kwargs: Dict) -> Any:
+    """Calls a function in the current thread, holding the connection
+    lock unless the database connection is a connection pool
+
+    Arguments:
+        function (Callable)
+        database_connection (mysql.connector.connect)
+        args (tuple)
+        kwargs (Dict)
+    """
+    if database_connection is None or isinstance(database_connection,
+                                                 ConnectionPool):
+        return function(*args, **kwargs)
+
+    with _connection_lock(database_connection):
+        return function(*args, **kwargs)
+
+def _get_running_loop() -> asyncio.AbstractEventLoop:
+    """Returns the event loop running in the current thread, using
+    asyncio.get_event_loop on Python versions before 3.7"""
+    get_running_loop = getattr(asyncio, "get_running_loop", None)
+    if get_running_loop is None:
+        return asyncio.get_event_loop()
+
+    return get_running_loop()
+
+async def _run(function: Callable,
+               database_connection: mysql.connector.connect,
+               *args,
+               **kwargs) -> Any:
+    """Runs a function in the executor and returns its result
+
+    Arguments:
+        function (Callable)
+        database_connection (mysql.connector.connect): Database
+        connection used by the function
+    """
+    loop = _get_running_loop()
+    return await loop.run_in_executor(_executor,
+                                      functools.partial(_call,
+                                                        function,
+                                                        database_connection,
+                                                        args,
+                                                        kwargs))
+
+def _next_entries(iterator: Iterator, count: int) -> List:
+    """Returns a list of up to count entries from an iterator
+
+    Arguments:
+        iterator (Iterator)
+        count (int)
+    """
+    return list(itertools.islice(iterator, count))
+
+#endregion
+
+#region Wrapper Functions
+def _wrap(function: Callable) -> Callable:
+    """Returns a coroutine function that runs a synchronous function in
+    the executor
+
+    Arguments:
+        function (Callable)
+    """
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    async def wrapper(*args, **kwargs):
+        try:
+            bound = signature.bind_partial(*args, **kwargs)
+            database_connection = bound.arguments.get("database_connection")
+        except TypeError:
+            database_connection = None
+
+        return await _run(function, database_connection, *args, **kwargs)
+
+    return wrapper
+
+def _wrap_iterator(function: Callable) -> Callable:
+    """Returns an asynchronous generator function that creates the
+    iterator returned by a synchronous function and retrieves each
+    batch of entries from it in the executor
+
+    Arguments:
+        function (Callable): Function that returns an iterator and
+        accepts database_connection and batch_size arguments
+    """
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    async def wrapper(*args, **kwargs) -> AsyncIterator:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        database_connection = bound.arguments.get("database_connection")
+        batch_size = bound.arguments.get("batch_size",
+                                         streaming.DEFAULT_BATCH_SIZE)
+
+        iterator = await _run(function, database_connection, *args, **kwargs)
+        while True:
+            entries = await _run(_next_entries, database_connection,
+                                 iterator, batch_size)
+            if not entries:
+                return
+
+            for entry in entries:
+                yield entry
+
+    return wrapper
+
+def _build_module(entity: str, submodule: str) -> types.ModuleType:
+    """Returns a module containing coroutine functions for each public
+    function in the requested wwdtm module, and asynchronous generator
+    functions for each public iter_ function
+
+    Arguments:
+        entity (str)
+        submodule (str)
+    """
+    source = importlib.import_module("wwdtm.{}.{}".format(entity, submodule))
+    module = types.ModuleType("{}.{}.{}".format(__name__, entity, submodule),
+                              source.__doc__)
+    for name, function in vars(source).items():
+        if (not name.startswith("_") and inspect.isfunction(function)
+                and function.__module__ == source.__name__
+                and name not in UNWRAPPED_FUNCTIONS):
+            if name.startswith("iter_"):
+                setattr(module, name, _wrap_iterator(function))
+            else:
+                setattr(module, name, _wrap(function))
+
+    return module
+
+#endregion
+
+#region Concurrent Retrieval Functions
+async def _gather_calls(calls: List[Tuple[Callable, tuple]],
+                        database_connection: mysql.connector.connect
+                       ) -> List:
+    """Runs each function call in the executor at the same time and
+    returns a list of the results, in the order requested
+
+    Arguments:
+        calls (List[Tuple[Callable, tuple]]): List of functions and
+        their arguments
+        database_connection (mysql.connector.connect)
+    """
+    return list(await asyncio.gather(
+        *[_run(function, database_connection, *args)
+          for function, args in calls]))
+
+async def _retrieve_show_details_by_id(show_id: int,
+                                       database_connection: mysql.connector.connect,
+                                       pre_validated_id: bool = False
+                                      ) -> Dict:
+    """Returns an OrderedDicts with show details for the requested show
+    ID, retrieving the core, panelist, Bluff the Listener and guest
+    information concurrently
+
+    Arguments:
+        show_id (int)
+        database_connection (mysql.connector.connect)
+        pre_validated_id (bool): Flag whether or not the show ID has
+        been validated
+    """
+    found, show = cache.lookup("show", show_details.retrieve_by_id, show_id)
+    if found:
+        return show
+
+    if not pre_validated_id:
+        try:
+            int(show_id)
+        except ValueError:
+            return None
+
+    show = show_details.assemble_details(await _gather_calls(
+        show_details.detail_calls(show_id, database_connection),
+        database_connection))
+    cache.store("show", show_details.retrieve_by_id, show_id, show)
+    return show
+
+async def _retrieve_panelist_details_by_id(panelist_id: int,
+                                           database_connection: mysql.connector.connect,
+                                           pre_validated_id: bool = False
+                                          ) -> Dict:
+    """Returns an OrderedDict with panelist details for the requested
+    panelist ID, retrieving the panelist information, statistics, Bluff
+    the Listener information and appearances concurrently
+
+    Arguments:
+        panelist_id (int)
+        database_connection (mysql.connector.connect)
+        pre_validated_id (bool): Flag whether or not the panelist ID
+        has been validated
+    """
+    found, panelist = cache.lookup("panelist",
+                                   panelist_details.retrieve_by_id,
+                                   panelist_id)
+    if found:
+        return panelist
+
+    if not pre_validated_id:
+        try:
+            int(panelist_id)
+        except ValueError:
+            return None
+
+    panelist = panelist_details.assemble_details(await _gather_calls(
+        panelist_details.detail_calls(panelist_id, database_connection),
+        database_connection))
+    cache.store("panelist", panelist_details.retrieve_by_id, panelist_id,
+                panelist)
+    return panelist
+
+#endregion
+
+_CONCURRENT_FUNCTIONS = {
+    ("show", "details", "retrieve_by_id"): _retrieve_show_details_by_id,
+    ("panelist", "details", "retrieve_by_id"): _retrieve_panelist_details_by_id,
+}
+
+for _entity in ENTITY_MODULES:
+    _entity_module = types.ModuleType("{}.{}".format(__name__, _entity))
+    for _submodule in SUBMODULES:
+        _module = _build_module(_entity, _submodule)
+        setattr(_entity_module, _submodule, _module)
+        sys.modules[_module.__name__] = _module
+
+    sys.modules[_entity_module.__name__] = _entity_module
+    globals()[_entity] = _entity_module
+
+for (_entity, _submodule, _name), _function in _CONCURRENT_FUNCTIONS.items():
+    setattr(sys.modules["{}.{}.{}".format(__name__, _entity, _submodule)],
+            _name,
+            _function)
@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""This module provides an opt-in, in-process cache for the
+retrieve_by_id and retrieve_by_slug functions in the guest, host,
+location, panelist, scorekeeper and show modules.
+
+The cache is disabled by default. Once enabled, entries are keyed on
+entity type, function and the requested ID or slug, with numeric IDs
+stored as integers. Each entry also records the ID of the entity it
+contains, so that invalidating an ID or slug removes every cached
+entry for that entity. Each entity type has its own time-to-live, and
+the least recently used entries are evicted once the cache reaches its
+maximum number of entries.
+"""
+
+from collections import OrderedDict
+import copy
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+#region Constants
+ENTITY_TYPES = ("guest", "host", "location", "panelist", "scorekeeper", "show")
+
+DEFAULT_MAX_ENTRIES = 4096
+
+# Time-to-live values, in seconds, for each entity type. Host and
+# scorekeeper records rarely change, while show records may be updated
+# shortly after a show airs.
+DEFAULT_TTL = {
+    "guest": 3600,
+    "host": 86400,
+    "location": 86400,
+    "panelist": 3600,
+    "scorekeeper": 86400,
+    "show": 900,
+}
+#endregion
+
+#region Cache Class
+class EntityCache:
+    """Thread-safe LRU cache with per-entity type time-to-live values
+
+    Arguments:
+        max_entries (int): Maximum number of entries to keep before
+        evicting the least recently used entry
+        ttl (Dict[str, int]): Time-to-live values, in seconds, keyed by
+        entity type. A time-to-live of 0 disables caching for that
+        entity type.
+    """
+
+    def __init__(self,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl: Dict[str, int] = None):
+        if max_entries < 1:
+            raise ValueError("Maximum number of entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.ttl = dict(DEFAULT_TTL)
+        if ttl:
+            self.ttl.update(ttl)
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """Returns a tuple containing whether or not the key was found
+        in the cache and, if found, the cached value
+
+        Arguments:
+            key (Tuple): Cache key, starting with the entity type
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            expires, value, _ = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def set(self, key: Tuple, value: Any, entity_id: int = None) -> None:
+        """Stores a value in the cache using the time-to-live for the
+        key's entity type
+
+        Arguments:
+            key (Tuple): Cache key, starting with the entity type
+            value (Any)
+            entity_id (int): ID of the entity contained in the value
+        """
+        ttl = self.ttl.get(key[0], 0)
+        if not ttl or ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value, entity_id)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, entity_type: str = None, entity_key: Any = None) -> int:
+        """Removes cached entries for an entity type and, optionally,
+        a specific ID or slug. Entries cached by ID and by slug for the
+        same entity are all removed. Returns the number of entries
+        removed.
+
+        Arguments:
+            entity_type (str): Entity type to invalidate. All entries
+            are removed if no entity type is provided.
+            entity_key (Any): ID or slug to invalidate
+        """
+        entity_key = _normalize_key(entity_key)
+        with self._lock:
+            if entity_type is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+
+            entity_keys = {entity_key}
+            if entity_key is not None:
+                entity_keys.update(
+                    entry[2] for key, entry in self._entries.items()
+                    if key[0] == entity_type and key[2] == entity_key
+                    and entry[2] is not None)
+
+            keys = [key for key, entry in self._entries.items()
+                    if key[0] == entity_type
+                    and (entity_key is None or key[2] in entity_keys
+                         or entry[2] in entity_keys)]
+            for key in keys:
+                del self._entries[key]
+
+            return len(keys)
+
+    def statistics(self) -> Dict:
+        """Returns an OrderedDict with cache hit, miss and eviction
+        counters, and the current number of entries"""
+        with self._lock:
+            stats = OrderedDict()
+            stats["hits"] = self.hits
+            stats["misses"] = self.misses
+            stats["evictions"] = self.evictions
+            stats["entries"] = len(self._entries)
+            stats["max_entries"] = self.max_entries
+            return stats
+
+    def reset_statistics(self) -> None:
+        """Resets the cache hit, miss and eviction counters"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+#endregion
+
+_cache = None
+_invalidation_callbacks = []
+
+#region Cache Management Functions
+def enable(max_entries: int = DEFAULT_MAX_ENTRIES,
+           ttl: Dict[str, int] = None) -> EntityCache:
+    """Enables the entity cache, replacing any existing cache, and
+    returns the new cache
+
+    Arguments:
+        max_entries (int): Maximum number of entries to keep before
+        evicting the least recently used entry
+        ttl (Dict[str, int]): Time-to-live values, in seconds, keyed by
+        entity type, that override the default values
+    """
+    global _cache
+    _cache = EntityCache(max_entries=max_entries, ttl=ttl)
+    return _cache
+
+def disable() -> None:
+    """Disables the entity cache and discards any cached entries"""
+    global _cache
+    _cache = None
+
+def is_enabled() -> bool:
+    """Returns true or false based on whether or not the entity cache
+    is enabled"""
+    return _cache is not None
+
+def invalidate(entity_type: str = None, entity_key: Any = None) -> int:
+    """Removes cached entries for an entity type and, optionally, a
+    specific ID or slug. Returns the number of entries removed.
+
+    Arguments:
+        entity_type (str): Entity type to invalidate. All entries are
+        removed if no entity type is provided.
+        entity_key (Any): ID or slug to invalidate
+    """
+    if entity_type is not None and entity_type not in ENTITY_TYPES:
+        raise ValueError("Invalid entity type: {}".format(entity_type))
+
+    for callback_type, callback in list(_invalidation_callbacks):
+        if entity_type is None or entity_type == callback_type:
+            callback()
+
+    cache = _cache
+    if cache is None:
+        return 0
+
+    return cache.invalidate(entity_type, entity_key)
+
+def register_invalidation_callback(entity_type: str,
+                                   callback: Callable[[], None]) -> None:
+    """Registers a function that is called whenever cached entries for
+    an entity type are invalidated, including when the entity cache is
+    not enabled. Used to discard derived data that is cached outside
+    of the entity cache.
+
+    Arguments:
+        entity_type (str)
+        callback (Callable[[], None])
+    """
+    if entity_type not in ENTITY_TYPES:
+        raise ValueError("Invalid entity type: {}".format(entity_type))
+
+    _invalidation_callbacks.append((entity_type, callback))
+
+def clear() -> int:
+    """Removes all cached entries. Returns the number of entries
+    removed."""
+    return invalidate()
+
+def statistics() -> Dict:
+    """Returns an OrderedDict with cache hit, miss and eviction
+    counters, and the current number of entries. Returns None if the
+    cache is not enabled."""
+    cache = _cache
+    if cache is None:
+        return None
+
+    return cache.statistics()
+
+#endregion
+
+#region Lookup Functions
+def lookup(entity_type: str,
+           function: Callable,
+           entity_key: Any) -> Tuple[bool, Any]:
+    """Returns a tuple containing whether or not a cached result was
+    found for a function and ID or slug and, if found, a copy of the
+    cached result
+
+    Arguments:
+        entity_type (str)
+        function (Callable): Decorated or undecorated retrieve function
+        entity_key (Any): ID or slug
+    """
+    cache = _cache
+    if cache is None:
+        return False, None
+
+    try:
+        key = (entity_type, _function_name(function),
+               _normalize_key(entity_key))
+        hash(key)
+    except TypeError:
+        return False, None
+
+    found, value = cache.get(key)
+    if found:
+        return True, copy.deepcopy(value)
+
+    return False, None
+
+def store(entity_type: str,
+          function: Callable,
+          entity_key: Any,
+          value: Any) -> None:
+    """Stores a copy of the result of a function for an ID or slug in
+    the cache. Results of None are not cached.
+
+    Arguments:
+        entity_type (str)
+        function (Callable): Decorated or undecorated retrieve function
+        entity_key (Any): ID or slug
+        value (Any)
+    """
+    cache = _cache
+    if cache is None or value is None:
+        return
+
+    try:
+        key = (entity_type, _function_name(function),
+               _normalize_key(entity_key))
+        hash(key)
+    except TypeError:
+        return
+
+    entity_id = None
+    if isinstance(value, dict):
+        entity_id = _normalize_key(value.get("id"))
+
+    cache.set(key, copy.deepcopy(value), entity_id)
+
+def _function_name(function: Callable) -> str:
+    """Returns the module and name of a function, used as part of the
+    cache key
+
+    Arguments:
+        function (Callable)
+    """
+    return "{}.{}".format(function.__module__, function.__name__)
+
+def _normalize_key(entity_key: Any) -> Any:
+    """Returns an ID or slug as used in cache keys. IDs passed as
+    strings, such as "2", are converted to integers so that they match
+    entries cached using integer IDs.
+
+    Arguments:
+        entity_key (Any): ID or slug
+    """
+    if (isinstance(entity_key, str)
+            and entity_key.strip().lstrip("-").isdecimal()):
+        return int(entity_key)
+
+    return entity_key
+
+#endregion
+
+#region Decorators
+def cached(entity_type: str) -> Callable:
+    """Returns a decorator that caches the results of a retrieve_by_id
+    or retrieve_by_slug function when the entity cache is enabled.
+
+    The decorated function must take the ID or slug as its first
+    argument and the database connection as its second argument.
+    Results of None are not cached, and copies of cached values are
+    returned so callers are free to modify them.
+
+    Arguments:
+        entity_type (str)
+    """
+    if entity_type not in ENTITY_TYPES:
+        raise ValueError("Invalid entity type: {}".format(entity_type))
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(entity_key, database_connection, *args, **kwargs):
+            if _cache is None:
+                return func(entity_key, database_connection, *args, **kwargs)
+
+            found, value = lookup(entity_type, func, entity_key)
+            if found:
+                return value
+
+            value = func(entity_key, database_connection, *args, **kwargs)
+            store(entity_type, func, entity_key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+#endregion
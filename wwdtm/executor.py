@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""This module provides the shared query executor used by the guest,
+host, location, panelist, scorekeeper and show modules.
+
+Cursors opened by the executor are always closed once the results have
+been fetched. Once enabled with enable_prepared_statements, queries run
+on a MySQL connection use a server-side prepared statement and the
+executor keeps the prepared cursor for that query so that later calls
+using the same connection do not need to send and parse the query
+again.
+
+The connector only reuses a prepared statement when it is passed the
+same query string object that it was prepared with, so queries that
+are built at runtime, such as queries with an IN list or an optional
+WHERE clause, are passed with prepared set to False and always run
+using a regular cursor.
+
+Prepared statements are not used with pooled connections, since
+returning a connection to a pool resets its session and discards any
+prepared statements.
+"""
+
+from collections import OrderedDict
+import threading
+from typing import Any, List
+import weakref
+import mysql.connector
+from mysql.connector.connection import MySQLConnection
+from mysql.connector import errorcode
+from mysql.connector.errors import Error
+
+try:
+    from mysql.connector.connection_cext import CMySQLConnection
+    _PREPARED_CONNECTION_TYPES = (MySQLConnection, CMySQLConnection)
+except ImportError:
+    _PREPARED_CONNECTION_TYPES = (MySQLConnection,)
+
+#region Constants
+DEFAULT_MAX_PREPARED_STATEMENTS = 128
+#endregion
+
+_prepared_statements_enabled = False
+_max_prepared_statements = DEFAULT_MAX_PREPARED_STATEMENTS
+_prepared_cursors = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+#region Prepared Statement Management Functions
+def enable_prepared_statements(max_statements: int =
+                               DEFAULT_MAX_PREPARED_STATEMENTS) -> None:
+    """Enables the use of server-side prepared statements for queries
+    run on MySQL connections
+
+    Arguments:
+        max_statements (int): Maximum number of prepared statements to
+        keep for each connection before closing the least recently used
+        statement
+    """
+    global _prepared_statements_enabled, _max_prepared_statements
+    if max_statements < 1:
+        raise ValueError("Maximum number of prepared statements must be at "
+                         "least 1")
+
+    _prepared_statements_enabled = True
+    _max_prepared_statements = max_statements
+
+def disable_prepared_statements() -> None:
+    """Disables the use of server-side prepared statements and closes
+    any prepared statements kept by the executor"""
+    global _prepared_statements_enabled
+    _prepared_statements_enabled = False
+    clear_prepared_statements()
+
+def clear_prepared_statements(database_connection: mysql.connector.connect
+                              = None) -> None:
+    """Closes the prepared statements kept for a database connection,
+    or for all database connections if no connection is provided
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    with _lock:
+        if database_connection is None:
+            statement_sets = list(_prepared_cursors.values())
+            _prepared_cursors.clear()
+        else:
+            statement_sets = [_prepared_cursors.pop(database_connection,
+                                                    (None, OrderedDict()))]
+
+    for _, statements in statement_sets:
+        for _, cursor in statements.values():
+            _close_cursor(cursor)
+
+#endregion
+
+#region Internal Functions
+def _close_cursor(cursor) -> None:
+    """Closes a cursor, ignoring any errors raised by the connector
+
+    Arguments:
+        cursor (mysql.connector.cursor.MySQLCursor)
+    """
+    try:
+        cursor.close()
+    except Error:
+        pass
+
+def _use_prepared_statement(database_connection: mysql.connector.connect,
+                            prepared: bool) -> bool:
+    """Returns true or false based on whether or not a query run on a
+    database connection uses a prepared statement
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        prepared (bool): Flag whether or not the query can use a
+        prepared statement
+    """
+    return (prepared
+            and _prepared_statements_enabled
+            and isinstance(database_connection, _PREPARED_CONNECTION_TYPES))
+
+def _prepared_cursor(database_connection: mysql.connector.connect,
+                     query: str) -> tuple:
+    """Returns a tuple containing the query string object and prepared
+    cursor kept for a query and database connection, creating the
+    cursor if needed. Prepared cursors kept from before the connection
+    reconnected to the server are discarded.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        query (str)
+    """
+    connection_id = database_connection.connection_id
+    evicted = []
+    with _lock:
+        connection_id_statements = _prepared_cursors.get(database_connection)
+        if (connection_id_statements is None
+                or connection_id_statements[0] != connection_id):
+            if connection_id_statements is not None:
+                evicted.extend(cursor for _, cursor
+                               in connection_id_statements[1].values())
+            connection_id_statements = (connection_id, OrderedDict())
+            _prepared_cursors[database_connection] = connection_id_statements
+
+        statements = connection_id_statements[1]
+        entry = statements.get(query)
+        if entry is not None:
+            statements.move_to_end(query)
+        else:
+            entry = (query, database_connection.cursor(prepared=True))
+            statements[query] = entry
+            while len(statements) > _max_prepared_statements:
+                evicted.append(statements.popitem(last=False)[1][1])
+
+    for evicted_cursor in evicted:
+        _close_cursor(evicted_cursor)
+
+    return entry
+
+def _discard_prepared_cursor(database_connection: mysql.connector.connect,
+                             query: str) -> None:
+    """Closes and removes the prepared cursor kept for a query and
+    database connection
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        query (str)
+    """
+    with _lock:
+        connection_id_statements = _prepared_cursors.get(database_connection)
+        entry = None
+        if connection_id_statements:
+            entry = connection_id_statements[1].pop(query, None)
+
+    if entry is not None:
+        _close_cursor(entry[1])
+
+def _execute_prepared(database_connection: mysql.connector.connect,
+                      query: str,
+                      parameters: tuple,
+                      dictionary: bool,
+                      retry: bool = True) -> List:
+    """Runs a query using a prepared statement and returns all of the
+    rows returned. If the prepared statement is no longer known to the
+    server, such as after the connection reconnected, the query is
+    prepared and run once more.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        query (str)
+        parameters (tuple)
+        dictionary (bool): Flag whether or not rows are returned as
+        dictionaries
+        retry (bool): Flag whether or not to prepare and run the query
+        again if the prepared statement is no longer known
+    """
+    # The connector only reuses the prepared statement if it is passed
+    # the same string object that the statement was prepared with
+    prepared_query, cursor = _prepared_cursor(database_connection, query)
+    try:
+        cursor.execute(prepared_query, parameters or ())
+        rows = cursor.fetchall()
+        column_names = cursor.column_names
+    except Error as err:
+        _discard_prepared_cursor(database_connection, query)
+        if retry and err.errno == errorcode.ER_UNKNOWN_STMT_HANDLER:
+            return _execute_prepared(database_connection, query, parameters,
+                                     dictionary, retry=False)
+        raise
+
+    if dictionary:
+        return [dict(zip(column_names, row)) for row in rows]
+
+    return rows
+
+#endregion
+
+#region Execution Functions
+def fetch_one(database_connection: mysql.connector.connect,
+              query: str,
+              parameters: tuple = None,
+              dictionary: bool = False,
+              prepared: bool = True) -> Any:
+    """Runs a query and returns the first row returned, or None if no
+    rows are returned
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        query (str)
+        parameters (tuple)
+        dictionary (bool): Flag whether or not the row is returned as a
+        dictionary
+        prepared (bool): Flag whether or not the query can use a
+        prepared statement. Set to False for queries built at runtime.
+    """
+    if _use_prepared_statement(database_connection, prepared):
+        rows = _execute_prepared(database_connection, query, parameters,
+                                 dictionary)
+        return rows[0] if rows else None
+
+    cursor = database_connection.cursor(dictionary=dictionary)
+    try:
+        if parameters is None:
+            cursor.execute(query)
+        else:
+            cursor.execute(query, parameters)
+        return cursor.fetchone()
+    finally:
+        cursor.close()
+
+def fetch_all(database_connection: mysql.connector.connect,
+              query: str,
+              parameters: tuple = None,
+              dictionary: bool = False,
+              prepared: bool = True) -> List:
+    """Runs a query and returns a list of all of the rows returned
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        query (str)
+        parameters (tuple)
+        dictionary (bool): Flag whether or not rows are returned as
+        dictionaries
+        prepared (bool): Flag whether or not the query can use a
+        prepared statement. Set to False for queries built at runtime.
+    """
+    if _use_prepared_statement(database_connection, prepared):
+        return _execute_prepared(database_connection, query, parameters,
+                                 dictionary)
+
+    cursor = database_connection.cursor(dictionary=dictionary)
+    try:
+        if parameters is None:
+            cursor.execute(query)
+        else:
+            cursor.execute(query, parameters)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+#endregion
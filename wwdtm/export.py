@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""This module provides an exporter that writes shows, panelists,
+guests, hosts, scorekeepers and locations from the Wait Wait... Don't
+Tell Me! Stats Page Database to JSON or newline-delimited JSON files.
+
+Each entity type is retrieved in batches using the iter_all functions
+and written to its own file one entry at a time. Entity types can be
+exported in parallel using a connection pool.
+
+Usage:
+    python -m wwdtm.export --config config.json --output-dir export
+"""
+
+import argparse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, Iterable, Iterator, List
+import dateutil.parser as parser
+import mysql.connector
+from wwdtm import (guest, host, location, panelist, pool, scorekeeper, show,
+                   streaming)
+
+#region Constants
+OUTPUT_FORMATS = ("ndjson", "json")
+DEFAULT_OUTPUT_FORMAT = "ndjson"
+DEFAULT_OUTPUT_DIR = "export"
+DEFAULT_WORKERS = 1
+
+# Entity types that can be limited to shows on or after a date
+SINCE_ENTITIES = ("shows",)
+#endregion
+
+#region Internal Functions
+def _iter_shows(database_connection: mysql.connector.connect,
+                batch_size: int,
+                since: str = None) -> Iterator[Dict]:
+    """Returns an iterator that yields show details for all shows, or
+    for shows on or after the requested date
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        batch_size (int)
+        since (str): Show date in YYYY-MM-DD format
+    """
+    if not since:
+        return show.details.iter_all(database_connection, batch_size)
+
+    show_ids = show.info.retrieve_ids_since(since, database_connection)
+    return streaming.iter_by_ids(
+        show_ids,
+        lambda batch_ids: show.details.retrieve_by_ids(batch_ids,
+                                                       database_connection),
+        batch_size)
+
+def _iter_locations(database_connection: mysql.connector.connect,
+                    batch_size: int,
+                    since: str = None) -> Iterator[Dict]:
+    """Returns an iterator that yields location information and
+    recordings for all locations
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        batch_size (int)
+        since (str): Not supported for locations
+    """
+    return location.details.iter_all_recordings(database_connection,
+                                                batch_size=batch_size)
+
+def _iter_details(module) -> Callable:
+    """Returns a function that returns an iterator that yields details
+    from the iter_all function of the requested module
+
+    Arguments:
+        module: wwdtm guest, host, panelist or scorekeeper module. The
+        since argument of the returned function is not supported.
+    """
+    def iter_details(database_connection: mysql.connector.connect,
+                     batch_size: int,
+                     since: str = None) -> Iterator[Dict]:
+        return module.details.iter_all(database_connection, batch_size)
+
+    return iter_details
+
+def _output_path(output_dir: str,
+                 entity: str,
+                 output_format: str,
+                 since: str = None) -> str:
+    """Returns the path of the output file for an entity type. Shows
+    exported since a date are written to a separate file so that a full
+    export is not overwritten.
+
+    Arguments:
+        output_dir (str)
+        entity (str)
+        output_format (str)
+        since (str): Show date in YYYY-MM-DD format
+    """
+    if since and entity == "shows":
+        file_name = "{}-since-{}.{}".format(entity, since, output_format)
+    else:
+        file_name = "{}.{}".format(entity, output_format)
+
+    return os.path.join(output_dir, file_name)
+
+#endregion
+
+ENTITIES = OrderedDict([
+    ("shows", _iter_shows),
+    ("panelists", _iter_details(panelist)),
+    ("guests", _iter_details(guest)),
+    ("hosts", _iter_details(host)),
+    ("scorekeepers", _iter_details(scorekeeper)),
+    ("locations", _iter_locations),
+])
+
+#region Export Functions
+def write_entries(entries: Iterable[Dict],
+                  output_path: str,
+                  output_format: str = DEFAULT_OUTPUT_FORMAT) -> int:
+    """Writes entries to a file one at a time, either as one JSON
+    object per line or as a single JSON array, and returns the number
+    of entries written. The file is written under a temporary name and
+    only replaces an existing file once all entries have been written.
+
+    Arguments:
+        entries (Iterable[Dict])
+        output_path (str)
+        output_format (str): Either "ndjson" or "json"
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError("Invalid output format: {}".format(output_format))
+
+    temp_path = output_path + ".tmp"
+    count = 0
+    try:
+        with open(temp_path, "w", encoding="utf-8") as output_file:
+            if output_format == "json":
+                output_file.write("[")
+
+            for entry in entries:
+                if output_format == "json":
+                    output_file.write(",\n" if count else "\n")
+                    output_file.write(json.dumps(entry))
+                else:
+                    output_file.write(json.dumps(entry))
+                    output_file.write("\n")
+                count += 1
+
+            if output_format == "json":
+                output_file.write("\n]\n" if count else "]\n")
+
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return count
+
+def export_entity(entity: str,
+                  database_connection: mysql.connector.connect,
+                  output_dir: str = DEFAULT_OUTPUT_DIR,
+                  output_format: str = DEFAULT_OUTPUT_FORMAT,
+                  batch_size: int = streaming.DEFAULT_BATCH_SIZE,
+                  since: str = None) -> Dict:
+    """Exports all entries for an entity type to a file in the output
+    directory and returns an OrderedDict with the entity type, output
+    file path, number of entries written and time elapsed in seconds
+
+    Arguments:
+        entity (str): One of shows, panelists, guests, hosts,
+        scorekeepers or locations
+        database_connection (mysql.connector.connect)
+        output_dir (str)
+        output_format (str): Either "ndjson" or "json"
+        batch_size (int): Number of entries to retrieve at a time
+        since (str): Only export shows on or after this date, in
+        YYYY-MM-DD format. Only supported for shows.
+    """
+    if entity not in ENTITIES:
+        raise ValueError("Invalid entity: {}".format(entity))
+
+    if since and entity not in SINCE_ENTITIES:
+        raise ValueError("Exporting since a date is not supported for "
+                         "{}".format(entity))
+
+    start_time = time.perf_counter()
+    output_path = _output_path(output_dir, entity, output_format, since)
+    entries = ENTITIES[entity](database_connection, batch_size, since)
+    count = write_entries(entries, output_path, output_format)
+
+    stage = OrderedDict()
+    stage["entity"] = entity
+    stage["path"] = output_path
+    stage["count"] = count
+    stage["elapsed"] = round(time.perf_counter() - start_time, 5)
+    return stage
+
+def export_all(database_config: Dict,
+               output_dir: str = DEFAULT_OUTPUT_DIR,
+               entities: List[str] = None,
+               output_format: str = DEFAULT_OUTPUT_FORMAT,
+               workers: int = DEFAULT_WORKERS,
+               batch_size: int = streaming.DEFAULT_BATCH_SIZE,
+               since: str = None) -> List[Dict]:
+    """Exports each requested entity type to its own file in the output
+    directory and returns a list of OrderedDicts with the results and
+    timings for each entity type, in the order requested. If more than
+    one worker is requested, entity types are exported in parallel
+    using a connection pool with one connection per worker.
+
+    Arguments:
+        database_config (Dict): Connection settings, as found in the
+        database section of config.dist.json
+        output_dir (str)
+        entities (List[str]): Entity types to export. All entity types
+        are exported if no list is provided, or only shows if a since
+        date is provided.
+        output_format (str): Either "ndjson" or "json"
+        workers (int): Number of entity types to export at a time
+        batch_size (int): Number of entries to retrieve at a time
+        since (str): Only export shows on or after this date, in
+        YYYY-MM-DD format. Only supported for shows.
+    """
+    if entities:
+        entities = list(entities)
+    elif since:
+        entities = list(SINCE_ENTITIES)
+    else:
+        entities = list(ENTITIES.keys())
+
+    for entity in entities:
+        if entity not in ENTITIES:
+            raise ValueError("Invalid entity: {}".format(entity))
+
+        if since and entity not in SINCE_ENTITIES:
+            raise ValueError("Exporting since a date is not supported for "
+                             "{}".format(entity))
+
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError("Invalid output format: {}".format(output_format))
+
+    if workers < 1:
+        raise ValueError("Number of workers must be at least 1")
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    if workers == 1 or len(entities) == 1:
+        database_connection = mysql.connector.connect(**database_config)
+        try:
+            return [export_entity(entity, database_connection, output_dir,
+                                  output_format, batch_size, since)
+                    for entity in entities]
+        finally:
+            database_connection.close()
+
+    worker_count = min(workers, len(entities))
+    connection_pool = pool.ConnectionPool.from_config(database_config,
+                                                      pool_size=worker_count)
+
+    def export_pooled(entity: str) -> Dict:
+        with connection_pool.connection() as database_connection:
+            return export_entity(entity, database_connection, output_dir,
+                                 output_format, batch_size, since)
+
+    try:
+        with ThreadPoolExecutor(max_workers=worker_count) as thread_pool:
+            return list(thread_pool.map(export_pooled, entities))
+    finally:
+        connection_pool.close()
+
+#endregion
+
+#region Command Line Functions
+def _parse_since(value: str) -> str:
+    """Returns a date string in YYYY-MM-DD format for the --since
+    argument
+
+    Arguments:
+        value (str)
+    """
+    try:
+        return parser.parse(value).date().isoformat()
+    except (ValueError, OverflowError) as err:
+        raise argparse.ArgumentTypeError("Invalid date: {}".format(value)) \
+            from err
+
+def _load_database_config(config_file_path: str, environment: str) -> Dict:
+    """Returns the database section of the requested environment in a
+    configuration file that follows the format of config.dist.json
+
+    Arguments:
+        config_file_path (str)
+        environment (str): Name of the environment section, such as
+        local, development or production
+    """
+    with open(config_file_path, "r") as config_file:
+        config_dict = json.load(config_file)
+
+    if environment not in config_dict:
+        raise ValueError("Missing '{}' section in config "
+                         "file".format(environment))
+
+    return config_dict[environment]["database"]
+
+def parse_arguments(arguments: List[str] = None) -> argparse.Namespace:
+    """Returns the parsed command line arguments
+
+    Arguments:
+        arguments (List[str]): Arguments to parse. The arguments passed
+        to the script are used if no list is provided.
+    """
+    argument_parser = argparse.ArgumentParser(
+        prog="python -m wwdtm.export",
+        description="Export Wait Wait... Don't Tell Me! Stats Page data "
+                    "to JSON or NDJSON files")
+    argument_parser.add_argument("--config", default="config.json",
+                                 help="configuration file (default: "
+                                      "config.json)")
+    argument_parser.add_argument("--environment",
+                                 default=os.getenv("APP_ENV", "local"),
+                                 help="configuration file environment "
+                                      "(default: APP_ENV or local)")
+    argument_parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR,
+                                 help="output directory (default: "
+                                      "{})".format(DEFAULT_OUTPUT_DIR))
+    argument_parser.add_argument("--format", dest="output_format",
+                                 choices=OUTPUT_FORMATS,
+                                 default=DEFAULT_OUTPUT_FORMAT,
+                                 help="output format (default: "
+                                      "{})".format(DEFAULT_OUTPUT_FORMAT))
+    argument_parser.add_argument("--entities", nargs="+",
+                                 choices=list(ENTITIES.keys()),
+                                 help="entity types to export (default: all, "
+                                      "or shows if --since is used)")
+    argument_parser.add_argument("--workers", type=int,
+                                 default=DEFAULT_WORKERS,
+                                 help="number of entity types to export in "
+                                      "parallel (default: "
+                                      "{})".format(DEFAULT_WORKERS))
+    argument_parser.add_argument("--batch-size", type=int,
+                                 default=streaming.DEFAULT_BATCH_SIZE,
+                                 help="number of entries to retrieve at a "
+                                      "time (default: {})".format(
+                                          streaming.DEFAULT_BATCH_SIZE))
+    argument_parser.add_argument("--since", type=_parse_since,
+                                 help="only export shows on or after this "
+                                      "date (YYYY-MM-DD) to a separate file; "
+                                      "only shows are exported and other "
+                                      "entity types cannot be requested")
+    options = argument_parser.parse_args(arguments)
+
+    if options.since and options.entities:
+        unsupported = [entity for entity in options.entities
+                       if entity not in SINCE_ENTITIES]
+        if unsupported:
+            argument_parser.error("--since cannot be used with: "
+                                  "{}".format(", ".join(unsupported)))
+
+    return options
+
+def main(arguments: List[str] = None) -> int:
+    """Runs the exporter from the command line and prints the timings
+    for each stage
+
+    Arguments:
+        arguments (List[str]): Command line arguments
+    """
+    options = parse_arguments(arguments)
+    start_time = time.perf_counter()
+
+    environment = options.environment.strip().lower()
+    database_config = _load_database_config(options.config, environment)
+    stages = export_all(database_config,
+                        output_dir=options.output_dir,
+                        entities=options.entities,
+                        output_format=options.output_format,
+                        workers=options.workers,
+                        batch_size=options.batch_size,
+                        since=options.since)
+
+    for stage in stages:
+        print("{}: {} entries written to {} in {}s".format(stage["entity"],
+                                                          stage["count"],
+                                                          stage["path"],
+                                                          stage["elapsed"]),
+              file=sys.stderr)
+
+    elapsed_time = round(time.perf_counter() - start_time, 5)
+    print("Time Elapsed: {}s".format(elapsed_time), file=sys.stderr)
+    return 0
+
+#endregion
+
+if __name__ == "__main__":
+    sys.exit(main())
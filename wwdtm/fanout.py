@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""This module provides an opt-in thread pool used to run the
+independent queries made by show.details.retrieve_by_id and
+panelist.details.retrieve_by_id at the same time.
+
+Fan-out is disabled by default and is only used when the database
+connection passed to a function is a wwdtm.pool.ConnectionPool with
+more than one connection, so that each query runs on its own pooled
+connection.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import Any, Callable, List, Tuple
+import mysql.connector
+from wwdtm.pool import ConnectionPool
+
+#region Constants
+DEFAULT_MAX_WORKERS = 4
+#endregion
+
+_executor = None
+_lock = threading.Lock()
+
+#region Fan-out Management Functions
+def enable(max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+    """Enables fan-out using a thread pool with the requested number of
+    worker threads, replacing any existing thread pool
+
+    Arguments:
+        max_workers (int)
+    """
+    global _executor
+    with _lock:
+        previous_executor = _executor
+        _executor = ThreadPoolExecutor(max_workers=max_workers,
+                                       thread_name_prefix="wwdtm-fanout")
+
+    if previous_executor:
+        previous_executor.shutdown(wait=False)
+
+def disable() -> None:
+    """Disables fan-out and shuts down the thread pool"""
+    global _executor
+    with _lock:
+        previous_executor = _executor
+        _executor = None
+
+    if previous_executor:
+        previous_executor.shutdown(wait=False)
+
+def is_enabled() -> bool:
+    """Returns true or false based on whether or not fan-out is
+    enabled"""
+    return _executor is not None
+
+def is_active(database_connection: mysql.connector.connect) -> bool:
+    """Returns true or false based on whether or not queries using the
+    database connection will be fanned out
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    return (_executor is not None
+            and isinstance(database_connection, ConnectionPool)
+            and database_connection.pool_size > 1)
+
+#endregion
+
+#region Execution Functions
+def run_all(database_connection: mysql.connector.connect,
+            calls: List[Tuple[Callable, tuple]],
+            stop_if_empty: bool = False) -> List[Any]:
+    """Returns a list containing the result of each function call, in
+    the order requested. The calls are run at the same time if fan-out
+    is active for the database connection and one after another
+    otherwise.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        calls (List[Tuple[Callable, tuple]]): List of functions and
+        their arguments
+        stop_if_empty (bool): Flag whether or not to skip the remaining
+        calls, returning None for each, if the first call returns an
+        empty result when the calls are run one after another
+    """
+    executor = _executor
+    if executor is None or not is_active(database_connection):
+        results = []
+        for function, args in calls:
+            result = function(*args)
+            if stop_if_empty and not results and not result:
+                return [result] + [None] * (len(calls) - 1)
+
+            results.append(result)
+
+        return results
+
+    futures = [executor.submit(function, *args) for function, args in calls]
+    return [future.result() for future in futures]
+
+#endregion
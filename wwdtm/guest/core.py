@@ -5,12 +5,28 @@
 information from the Wait Wait... Don't Tell Me! Stats Page Database.
 """
 
-from collections import OrderedDict
 from typing import List, Dict
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import executor, showmap
 from wwdtm.guest import utility
 
+#region Internal Functions
+def _build_appearance(appearance: Dict) -> Dict:
+    """Returns an OrderedDict containing show and score information
+    for a guest appearance row
+
+    Arguments:
+        appearance (Dict): Row containing showid, showdate, bestof,
+        repeatshowid, guestscore and exception values
+    """
+    info = showmap.build_show_info(appearance)
+    info["score"] = appearance["guestscore"]
+    info["score_exception"] = bool(appearance["exception"])
+    return info
+
+#endregion
+
 #region Core Functions
 def retrieve_appearances_by_id(guest_id: int,
                                database_connection: mysql.connector.connect,
@@ -25,62 +41,35 @@ def retrieve_appearances_by_id(guest_id: int,
         been validated
     """
     if not pre_validated_id:
-        valid_id = utility.validate_id(guest_id, database_connection)
-        if not valid_id:
+        try:
+            int(guest_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT ( "
-                 "SELECT COUNT(gm.showid) FROM ww_showguestmap gm "
-                 "JOIN ww_shows s ON s.showid = gm.showid "
-                 "WHERE s.bestof = 0 AND s.repeatshowid IS NULL AND "
-                 "gm.guestid = %s ) AS regular, ( "
-                 "SELECT COUNT(gm.showid) FROM ww_showguestmap gm "
-                 "JOIN ww_shows s ON s.showid = gm.showid "
-                 "WHERE gm.guestid = %s ) AS allshows;")
-        cursor.execute(query, (guest_id, guest_id,))
-        result = cursor.fetchone()
-
-        appearance_info = OrderedDict()
-        appearance_counts = OrderedDict()
-        appearance_counts["regular_shows"] = result["regular"]
-        appearance_counts["all_shows"] = result["allshows"]
-
-        query = ("SELECT gm.showid, s.showdate, s.bestof, s.repeatshowid, "
-                 "gm.guestscore, gm.exception FROM ww_showguestmap gm "
-                 "JOIN ww_guests g ON g.guestid = gm.guestid "
-                 "JOIN ww_shows s ON s.showid = gm.showid "
-                 "WHERE gm.guestid = %s "
+        query = ("SELECT g.guestid, gm.showid, s.showdate, s.bestof, "
+                 "s.repeatshowid, gm.guestscore, gm.exception "
+                 "FROM ww_guests g "
+                 "LEFT JOIN (ww_showguestmap gm "
+                 "JOIN ww_shows s ON s.showid = gm.showid) "
+                 "ON gm.guestid = g.guestid "
+                 "WHERE g.guestid = %s "
                  "ORDER BY s.showdate ASC;")
-        cursor.execute(query, (guest_id,))
-        result = cursor.fetchall()
-        cursor.close()
-
-        if result:
-            appearances = []
-            for appearance in result:
-                info = OrderedDict()
-                info["show_id"] = appearance["showid"]
-                info["date"] = appearance["showdate"].isoformat()
-                info["best_of"] = bool(appearance["bestof"])
-                info["repeat_show"] = bool(appearance["repeatshowid"])
-                info["score"] = appearance["guestscore"]
-                info["score_exception"] = bool(appearance["exception"])
-                appearances.append(info)
-
-            appearance_info["count"] = appearance_counts
-            appearance_info["shows"] = appearances
-        else:
-            appearance_info["count"] = 0
-            appearance_info["shows"] = None
-
-        return appearance_info
+        result = executor.fetch_all(database_connection, query, (guest_id,),
+                                    dictionary=True)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+    if not pre_validated_id and not result:
+        return None
+
+    # Appearance counts are derived from the same rows as the list of
+    # appearances
+    appearances = [row for row in result if row["showid"] is not None]
+    return showmap.build_appearances(appearances, _build_appearance)
+
 def retrieve_appearances_by_slug(guest_slug: str,
                                  database_connection: mysql.connector.connect
                                  ) -> List[Dict]:
@@ -97,4 +86,56 @@ def retrieve_appearances_by_slug(guest_slug: str,
 
     return None
 
+def _retrieve_appearances(database_connection: mysql.connector.connect,
+                          guest_ids: List[int] = None) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing appearance
+    information for all guests or the requested guest IDs, keyed by
+    guest ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        guest_ids (List[int]): List of guest IDs to retrieve. All guests
+        are retrieved if no list is provided.
+    """
+    if guest_ids is not None and not guest_ids:
+        return {}
+
+    query = ("SELECT g.guestid, gm.showid, s.showdate, s.bestof, "
+             "s.repeatshowid, gm.guestscore, gm.exception "
+             "FROM ww_guests g "
+             "LEFT JOIN (ww_showguestmap gm "
+             "JOIN ww_shows s ON s.showid = gm.showid) "
+             "ON gm.guestid = g.guestid ")
+    if guest_ids:
+        query += "WHERE g.guestid IN ({}) ".format(
+            ", ".join(["%s"] * len(guest_ids)))
+    query += "ORDER BY g.guestid ASC, s.showdate ASC;"
+    return showmap.retrieve_grouped(
+        database_connection, query, "guestid",
+        lambda rows: showmap.build_appearances(rows, _build_appearance),
+        tuple(guest_ids) if guest_ids else None, prepared=False)
+
+def retrieve_appearances_all(database_connection: mysql.connector.connect
+                            ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing appearance
+    information for all guests, keyed by guest ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_appearances(database_connection)
+
+def retrieve_appearances_by_ids(guest_ids: List[int],
+                                database_connection: mysql.connector.connect
+                               ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing appearance
+    information for the requested guest IDs, keyed by guest ID. Guest
+    IDs that do not exist are not included.
+
+    Arguments:
+        guest_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_appearances(database_connection, list(guest_ids))
+
 #endregion
@@ -5,11 +5,14 @@
 the Wait Wait... Don't Tell Me! Stats Page Database.
 """
 
-from typing import List, Dict
+from collections import OrderedDict
+from typing import List, Dict, Iterator
 import mysql.connector
+from wwdtm import cache, records, streaming
 from wwdtm.guest import core, info, utility
 
 #region Retrieval Functions
+@cache.cached("guest")
 def retrieve_by_id(guest_id: int,
                    database_connection: mysql.connector.connect,
                    pre_validated_id: bool = False) -> Dict:
@@ -22,18 +25,18 @@ def retrieve_by_id(guest_id: int,
         pre_validated_id (bool): Flag whether or not the guest ID has
         been validated
     """
-    if not pre_validated_id:
-        if not utility.validate_id(guest_id, database_connection):
-            return None
-
     guest = info.retrieve_by_id(guest_id,
                                 database_connection,
-                                pre_validated_id=True)
+                                pre_validated_id=pre_validated_id)
+    if not guest:
+        return None
+
     guest["appearances"] = core.retrieve_appearances_by_id(guest_id,
                                                            database_connection,
                                                            pre_validated_id=True)
     return guest
 
+@cache.cached("guest")
 def retrieve_by_slug(guest_slug: str,
                      database_connection: mysql.connector.connect
                     ) -> Dict:
@@ -54,25 +57,90 @@ def retrieve_by_slug(guest_slug: str,
 
     return None
 
-def retrieve_all(database_connection: mysql.connector.connection
-                ) -> List[Dict]:
+def retrieve_all(database_connection: mysql.connector.connection,
+                 return_type: str = "dict") -> List[Dict]:
     """Returns a list of OrderedDict with guest details for all guests
 
     Arguments:
         database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Guest records
     """
-    guest_ids = info.retrieve_all_ids(database_connection)
-    if not guest_ids:
+    records.validate_return_type(return_type)
+
+    guests = info.retrieve_all(database_connection)
+    if not guests:
         return None
 
-    guests = []
+    # Retrieve the appearances for all guests with one query and attach
+    # them to the guest information
+    appearances = core.retrieve_appearances_all(database_connection)
+    for guest in guests:
+        guest["appearances"] = appearances.get(guest["id"])
+
+    return records.convert_list(guests, records.Guest, return_type)
+
+def retrieve_by_ids(guest_ids: List[int],
+                    database_connection: mysql.connector.connect,
+                    return_type: str = "dict") -> List[Dict]:
+    """Returns a list of OrderedDicts with guest details for the
+    requested guest IDs, in the order the guest IDs were requested.
+    Invalid or unknown guest IDs are skipped.
+
+    Arguments:
+        guest_ids (List[int])
+        database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Guest records
+    """
+    records.validate_return_type(return_type)
+
+    valid_ids = []
     for guest_id in guest_ids:
-        guest_details = retrieve_by_id(guest_id,
-                                       database_connection,
-                                       pre_validated_id=True)
-        if guest_details:
-            guests.append(guest_details)
+        try:
+            valid_ids.append(int(guest_id))
+        except (TypeError, ValueError):
+            continue
 
-    return guests
+    if not valid_ids:
+        return None
+
+    query_ids = list(OrderedDict.fromkeys(valid_ids))
+    guests = info.retrieve_by_ids(query_ids, database_connection)
+    appearances = core.retrieve_appearances_by_ids(query_ids,
+                                                   database_connection)
+    guests_info = {guest["id"]: guest for guest in guests}
+
+    guests_details = []
+    for guest_id in valid_ids:
+        guest = guests_info.get(guest_id)
+        if guest:
+            guest["appearances"] = appearances.get(guest_id)
+            guests_details.append(guest)
+
+    return records.convert_list(guests_details, records.Guest, return_type)
+
+def iter_all(database_connection: mysql.connector.connect,
+             batch_size: int = streaming.DEFAULT_BATCH_SIZE,
+             return_type: str = "dict") -> Iterator[Dict]:
+    """Returns an iterator that yields OrderedDicts with guest details
+    for all guests, in the same order as retrieve_all. Details are
+    retrieved for batch_size guests at a time, so only one batch is held
+    in memory.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        batch_size (int): Number of guests to retrieve at a time
+        return_type (str): Either "dict" to yield OrderedDicts or
+        "record" to yield wwdtm.records.Guest records
+    """
+    records.validate_return_type(return_type)
+
+    guest_ids = info.retrieve_all_ids(database_connection)
+    return streaming.iter_by_ids(
+        guest_ids,
+        lambda batch_ids: retrieve_by_ids(batch_ids, database_connection,
+                                          return_type),
+        batch_size)
 
 #endregion
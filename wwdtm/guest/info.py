@@ -10,24 +10,28 @@ from typing import List, Dict
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
 from slugify import slugify
+from wwdtm import cache, executor, records
 from wwdtm.guest import utility
 
 #region Retrieval Functions
-def retrieve_all(database_connection: mysql.connector.connect) -> List[Dict]:
+def retrieve_all(database_connection: mysql.connector.connect,
+                 return_type: str = "dict") -> List[Dict]:
     """Returns a list of OrderedDicts containing guest information for
     all guests
 
     Arguments:
         database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Guest records
     """
+    records.validate_return_type(return_type)
+
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT guestid, guest, guestslug FROM ww_guests "
                  "WHERE guestslug != 'none' "
                  "ORDER BY guest ASC;")
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query,
+                                    dictionary=True)
 
         guests = []
         for row in result:
@@ -41,7 +45,7 @@ def retrieve_all(database_connection: mysql.connector.connect) -> List[Dict]:
 
             guests.append(guest)
 
-        return guests
+        return records.convert_list(guests, records.Guest, return_type)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
@@ -55,12 +59,9 @@ def retrieve_all_ids(database_connection: mysql.connector.connect
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT guestid FROM ww_guests WHERE guestslug != 'none' "
                  "ORDER BY guest ASC;")
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query)
 
         guest = []
         for row in result:
@@ -72,6 +73,7 @@ def retrieve_all_ids(database_connection: mysql.connector.connect
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+@cache.cached("guest")
 def retrieve_by_id(guest_id: int,
                    database_connection: mysql.connector.connect,
                    pre_validated_id: bool = False) -> Dict:
@@ -85,15 +87,15 @@ def retrieve_by_id(guest_id: int,
         been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(guest_id, database_connection):
+        try:
+            int(guest_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT guest, guestslug FROM ww_guests WHERE guestid = %s;")
-        cursor.execute(query, (guest_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (guest_id,),
+                                    dictionary=True)
 
         if result:
             guest_info = OrderedDict()
@@ -112,6 +114,48 @@ def retrieve_by_id(guest_id: int,
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+def retrieve_by_ids(guest_ids: List[int],
+                    database_connection: mysql.connector.connect
+                   ) -> List[Dict]:
+    """Returns a list of OrderedDicts with guest information for the
+    requested guest IDs, in the order the IDs were requested. Unknown
+    guest IDs are skipped.
+
+    Arguments:
+        guest_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    if not guest_ids:
+        return []
+
+    try:
+        placeholders = ", ".join(["%s"] * len(guest_ids))
+        query = ("SELECT guestid, guest, guestslug FROM ww_guests "
+                 "WHERE guestid IN ({});".format(placeholders))
+        result = executor.fetch_all(database_connection, query,
+                                    tuple(guest_ids), dictionary=True,
+                                    prepared=False)
+
+        guests_info = {}
+        for row in result:
+            guest_info = OrderedDict()
+            guest_info["id"] = row["guestid"]
+            guest_info["name"] = row["guest"]
+            if row["guestslug"]:
+                guest_info["slug"] = row["guestslug"]
+            else:
+                guest_info["slug"] = slugify(guest_info["name"])
+
+            guests_info[row["guestid"]] = guest_info
+
+        return [guests_info[guest_id] for guest_id in guest_ids
+                if guest_id in guests_info]
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+@cache.cached("guest")
 def retrieve_by_slug(guest_slug: str,
                      database_connection: mysql.connector.connect) -> Dict:
     """Returns an OrderedDict with guest information based on the
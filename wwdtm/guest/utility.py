@@ -7,6 +7,7 @@ information from the Wait Wait... Don't Tell Me! Stats Page Database.
 
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import executor, slug_index
 
 #region Utility Functions
 def convert_slug_to_id(guest_slug: str,
@@ -17,12 +18,13 @@ def convert_slug_to_id(guest_slug: str,
         guest_slug (str)
         database_connect (mysql.connector.connect)
     """
+    index = slug_index.get_index("guest", database_connection)
+    if index is not None:
+        return index.id_for_slug(guest_slug)
+
     try:
-        cursor = database_connection.cursor()
         query = "SELECT guestid FROM ww_guests WHERE guestslug = %s;"
-        cursor.execute(query, (guest_slug,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (guest_slug,))
 
         if result:
             return result[0]
@@ -46,12 +48,13 @@ def validate_id(guest_id: int,
     except ValueError:
         return False
 
+    index = slug_index.get_index("guest", database_connection)
+    if index is not None:
+        return index.has_id(guest_id)
+
     try:
-        cursor = database_connection.cursor()
         query = "SELECT guestid FROM ww_guests WHERE guestid = %s;"
-        cursor.execute(query, (guest_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (guest_id,))
 
         return bool(result)
     except ProgrammingError as err:
@@ -72,12 +75,13 @@ def validate_slug(guest_slug: str,
     if not guest_slug:
         return False
 
+    index = slug_index.get_index("guest", database_connection)
+    if index is not None:
+        return index.has_slug(guest_slug)
+
     try:
-        cursor = database_connection.cursor()
         query = "SELECT guestslug FROM ww_guests WHERE guestslug = %s;"
-        cursor.execute(query, (guest_slug,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (guest_slug,))
 
         return bool(result)
     except ProgrammingError as err:
@@ -5,13 +5,25 @@
 information from the Wait Wait... Don't Tell Me! Stats Page Database.
 """
 
-from collections import OrderedDict
 from typing import List, Dict
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import executor, showmap
 from wwdtm.host import utility
 
 #region Internal Functions
+def _build_appearance(appearance: Dict) -> Dict:
+    """Returns an OrderedDict containing show information for a
+    host appearance row
+
+    Arguments:
+        appearance (Dict): Row containing showid, showdate, bestof,
+        repeatshowid and guest values
+    """
+    info = showmap.build_show_info(appearance)
+    info["guest"] = bool(appearance["guest"])
+    return info
+
 def retrieve_appearances_by_id(host_id: int,
                                database_connection: mysql.connector.connect,
                                pre_validated_id: bool = False) -> List[Dict]:
@@ -25,60 +37,35 @@ def retrieve_appearances_by_id(host_id: int,
         been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(host_id, database_connection):
+        try:
+            int(host_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT ( "
-                 "SELECT COUNT(hm.showid) FROM ww_showhostmap hm "
-                 "JOIN ww_shows s ON s.showid = hm.showid "
-                 "WHERE s.bestof = 0 AND s.repeatshowid IS NULL AND "
-                 "hm.hostid = %s ) AS regular, ( "
-                 "SELECT COUNT(hm.showid) FROM ww_showhostmap hm "
-                 "JOIN ww_shows s ON s.showid = hm.showid "
-                 "WHERE hm.hostid = %s ) AS allshows;")
-        cursor.execute(query, (host_id, host_id,))
-        result = cursor.fetchone()
-
-        appearance_info = OrderedDict()
-        appearance_counts = OrderedDict()
-        appearance_counts["regular_shows"] = result["regular"]
-        appearance_counts["all_shows"] = result["allshows"]
-
-        query = ("SELECT hm.showid, s.showdate, s.bestof, s.repeatshowid, "
-                 "hm.guest FROM ww_showhostmap hm "
-                 "JOIN ww_hosts h ON h.hostid = hm.hostid "
-                 "JOIN ww_shows s ON s.showid = hm.showid "
-                 "WHERE hm.hostid = %s "
+        query = ("SELECT h.hostid, hm.showid, s.showdate, s.bestof, "
+                 "s.repeatshowid, hm.guest "
+                 "FROM ww_hosts h "
+                 "LEFT JOIN (ww_showhostmap hm "
+                 "JOIN ww_shows s ON s.showid = hm.showid) "
+                 "ON hm.hostid = h.hostid "
+                 "WHERE h.hostid = %s "
                  "ORDER BY s.showdate ASC;")
-        cursor.execute(query, (host_id,))
-        result = cursor.fetchall()
-        cursor.close()
-
-        if result:
-            appearances = []
-            for appearance in result:
-                info = OrderedDict()
-                info["show_id"] = appearance["showid"]
-                info["date"] = appearance["showdate"].isoformat()
-                info["best_of"] = bool(appearance["bestof"])
-                info["repeat_show"] = bool(appearance["repeatshowid"])
-                info["guest"] = bool(appearance["guest"])
-                appearances.append(info)
-
-            appearance_info["count"] = appearance_counts
-            appearance_info["shows"] = appearances
-        else:
-            appearance_info["count"] = 0
-            appearance_info["shows"] = None
-
-        return appearance_info
+        result = executor.fetch_all(database_connection, query, (host_id,),
+                                    dictionary=True)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+    if not pre_validated_id and not result:
+        return None
+
+    # Appearance counts are derived from the same rows as the list of
+    # appearances
+    appearances = [row for row in result if row["showid"] is not None]
+    return showmap.build_appearances(appearances, _build_appearance)
+
 def retrieve_appearances_by_slug(host_slug: str,
                                  database_connection: mysql.connector.connect
                                  ) -> List[Dict]:
@@ -95,4 +82,56 @@ def retrieve_appearances_by_slug(host_slug: str,
 
     return None
 
+def _retrieve_appearances(database_connection: mysql.connector.connect,
+                          host_ids: List[int] = None) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing appearance
+    information for all hosts or the requested host IDs, keyed by host
+    ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        host_ids (List[int]): List of host IDs to retrieve. All hosts
+        are retrieved if no list is provided.
+    """
+    if host_ids is not None and not host_ids:
+        return {}
+
+    query = ("SELECT h.hostid, hm.showid, s.showdate, s.bestof, "
+             "s.repeatshowid, hm.guest "
+             "FROM ww_hosts h "
+             "LEFT JOIN (ww_showhostmap hm "
+             "JOIN ww_shows s ON s.showid = hm.showid) "
+             "ON hm.hostid = h.hostid ")
+    if host_ids:
+        query += "WHERE h.hostid IN ({}) ".format(
+            ", ".join(["%s"] * len(host_ids)))
+    query += "ORDER BY h.hostid ASC, s.showdate ASC;"
+    return showmap.retrieve_grouped(
+        database_connection, query, "hostid",
+        lambda rows: showmap.build_appearances(rows, _build_appearance),
+        tuple(host_ids) if host_ids else None, prepared=False)
+
+def retrieve_appearances_all(database_connection: mysql.connector.connect
+                            ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing appearance
+    information for all hosts, keyed by host ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_appearances(database_connection)
+
+def retrieve_appearances_by_ids(host_ids: List[int],
+                                database_connection: mysql.connector.connect
+                               ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing appearance
+    information for the requested host IDs, keyed by host ID. Host IDs
+    that do not exist are not included.
+
+    Arguments:
+        host_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_appearances(database_connection, list(host_ids))
+
 #endregion
@@ -5,11 +5,14 @@
 the Wait Wait... Don't Tell Me! Stats Page Database.
 """
 
-from typing import List, Dict
+from collections import OrderedDict
+from typing import List, Dict, Iterator
 import mysql.connector
+from wwdtm import cache, records, streaming
 from wwdtm.host import core, info, utility
 
 #region Retrieval Functions
+@cache.cached("host")
 def retrieve_by_id(host_id: int,
                    database_connection: mysql.connector.connect,
                    pre_validated_id: bool = False) -> Dict:
@@ -22,18 +25,18 @@ def retrieve_by_id(host_id: int,
         pre_validated_id (bool): Flag whether or not the host ID has
         been validated
     """
-    if not pre_validated_id:
-        if not utility.validate_id(host_id, database_connection):
-            return None
-
     host = info.retrieve_by_id(host_id,
                                database_connection,
-                               pre_validated_id=True)
+                               pre_validated_id=pre_validated_id)
+    if not host:
+        return None
+
     host["appearances"] = core.retrieve_appearances_by_id(host_id,
                                                           database_connection,
                                                           pre_validated_id=True)
     return host
 
+@cache.cached("host")
 def retrieve_by_slug(host_slug: str,
                      database_connection: mysql.connector.connect
                     ) -> Dict:
@@ -52,25 +55,92 @@ def retrieve_by_slug(host_slug: str,
 
     return None
 
-def retrieve_all(database_connection: mysql.connector.connect
-                ) -> List[Dict]:
+def retrieve_all(database_connection: mysql.connector.connect,
+                 return_type: str = "dict") -> List[Dict]:
     """Returns a list of OrderedDicts with host details for all hosts
 
     Arguments:
         database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Host records
     """
+    records.validate_return_type(return_type)
+
     host_ids = info.retrieve_all_ids(database_connection)
     if not host_ids:
         return None
 
-    hosts = []
+    hosts = info.retrieve_by_ids(host_ids, database_connection)
+
+    # Retrieve the appearances for all hosts with one query and attach
+    # them to the host information
+    appearances = core.retrieve_appearances_all(database_connection)
+    for host in hosts:
+        host["appearances"] = appearances.get(host["id"])
+
+    return records.convert_list(hosts, records.Host, return_type)
+
+def retrieve_by_ids(host_ids: List[int],
+                    database_connection: mysql.connector.connect,
+                    return_type: str = "dict") -> List[Dict]:
+    """Returns a list of OrderedDicts with host details for the
+    requested host IDs, in the order the host IDs were requested.
+    Invalid or unknown host IDs are skipped.
+
+    Arguments:
+        host_ids (List[int])
+        database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Host records
+    """
+    records.validate_return_type(return_type)
+
+    valid_ids = []
     for host_id in host_ids:
-        host = retrieve_by_id(host_id,
-                              database_connection,
-                              pre_validated_id=True)
+        try:
+            valid_ids.append(int(host_id))
+        except (TypeError, ValueError):
+            continue
+
+    if not valid_ids:
+        return None
+
+    query_ids = list(OrderedDict.fromkeys(valid_ids))
+    hosts = info.retrieve_by_ids(query_ids, database_connection)
+    appearances = core.retrieve_appearances_by_ids(query_ids,
+                                                   database_connection)
+    hosts_info = {host["id"]: host for host in hosts}
+
+    hosts_details = []
+    for host_id in valid_ids:
+        host = hosts_info.get(host_id)
         if host:
-            hosts.append(host)
+            host["appearances"] = appearances.get(host_id)
+            hosts_details.append(host)
+
+    return records.convert_list(hosts_details, records.Host, return_type)
 
-    return hosts
+def iter_all(database_connection: mysql.connector.connect,
+             batch_size: int = streaming.DEFAULT_BATCH_SIZE,
+             return_type: str = "dict") -> Iterator[Dict]:
+    """Returns an iterator that yields OrderedDicts with host details
+    for all hosts, in the same order as retrieve_all. Details are
+    retrieved for batch_size hosts at a time, so only one batch is held
+    in memory.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        batch_size (int): Number of hosts to retrieve at a time
+        return_type (str): Either "dict" to yield OrderedDicts or
+        "record" to yield wwdtm.records.Host records
+    """
+    records.validate_return_type(return_type)
+
+    host_ids = info.retrieve_all_ids(database_connection)
+    return streaming.iter_by_ids(
+        host_ids,
+        lambda batch_ids: retrieve_by_ids(batch_ids, database_connection,
+                                          return_type),
+        batch_size)
 
 #endregion
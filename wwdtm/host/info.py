@@ -10,23 +10,27 @@ from typing import List, Dict
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
 from slugify import slugify
+from wwdtm import cache, executor, records
 from wwdtm.host import utility
 
 #region Retrieval Functions
-def retrieve_all(database_connection: mysql.connector.connect) -> List[Dict]:
+def retrieve_all(database_connection: mysql.connector.connect,
+                 return_type: str = "dict") -> List[Dict]:
     """Returns a list of OrderedDicts containing host information for
     all hosts
 
     Arguments:
         database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Host records
     """
+    records.validate_return_type(return_type)
+
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT hostid, host, hostslug, hostgender FROM ww_hosts "
                  "WHERE hostslug != 'tbd' ORDER BY host ASC;")
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query,
+                                    dictionary=True)
 
         hosts = []
         for row in result:
@@ -41,7 +45,7 @@ def retrieve_all(database_connection: mysql.connector.connect) -> List[Dict]:
             host["gender"] = row["hostgender"]
             hosts.append(host)
 
-        return hosts
+        return records.convert_list(hosts, records.Host, return_type)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
@@ -55,12 +59,9 @@ def retrieve_all_ids(database_connection: mysql.connector.connect
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT hostid FROM ww_hosts WHERE hostslug != 'none' "
                  "ORDER BY host ASC;")
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query)
 
         panelists = []
         for row in result:
@@ -72,6 +73,7 @@ def retrieve_all_ids(database_connection: mysql.connector.connect
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+@cache.cached("host")
 def retrieve_by_id(host_id: int,
                    database_connection: mysql.connector.connect,
                    pre_validated_id: bool = False) -> Dict:
@@ -85,16 +87,16 @@ def retrieve_by_id(host_id: int,
         been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(host_id, database_connection):
+        try:
+            int(host_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT host, hostslug, hostgender FROM ww_hosts "
                  "WHERE hostid = %s;")
-        cursor.execute(query, (host_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (host_id,),
+                                    dictionary=True)
 
         if result:
             host_info = OrderedDict()
@@ -114,6 +116,49 @@ def retrieve_by_id(host_id: int,
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+def retrieve_by_ids(host_ids: List[int],
+                    database_connection: mysql.connector.connect
+                   ) -> List[Dict]:
+    """Returns a list of OrderedDicts with host information for the
+    requested host IDs, in the order the host IDs were requested.
+    Unknown host IDs are skipped.
+
+    Arguments:
+        host_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    if not host_ids:
+        return []
+
+    try:
+        placeholders = ", ".join(["%s"] * len(host_ids))
+        query = ("SELECT hostid, host, hostslug, hostgender FROM ww_hosts "
+                 "WHERE hostid IN ({});".format(placeholders))
+        result = executor.fetch_all(database_connection, query,
+                                    tuple(host_ids), dictionary=True,
+                                    prepared=False)
+
+        hosts_info = {}
+        for row in result:
+            host_info = OrderedDict()
+            host_info["id"] = row["hostid"]
+            host_info["name"] = row["host"]
+            if row["hostslug"]:
+                host_info["slug"] = row["hostslug"]
+            else:
+                host_info["slug"] = slugify(host_info["name"])
+
+            host_info["gender"] = row["hostgender"]
+            hosts_info[row["hostid"]] = host_info
+
+        return [hosts_info[host_id] for host_id in host_ids
+                if host_id in hosts_info]
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+@cache.cached("host")
 def retrieve_by_slug(host_slug: str,
                      database_connection: mysql.connector.connect) -> Dict:
     """Returns an OrderedDict with host information based on the
@@ -7,6 +7,7 @@ from the Wait Wait... Don't Tell Me! Stats Page Database.
 
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import executor, slug_index
 
 #region Utility Functions
 def convert_slug_to_id(host_slug: str,
@@ -17,12 +18,13 @@ def convert_slug_to_id(host_slug: str,
         host_slug (str)
         database_connect (mysql.connector.connect)
     """
+    index = slug_index.get_index("host", database_connection)
+    if index is not None:
+        return index.id_for_slug(host_slug)
+
     try:
-        cursor = database_connection.cursor()
         query = "SELECT hostid FROM ww_hosts WHERE hostslug = %s;"
-        cursor.execute(query, (host_slug,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (host_slug,))
 
         if result:
             return result[0]
@@ -47,12 +49,13 @@ def validate_id(host_id: int,
     except ValueError:
         return False
 
+    index = slug_index.get_index("host", database_connection)
+    if index is not None:
+        return index.has_id(host_id)
+
     try:
-        cursor = database_connection.cursor()
         query = "SELECT hostid FROM ww_hosts WHERE hostid = %s;"
-        cursor.execute(query, (host_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (host_id,))
 
         return bool(result)
     except ProgrammingError as err:
@@ -73,12 +76,13 @@ def validate_slug(host_slug: str,
     if not host_slug:
         return False
 
+    index = slug_index.get_index("host", database_connection)
+    if index is not None:
+        return index.has_slug(host_slug)
+
     try:
-        cursor = database_connection.cursor()
         query = "SELECT hostslug FROM ww_hosts WHERE hostslug = %s;"
-        cursor.execute(query, (host_slug,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (host_slug,))
 
         return bool(result)
     except ProgrammingError as err:
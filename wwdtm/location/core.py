@@ -6,12 +6,27 @@ information from the Wait Wait... Don't Tell Me! Stats Page Database.
 """
 
 from collections import OrderedDict
-from typing import Dict
+from typing import Dict, List
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
-from wwdtm.location import utility
+from wwdtm import executor, showmap
 
 #region Internal Functions
+def _build_recordings(recordings: List[Dict]) -> Dict:
+    """Returns an OrderedDict containing recording counts and a list of
+    recordings built from a list of location recording rows, sorted by
+    show date
+
+    Arguments:
+        recordings (List[Dict]): Rows containing showid, showdate,
+        bestof and repeatshowid values
+    """
+    location_recordings = OrderedDict()
+    location_recordings["count"] = showmap.build_show_counts(recordings)
+    location_recordings["shows"] = [showmap.build_show_info(recording)
+                                    for recording in recordings]
+    return location_recordings
+
 def retrieve_recordings_by_id(location_id: int,
                               database_connection: mysql.connector.connect,
                               pre_validated_id: bool = False) -> Dict:
@@ -25,54 +40,80 @@ def retrieve_recordings_by_id(location_id: int,
         has been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(location_id, database_connection):
+        try:
+            int(location_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT ( "
-                 "SELECT COUNT(lm.showid) FROM ww_showlocationmap lm "
-                 "JOIN ww_shows s ON s.showid = lm.showid "
-                 "WHERE s.bestof = 0 AND s.repeatshowid IS NULL AND "
-                 "lm.locationid = %s ) AS regular, ( "
-                 "SELECT COUNT(lm.showid) FROM ww_showlocationmap lm "
-                 "JOIN ww_shows s ON s.showid = lm.showid "
-                 "WHERE lm.locationid = %s ) AS allshows;")
-        cursor.execute(query, (location_id, location_id,))
-        result = cursor.fetchone()
-
-        recordings = OrderedDict()
-        recordings["count"] = OrderedDict()
-        recordings["count"]["regular_shows"] = result["regular"]
-        recordings["count"]["all_shows"] = result["allshows"]
-
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT lm.showid, s.showdate, s.bestof, s.repeatshowid "
                  "FROM ww_showlocationmap lm "
                  "JOIN ww_shows s ON s.showid = lm.showid "
                  "WHERE lm.locationid = %s "
                  "ORDER BY s.showdate ASC;")
-        cursor.execute(query, (location_id,))
-        result = cursor.fetchall()
-        cursor.close()
-
-        if not result:
-            return None
-
-        shows = []
-        for recording in result:
-            info = OrderedDict()
-            info["show_id"] = recording["showid"]
-            info["date"] = recording["showdate"].isoformat()
-            info["best_of"] = bool(recording["bestof"])
-            info["repeat_show"] = bool(recording["repeatshowid"])
-            shows.append(info)
-
-        recordings["shows"] = shows
-        return recordings
+        result = executor.fetch_all(database_connection, query, (location_id,),
+                                    dictionary=True)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+    if not result:
+        return None
+
+    # Recording counts are derived from the same rows as the list of
+    # recordings
+    return _build_recordings(result)
+
+def _retrieve_recordings(database_connection: mysql.connector.connect,
+                         location_ids: List[int] = None) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing recording
+    information for all locations or the requested location IDs with at
+    least one recording, keyed by location ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        location_ids (List[int]): List of location IDs to retrieve. All
+        locations are retrieved if no list is provided.
+    """
+    if location_ids is not None and not location_ids:
+        return {}
+
+    query = ("SELECT lm.locationid, lm.showid, s.showdate, s.bestof, "
+             "s.repeatshowid FROM ww_showlocationmap lm "
+             "JOIN ww_shows s ON s.showid = lm.showid ")
+    if location_ids:
+        query += "WHERE lm.locationid IN ({}) ".format(
+            ", ".join(["%s"] * len(location_ids)))
+    query += "ORDER BY lm.locationid ASC, s.showdate ASC;"
+    return showmap.retrieve_grouped(database_connection, query, "locationid",
+                                    _build_recordings,
+                                    tuple(location_ids) if location_ids
+                                    else None,
+                                    prepared=False)
+
+def retrieve_recordings_all(database_connection: mysql.connector.connect
+                           ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing recording
+    information for all locations with at least one recording, keyed by
+    location ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_recordings(database_connection)
+
+def retrieve_recordings_by_ids(location_ids: List[int],
+                               database_connection: mysql.connector.connect
+                              ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing recording
+    information for the requested location IDs with at least one
+    recording, keyed by location ID
+
+    Arguments:
+        location_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_recordings(database_connection, list(location_ids))
+
 #endregion
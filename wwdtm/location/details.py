@@ -5,11 +5,14 @@
 the Wait Wait... Don't Tell Me! Stats Page Database.
 """
 
-from typing import List, Dict
+from collections import OrderedDict
+from typing import List, Dict, Iterator
 import mysql.connector
+from wwdtm import cache, records, streaming
 from wwdtm.location import core, info, utility
 
 #region Retrieval Functions
+@cache.cached("location")
 def retrieve_recordings_by_id(location_id: int,
                               database_connection: mysql.connector.connect,
                               pre_validated_id: bool = False) -> Dict:
@@ -22,19 +25,19 @@ def retrieve_recordings_by_id(location_id: int,
         pre_validated_id (bool): Flag whether or not the location ID
         has been validated
     """
-    if not pre_validated_id:
-        if not utility.validate_id(location_id, database_connection):
-            return None
-
     location = info.retrieve_by_id(location_id,
                                    database_connection,
-                                   pre_validated_id=True)
+                                   pre_validated_id=pre_validated_id)
+    if not location:
+        return None
+
     recordings = core.retrieve_recordings_by_id(location_id,
                                                 database_connection,
                                                 pre_validated_id=True)
     location["recordings"] = recordings
     return location
 
+@cache.cached("location")
 def retrieve_recordings_by_slug(location_slug: str,
                                 database_connection: mysql.connector.connect
                                ) -> Dict:
@@ -55,29 +58,102 @@ def retrieve_recordings_by_slug(location_slug: str,
 
 def retrieve_all_recordings(database_connection: mysql.connector.connect,
                             sort_by_venue: bool = False,
-                           ) -> List[Dict]:
+                            return_type: str = "dict") -> List[Dict]:
     """Returns a list of OrderedDicts with location information and
     recordings based on location ID
 
     Arguments:
         database_connection (mysql.connector.connect): Database connect
         object
+        sort_by_venue (bool): Sort locations by venue, then city, then
+        state instead of by state, then city, then venue
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Location records
     Returns:
         list[OrderedDict]: Returns a list of OrderedDicts containing
         location city, state, venue and recordings
     """
-    location_ids = info.retrieve_all_ids(database_connection, sort_by_venue)
-    if not location_ids:
+    records.validate_return_type(return_type)
+
+    locations = info.retrieve_all(database_connection, sort_by_venue)
+    if not locations:
         return None
 
-    locations = []
+    # Retrieve the recordings for all locations with one query and
+    # attach them to the location information, which is already sorted
+    recordings = core.retrieve_recordings_all(database_connection)
+    for location in locations:
+        location["recordings"] = recordings.get(location["id"])
+
+    return records.convert_list(locations, records.Location, return_type)
+
+def retrieve_recordings_by_ids(location_ids: List[int],
+                               database_connection: mysql.connector.connect,
+                               return_type: str = "dict") -> List[Dict]:
+    """Returns a list of OrderedDicts with location information and
+    recordings for the requested location IDs, in the order the
+    location IDs were requested. Invalid or unknown location IDs are
+    skipped.
+
+    Arguments:
+        location_ids (List[int])
+        database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Location records
+    """
+    records.validate_return_type(return_type)
+
+    valid_ids = []
     for location_id in location_ids:
-        location = retrieve_recordings_by_id(location_id,
-                                             database_connection,
-                                             pre_validated_id=True)
+        try:
+            valid_ids.append(int(location_id))
+        except (TypeError, ValueError):
+            continue
+
+    if not valid_ids:
+        return None
+
+    query_ids = list(OrderedDict.fromkeys(valid_ids))
+    locations = info.retrieve_by_ids(query_ids, database_connection)
+    recordings = core.retrieve_recordings_by_ids(query_ids,
+                                                 database_connection)
+    locations_info = {location["id"]: location for location in locations}
+
+    locations_details = []
+    for location_id in valid_ids:
+        location = locations_info.get(location_id)
         if location:
-            locations.append(location)
+            location["recordings"] = recordings.get(location_id)
+            locations_details.append(location)
+
+    return records.convert_list(locations_details, records.Location,
+                                return_type)
 
-    return locations
+def iter_all_recordings(database_connection: mysql.connector.connect,
+                        sort_by_venue: bool = False,
+                        batch_size: int = streaming.DEFAULT_BATCH_SIZE,
+                        return_type: str = "dict") -> Iterator[Dict]:
+    """Returns an iterator that yields OrderedDicts with location
+    information and recordings for all locations, in the same order as
+    retrieve_all_recordings. Recordings are retrieved for batch_size
+    locations at a time, so only one batch is held in memory.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        sort_by_venue (bool): Sort locations by venue, then city, then
+        state instead of by state, then city, then venue
+        batch_size (int): Number of locations to retrieve at a time
+        return_type (str): Either "dict" to yield OrderedDicts or
+        "record" to yield wwdtm.records.Location records
+    """
+    records.validate_return_type(return_type)
+
+    location_ids = info.retrieve_all_ids(database_connection, sort_by_venue)
+    return streaming.iter_by_ids(
+        location_ids,
+        lambda batch_ids: retrieve_recordings_by_ids(batch_ids,
+                                                     database_connection,
+                                                     return_type),
+        batch_size)
 
 #endregion
@@ -9,20 +9,25 @@ from collections import OrderedDict
 from typing import List, Dict
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import cache, executor, records
 from wwdtm.location import utility
 
 #region Retrieval Functions
 def retrieve_all(database_connection: mysql.connector.connect,
-                 sort_by_venue: bool = False) -> List[Dict]:
+                 sort_by_venue: bool = False,
+                 return_type: str = "dict") -> List[Dict]:
     """Returns a list of OrderedDicts with location information for all
     locations, ordered by state, then city, then venue
 
     Arguments:
         location_id (int)
         database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Location records
     """
+    records.validate_return_type(return_type)
+
     try:
-        cursor = database_connection.cursor(dictionary=True)
         # Exclude any entries that are considered to be fully TBD
         query = ("SELECT locationid, locationslug, city, state, venue "
                  "FROM ww_locations "
@@ -33,9 +38,8 @@ def retrieve_all(database_connection: mysql.connector.connect,
         else:
             query = query + "ORDER BY state ASC, city ASC, venue ASC;"
 
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query,
+                                    dictionary=True, prepared=False)
 
         locations = []
         for location in result:
@@ -59,7 +63,7 @@ def retrieve_all(database_connection: mysql.connector.connect,
             location_info["venue"] = venue
             locations.append(location_info)
 
-        return locations
+        return records.convert_list(locations, records.Location, return_type)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
@@ -75,7 +79,6 @@ def retrieve_all_ids(database_connection: mysql.connector.connect,
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor()
         # Exclude any entries that are considered to be fully TBD
         query = ("SELECT locationid FROM ww_locations "
                  "WHERE locationid NOT IN (3) ")
@@ -85,9 +88,7 @@ def retrieve_all_ids(database_connection: mysql.connector.connect,
         else:
             query = query + "ORDER BY state ASC, city ASC, venue ASC;"
 
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query, prepared=False)
 
         locations = []
         for row in result:
@@ -99,6 +100,7 @@ def retrieve_all_ids(database_connection: mysql.connector.connect,
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+@cache.cached("location")
 def retrieve_by_id(location_id: int,
                    database_connection: mysql.connector.connect,
                    pre_validated_id: bool = False) -> Dict:
@@ -111,19 +113,13 @@ def retrieve_by_id(location_id: int,
         pre_validated_id (bool): Flag whether or not the location ID
         has been validated
     """
-    if not pre_validated_id:
-        if not utility.validate_id(location_id, database_connection):
-            return None
-
     try:
-        cursor = database_connection.cursor(dictionary=True)
         # Exclude any entries that are considered to be fully TBD
         query = ("SELECT locationid, city, state, venue, locationslug "
                  "FROM ww_locations "
                  "WHERE locationid = %s; ")
-        cursor.execute(query, (location_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (location_id,),
+                                    dictionary=True)
 
         if not result:
             return None
@@ -152,6 +148,55 @@ def retrieve_by_id(location_id: int,
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+def retrieve_by_ids(location_ids: List[int],
+                    database_connection: mysql.connector.connect
+                   ) -> List[Dict]:
+    """Returns a list of OrderedDicts with location information for the
+    requested location IDs, in the order the IDs were requested. Unknown
+    location IDs are skipped.
+
+    Arguments:
+        location_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    if not location_ids:
+        return []
+
+    try:
+        placeholders = ", ".join(["%s"] * len(location_ids))
+        query = ("SELECT locationid, locationslug, city, state, venue "
+                 "FROM ww_locations "
+                 "WHERE locationid IN ({});".format(placeholders))
+        result = executor.fetch_all(database_connection, query,
+                                    tuple(location_ids), dictionary=True,
+                                    prepared=False)
+
+        locations_info = {}
+        for row in result:
+            location_id = row["locationid"]
+            slug = row["locationslug"]
+            if not slug:
+                slug = utility.slugify_location(location_id=location_id,
+                                                city=row["city"],
+                                                state=row["state"],
+                                                venue=row["venue"])
+
+            location_info = OrderedDict()
+            location_info["id"] = location_id
+            location_info["slug"] = slug
+            location_info["city"] = row["city"]
+            location_info["state"] = row["state"]
+            location_info["venue"] = row["venue"]
+            locations_info[row["locationid"]] = location_info
+
+        return [locations_info[location_id] for location_id in location_ids
+                if location_id in locations_info]
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+@cache.cached("location")
 def retrieve_by_slug(location_slug: str,
                      database_connection: mysql.connector.connect) -> Dict:
     """Returns an OrderedDict with host information based on the
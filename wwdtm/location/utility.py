@@ -8,6 +8,7 @@ information from the Wait Wait... Don't Tell Me! Stats Page Database.
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
 from slugify import slugify
+from wwdtm import executor, slug_index
 
 #region Utility Functions
 def convert_slug_to_id(location_slug: str,
@@ -18,12 +19,14 @@ def convert_slug_to_id(location_slug: str,
         location_slug (str)
         database_connect (mysql.connector.connect)
     """
+    index = slug_index.get_index("location", database_connection)
+    if index is not None:
+        return index.id_for_slug(location_slug)
+
     try:
-        cursor = database_connection.cursor()
         query = "SELECT locationid FROM ww_locations WHERE locationslug = %s;"
-        cursor.execute(query, (location_slug,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query,
+                                    (location_slug,))
 
         if result:
             return result[0]
@@ -43,12 +46,16 @@ def validate_id(location_id: int,
         location_id (int)
         database_connection (mysql.connector.connect)
     """
+    index = slug_index.get_index("location", database_connection)
+    if index is not None:
+        try:
+            return index.has_id(int(location_id))
+        except ValueError:
+            return False
+
     try:
-        cursor = database_connection.cursor()
         query = "SELECT locationid FROM ww_locations WHERE locationid = %s;"
-        cursor.execute(query, (location_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (location_id,))
 
         return bool(result)
     except ProgrammingError as err:
@@ -69,12 +76,14 @@ def validate_slug(location_slug: str,
     if not location_slug:
         return False
 
+    index = slug_index.get_index("location", database_connection)
+    if index is not None:
+        return index.has_slug(location_slug)
+
     try:
-        cursor = database_connection.cursor()
         query = "SELECT locationslug FROM ww_locations WHERE locationslug = %s;"
-        cursor.execute(query, (location_slug,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query,
+                                    (location_slug,))
 
         return bool(result)
     except ProgrammingError as err:
@@ -6,13 +6,334 @@ information from the Wait Wait... Don't Tell Me! Stats Page Database.
 """
 
 from collections import OrderedDict
-from typing import List, Dict
+import threading
+import time
+from typing import Any, Callable, List, Dict, Tuple
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
 import numpy
+from wwdtm import cache, executor
 from wwdtm.panelist import utility
 
+#region Constants
+# Number of seconds the minimum and maximum panelist scores, and the
+# list of show years, are kept before being queried again
+SCORE_RANGE_TTL = 3600
+SHOW_YEARS_TTL = 3600
+#endregion
+
+# Values derived from whole tables, keyed by name, stored as a tuple
+# of the value and the time at which the value expires
+_derived_values = {}
+_derived_values_lock = threading.Lock()
+
 #region Internal Functions
+def _build_rank_info(rank_counts: List[Dict]) -> Dict:
+    """Returns an OrderedDict with ranking information built from a
+    list of rank and rank count rows
+
+    Arguments:
+        rank_counts (List[Dict]): Rows containing pnlrank and
+        rankcount values
+    """
+    counts = {}
+    for row in rank_counts:
+        rank = str(row["pnlrank"]).strip().lower()
+        counts[rank] = counts.get(rank, 0) + row["rankcount"]
+
+    rank_info = OrderedDict()
+    rank_info["first"] = counts.get("1", 0)
+    rank_info["first_tied"] = counts.get("1t", 0)
+    rank_info["second"] = counts.get("2", 0)
+    rank_info["second_tied"] = counts.get("2t", 0)
+    rank_info["third"] = counts.get("3", 0)
+    return rank_info
+
+def _build_scoring(scores: List[int]) -> Dict:
+    """Returns an OrderedDict containing scoring data built from a list
+    of scores
+
+    Arguments:
+        scores (List[int])
+    """
+    scoring = OrderedDict()
+    scoring["minimum"] = int(numpy.amin(scores))
+    scoring["maximum"] = int(numpy.amax(scores))
+    scoring["mean"] = round(numpy.mean(scores), 4)
+    scoring["median"] = int(numpy.median(scores))
+    scoring["standard_deviation"] = round(numpy.std(scores), 4)
+    scoring["total"] = int(numpy.sum(scores))
+    return scoring
+
+def _build_ranking(ranks: Dict, appearance_count: int) -> Dict:
+    """Returns an OrderedDict containing ranking data built from
+    ranking information and the number of scored appearances
+
+    Arguments:
+        ranks (Dict): Ranking information, as returned by
+        _build_rank_info
+        appearance_count (int)
+    """
+    ranks_first = round(100 * (ranks["first"] / appearance_count), 4)
+    ranks_first_tied = round(100 * (ranks["first_tied"] / appearance_count), 4)
+    ranks_second = round(100 * (ranks["second"] / appearance_count), 4)
+    ranks_second_tied = round(100 * (ranks["second_tied"] / appearance_count), 4)
+    ranks_third = round(100 * (ranks["third"] / appearance_count), 4)
+
+    ranks_percentage = OrderedDict()
+    ranks_percentage["first"] = ranks_first
+    ranks_percentage["first_tied"] = ranks_first_tied
+    ranks_percentage["second"] = ranks_second
+    ranks_percentage["second_tied"] = ranks_second_tied
+    ranks_percentage["third"] = ranks_third
+
+    ranking = OrderedDict()
+    ranking["rank"] = ranks
+    ranking["percentage"] = ranks_percentage
+    return ranking
+
+def _build_statistics(scores: List[int], ranks: Dict) -> Dict:
+    """Returns an OrderedDict containing panelist statistics, ranking
+    data, and scoring data built from a list of scores and ranking
+    information
+
+    Arguments:
+        scores (List[int])
+        ranks (Dict): Ranking information, as returned by
+        _build_rank_info
+    """
+    statistics = OrderedDict()
+    statistics["scoring"] = _build_scoring(scores)
+    statistics["ranking"] = _build_ranking(ranks, len(scores))
+    return statistics
+
+def _build_grouped_scoring(panelist_ids: numpy.ndarray,
+                           scores: numpy.ndarray) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing scoring data for
+    each panelist, keyed by panelist ID, computed from an array of
+    scores and a matching array of panelist IDs
+
+    Scores are sorted by panelist ID and score so that each panelist's
+    scores form a contiguous, ordered segment. The minimum, maximum
+    and median are then read from the segment boundaries and middles,
+    and the total, mean and standard deviation are calculated using
+    segment reductions.
+
+    Arguments:
+        panelist_ids (numpy.ndarray)
+        scores (numpy.ndarray)
+    """
+    if not scores.size:
+        return OrderedDict()
+
+    order = numpy.lexsort((scores, panelist_ids))
+    panelist_ids = panelist_ids[order]
+    scores = scores[order]
+
+    starts = numpy.flatnonzero(numpy.r_[True,
+                                        panelist_ids[1:] != panelist_ids[:-1]])
+    counts = numpy.diff(numpy.r_[starts, scores.size])
+    ends = starts + counts - 1
+
+    totals = numpy.add.reduceat(scores, starts)
+    means = totals / counts
+    deviations = scores - numpy.repeat(means, counts)
+    variances = numpy.add.reduceat(deviations * deviations, starts) / counts
+    standard_deviations = numpy.sqrt(variances)
+
+    # The median is the middle score of an odd number of scores, or the
+    # mean of the two middle scores of an even number of scores
+    lower_middles = scores[starts + (counts - 1) // 2]
+    upper_middles = scores[starts + counts // 2]
+    medians = (lower_middles + upper_middles) / 2
+
+    grouped_scoring = OrderedDict()
+    for index, panelist_id in enumerate(panelist_ids[starts]):
+        scoring = OrderedDict()
+        scoring["minimum"] = int(scores[starts[index]])
+        scoring["maximum"] = int(scores[ends[index]])
+        scoring["mean"] = round(means[index], 4)
+        scoring["median"] = int(medians[index])
+        scoring["standard_deviation"] = round(standard_deviations[index], 4)
+        scoring["total"] = int(totals[index])
+        grouped_scoring[int(panelist_id)] = scoring
+
+    return grouped_scoring
+
+def _build_appearance_info(appearances: List[Dict]) -> Dict:
+    """Returns an OrderedDict containing appearance information built
+    from a list of panelist appearance rows, sorted by show date
+
+    Arguments:
+        appearances (List[Dict]): Rows containing showid, showdate,
+        bestof, repeatshowid, start, correct, panelistscore and
+        showpnlrank values
+    """
+    regular_shows = [row for row in appearances
+                     if row["bestof"] == 0 and row["repeatshowid"] is None]
+
+    appearance_info = OrderedDict()
+    if regular_shows:
+        first = OrderedDict()
+        first["show_id"] = min(row["showid"] for row in regular_shows)
+        first["show_date"] = min(row["showdate"]
+                                 for row in regular_shows).isoformat()
+        most_recent = OrderedDict()
+        most_recent["show_id"] = max(row["showid"] for row in regular_shows)
+        most_recent["show_date"] = max(row["showdate"]
+                                       for row in regular_shows).isoformat()
+
+        milestones = OrderedDict()
+        milestones["first"] = first
+        milestones["most_recent"] = most_recent
+        appearance_info["milestones"] = milestones
+    else:
+        appearance_info["milestones"] = None
+
+    if not appearances:
+        appearance_info["count"] = 0
+        appearance_info["shows"] = None
+        return appearance_info
+
+    appearance_counts = OrderedDict()
+    appearance_counts["regular_shows"] = len(regular_shows)
+    appearance_counts["all_shows"] = len(appearances)
+    appearance_counts["shows_with_scores"] = len(
+        [row for row in regular_shows if row["panelistscore"] is not None])
+
+    shows = []
+    for appearance in appearances:
+        rank = appearance["showpnlrank"]
+        if not rank:
+            rank = None
+
+        info = OrderedDict()
+        info["show_id"] = appearance["showid"]
+        info["date"] = appearance["showdate"].isoformat()
+        info["best_of"] = bool(appearance["bestof"])
+        info["repeat_show"] = bool(appearance["repeatshowid"])
+        info["lightning_round_start"] = appearance["start"]
+        info["lightning_round_correct"] = appearance["correct"]
+        info["score"] = appearance["panelistscore"]
+        info["rank"] = rank
+        shows.append(info)
+
+    appearance_info["count"] = appearance_counts
+    appearance_info["shows"] = shows
+    return appearance_info
+
+def _build_appearance_statistics(appearances: List[Dict]) -> Dict:
+    """Returns an OrderedDict containing panelist statistics, ranking
+    data, and scoring data built from a list of panelist appearance
+    rows. Returns None if the panelist does not have any scores.
+
+    Arguments:
+        appearances (List[Dict]): Rows containing bestof, repeatshowid,
+        panelistscore and showpnlrank values
+    """
+    regular_shows = [row for row in appearances
+                     if row["bestof"] == 0 and row["repeatshowid"] is None]
+    scores = [row["panelistscore"] for row in regular_shows
+              if row["panelistscore"]]
+    if not scores:
+        return None
+
+    rank_counts = [{"pnlrank": row["showpnlrank"], "rankcount": 1}
+                   for row in regular_shows
+                   if row["showpnlrank"] is not None]
+    return _build_statistics(scores, _build_rank_info(rank_counts))
+
+def _build_panelist_ids_clause(column: str, panelist_ids: List[int]) -> str:
+    """Returns a SQL condition that matches the requested column against
+    a list of panelist IDs, for use with the list of panelist IDs as
+    query parameters
+
+    Arguments:
+        column (str)
+        panelist_ids (List[int])
+    """
+    placeholders = ", ".join(["%s"] * len(panelist_ids))
+    return "{} IN ({})".format(column, placeholders)
+
+def _retrieve_details_info(database_connection: mysql.connector.connect,
+                           panelist_ids: List[int] = None) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing statistics,
+    Bluff the Listener information and appearance information for all
+    panelists or the requested panelist IDs, keyed by panelist ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        panelist_ids (List[int]): List of panelist IDs to retrieve. All
+        panelists are retrieved if no list is provided.
+    """
+    if panelist_ids is not None and not panelist_ids:
+        return OrderedDict()
+
+    try:
+        query = ("SELECT p.panelistid, pm.showid, s.showdate, s.bestof, "
+                 "s.repeatshowid, pm.panelistlrndstart AS start, "
+                 "pm.panelistlrndcorrect AS correct, pm.panelistscore, "
+                 "pm.showpnlrank FROM ww_panelists p "
+                 "LEFT JOIN (ww_showpnlmap pm "
+                 "JOIN ww_shows s ON s.showid = pm.showid) "
+                 "ON pm.panelistid = p.panelistid ")
+        if panelist_ids:
+            query += "WHERE {} ".format(
+                _build_panelist_ids_clause("p.panelistid", panelist_ids))
+        query += ("ORDER BY p.panelistid ASC, s.showdate ASC, "
+                  "pm.showpnlmapid ASC;")
+        result = executor.fetch_all(database_connection, query,
+                                    tuple(panelist_ids or ()),
+                                    dictionary=True, prepared=False)
+
+        appearances = OrderedDict()
+        for row in result:
+            panelist_appearances = appearances.setdefault(row["panelistid"],
+                                                          [])
+            if row["showid"] is not None:
+                panelist_appearances.append(row)
+
+        bluffs = OrderedDict()
+        for panelist_id in appearances:
+            bluffs[panelist_id] = OrderedDict()
+            bluffs[panelist_id]["chosen"] = 0
+            bluffs[panelist_id]["correct"] = 0
+
+        query = ("SELECT blm.chosenbluffpnlid, blm.correctbluffpnlid "
+                 "FROM ww_showbluffmap blm "
+                 "JOIN ww_shows s ON s.showid = blm.showid "
+                 "WHERE s.repeatshowid IS NULL ")
+        if panelist_ids:
+            query += "AND ({} OR {});".format(
+                _build_panelist_ids_clause("blm.chosenbluffpnlid",
+                                           panelist_ids),
+                _build_panelist_ids_clause("blm.correctbluffpnlid",
+                                           panelist_ids))
+        result = executor.fetch_all(database_connection, query,
+                                    tuple(panelist_ids or ()) * 2,
+                                    dictionary=True, prepared=False)
+
+        for row in result:
+            if row["chosenbluffpnlid"] in bluffs:
+                bluffs[row["chosenbluffpnlid"]]["chosen"] += 1
+            if row["correctbluffpnlid"] in bluffs:
+                bluffs[row["correctbluffpnlid"]]["correct"] += 1
+
+        details_info = OrderedDict()
+        for panelist_id, panelist_appearances in appearances.items():
+            info = OrderedDict()
+            info["statistics"] = _build_appearance_statistics(
+                panelist_appearances)
+            info["bluffs"] = bluffs[panelist_id]
+            info["appearances"] = _build_appearance_info(panelist_appearances)
+            details_info[panelist_id] = info
+
+        return details_info
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
 def retrieve_appearances_by_id(panelist_id: int,
                                database_connection: mysql.connector.connect,
                                pre_validated_id: bool = False) -> List[Dict]:
@@ -26,104 +347,36 @@ def retrieve_appearances_by_id(panelist_id: int,
         has been validated or not
     """
     if not pre_validated_id:
-        if not utility.validate_id(panelist_id, database_connection):
+        try:
+            int(panelist_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT ( "
-                 "SELECT COUNT(pm.showid) FROM ww_showpnlmap pm "
-                 "JOIN ww_shows s ON s.showid = pm.showid "
-                 "WHERE s.bestof = 0 AND s.repeatshowid IS NULL AND "
-                 "pm.panelistid = %s ) AS regular, ( "
-                 "SELECT COUNT(pm.showid) FROM ww_showpnlmap pm "
-                 "JOIN ww_shows s ON s.showid = pm.showid "
-                 "WHERE pm.panelistid = %s ) AS allshows, ( "
-                 "SELECT COUNT(pm.panelistid) FROM ww_showpnlmap pm "
-                 "JOIN ww_shows s ON pm.showid = s.showid "
-                 "WHERE pm.panelistid = %s AND s.bestof = 0 AND "
-                 "s.repeatshowid IS NULL "
-                 "AND pm.panelistscore IS NOT NULL ) "
-                 "AS withscores;")
-        cursor.execute(query, (panelist_id, panelist_id, panelist_id,))
-        result = cursor.fetchone()
-
-        appearance_info = OrderedDict()
-        appearance_counts = OrderedDict()
-        appearance_counts["regular_shows"] = result["regular"]
-        appearance_counts["all_shows"] = result["allshows"]
-        appearance_counts["shows_with_scores"] = result["withscores"]
-
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT MIN(s.showid) AS first_id, MIN(s.showdate) AS first, "
-                 "MAX(s.showid) AS most_recent_id, MAX(s.showdate) AS most_recent "
-                 "FROM ww_showpnlmap pm "
-                 "JOIN ww_shows s ON s.showid = pm.showid "
-                 "WHERE s.bestof = 0 AND s.repeatshowid IS NULL "
-                 "AND pm.panelistid = %s "
-                 "ORDER BY s.showdate ASC;")
-        cursor.execute(query, (panelist_id,))
-        result = cursor.fetchone()
-
-        if result and result["first_id"]:
-            milestones = OrderedDict()
-            first = OrderedDict()
-            first["show_id"] = result["first_id"]
-            first["show_date"] = result["first"].isoformat()
-            most_recent = OrderedDict()
-            most_recent["show_id"] = result["most_recent_id"]
-            most_recent["show_date"] = result["most_recent"].isoformat()
-
-            milestones["first"] = first
-            milestones["most_recent"] = most_recent
-            appearance_info["milestones"] = milestones
-        else:
-            appearance_info["milestones"] = None
-
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT pm.showid, s.showdate, s.bestof, "
+        query = ("SELECT p.panelistid, pm.showid, s.showdate, s.bestof, "
                  "s.repeatshowid, pm.panelistlrndstart AS start, "
-                 " pm.panelistlrndcorrect AS correct, pm.panelistscore, "
-                 "pm.showpnlrank FROM ww_showpnlmap pm "
-                 "JOIN ww_panelists p ON p.panelistid = pm.panelistid "
-                 "JOIN ww_shows s ON s.showid = pm.showid "
-                 "WHERE pm.panelistid = %s "
-                 "ORDER BY s.showdate ASC;")
-
-        cursor.execute(query, (panelist_id,))
-        result = cursor.fetchall()
-        cursor.close()
-
-        if result:
-            appearances = []
-            for appearance in result:
-                rank = appearance["showpnlrank"]
-                if not rank:
-                    rank = None
-
-                info = OrderedDict()
-                info["show_id"] = appearance["showid"]
-                info["date"] = appearance["showdate"].isoformat()
-                info["best_of"] = bool(appearance["bestof"])
-                info["repeat_show"] = bool(appearance["repeatshowid"])
-                info["lightning_round_start"] = appearance["start"]
-                info["lightning_round_correct"] = appearance["correct"]
-                info["score"] = appearance["panelistscore"]
-                info["rank"] = rank
-                appearances.append(info)
-
-            appearance_info["count"] = appearance_counts
-            appearance_info["shows"] = appearances
-        else:
-            appearance_info["count"] = 0
-            appearance_info["shows"] = None
-
-        return appearance_info
+                 "pm.panelistlrndcorrect AS correct, pm.panelistscore, "
+                 "pm.showpnlrank FROM ww_panelists p "
+                 "LEFT JOIN (ww_showpnlmap pm "
+                 "JOIN ww_shows s ON s.showid = pm.showid) "
+                 "ON pm.panelistid = p.panelistid "
+                 "WHERE p.panelistid = %s "
+                 "ORDER BY s.showdate ASC, pm.showpnlmapid ASC;")
+        result = executor.fetch_all(database_connection, query,
+                                    (panelist_id,), dictionary=True)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+    if not pre_validated_id and not result:
+        return None
+
+    # Appearance counts and milestones are derived from the same rows
+    # as the list of appearances
+    appearances = [row for row in result if row["showid"] is not None]
+    return _build_appearance_info(appearances)
+
 def retrieve_appearances_by_slug(panelist_slug: str,
                                  database_connection: mysql.connector.connect
                                 ) -> List[Dict]:
@@ -154,11 +407,12 @@ def retrieve_bluffs_by_id(panelist_id: int,
         has been validated or not
     """
     if not pre_validated_id:
-        if not utility.validate_id(panelist_id, database_connection):
+        try:
+            int(panelist_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT ( "
                  "SELECT COUNT(blm.chosenbluffpnlid) FROM ww_showbluffmap blm "
                  "JOIN ww_shows s ON s.showid = blm.showid "
@@ -167,12 +421,13 @@ def retrieve_bluffs_by_id(panelist_id: int,
                  "SELECT COUNT(blm.correctbluffpnlid) FROM ww_showbluffmap blm "
                  "JOIN ww_shows s ON s.showid = blm.showid "
                  "WHERE s.repeatshowid IS NULL AND blm.correctbluffpnlid = %s "
-                 ") AS correct;")
-        cursor.execute(query, (panelist_id, panelist_id,))
-        result = cursor.fetchone()
-        cursor.close()
+                 ") AS correct, ( "
+                 "SELECT COUNT(p.panelistid) FROM ww_panelists p "
+                 "WHERE p.panelistid = %s ) AS panelistexists;")
+        result = executor.fetch_one(database_connection, query,
+                                    (panelist_id, panelist_id, panelist_id))
 
-        if result:
+        if result and (pre_validated_id or result[2]):
             bluffs = OrderedDict()
             bluffs["chosen"] = result[0]
             bluffs["correct"] = result[1]
@@ -214,15 +469,13 @@ def retrieve_scores_by_id(panelist_id: int,
     """
     scores = []
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT s.showdate, pm.panelistscore "
                  "FROM ww_showpnlmap pm "
                  "JOIN ww_shows s ON s.showid = pm.showid "
                  "WHERE panelistid = %s "
                  "AND s.bestof = 0 and s.repeatshowid IS NULL;")
-        cursor.execute(query, (panelist_id,))
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query, (panelist_id,),
+                                    dictionary=True)
 
         for appearance in result:
             if appearance["panelistscore"]:
@@ -245,45 +498,17 @@ def retrieve_rank_info_by_id(panelist_id: int,
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT ( "
-                 "SELECT COUNT(pm.showpnlrank) FROM ww_showpnlmap pm "
-                 "JOIN ww_shows s ON s.showid = pm.showid "
-                 "WHERE pm.panelistid = %s AND pm.showpnlrank = '1' AND "
-                 "s.bestof = 0 and s.repeatshowid IS NULL) as '1', ( "
-                 "SELECT COUNT(pm.showpnlrank) FROM ww_showpnlmap pm "
-                 "JOIN ww_shows s ON s.showid = pm.showid "
-                 "WHERE pm.panelistid = %s AND pm.showpnlrank = '1t' AND "
-                 "s.bestof = 0 and s.repeatshowid IS NULL) as '1t', ( "
-                 "SELECT COUNT(pm.showpnlrank) FROM ww_showpnlmap pm "
-                 "JOIN ww_shows s ON s.showid = pm.showid "
-                 "WHERE pm.panelistid = %s AND pm.showpnlrank = '2' AND "
-                 "s.bestof = 0 and s.repeatshowid IS NULL) as '2', ( "
-                 "SELECT COUNT(pm.showpnlrank) FROM ww_showpnlmap pm "
-                 "JOIN ww_shows s ON s.showid = pm.showid "
-                 "WHERE pm.panelistid = %s AND pm.showpnlrank = '2t' AND "
-                 "s.bestof = 0 and s.repeatshowid IS NULL) as '2t', ( "
-                 "SELECT COUNT(pm.showpnlrank) FROM ww_showpnlmap pm "
+        query = ("SELECT pm.showpnlrank AS pnlrank, "
+                 "COUNT(pm.showpnlrank) AS rankcount "
+                 "FROM ww_showpnlmap pm "
                  "JOIN ww_shows s ON s.showid = pm.showid "
-                 "WHERE pm.panelistid = %s AND pm.showpnlrank = '3' AND "
-                 "s.bestof = 0 and s.repeatshowid IS NULL "
-                 ") as '3';")
-        cursor.execute(query, (panelist_id,
-                               panelist_id,
-                               panelist_id,
-                               panelist_id,
-                               panelist_id,))
-        result = cursor.fetchone()
-        cursor.close()
-
-        rank_info = OrderedDict()
-        rank_info["first"] = result["1"]
-        rank_info["first_tied"] = result["1t"]
-        rank_info["second"] = result["2"]
-        rank_info["second_tied"] = result["2t"]
-        rank_info["third"] = result["3"]
-
-        return rank_info
+                 "WHERE pm.panelistid = %s AND s.bestof = 0 AND "
+                 "s.repeatshowid IS NULL AND pm.showpnlrank IS NOT NULL "
+                 "GROUP BY pm.showpnlrank;")
+        result = executor.fetch_all(database_connection, query, (panelist_id,),
+                                    dictionary=True)
+
+        return _build_rank_info(result)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
@@ -302,44 +527,20 @@ def retrieve_statistics_by_id(panelist_id: int,
         has been validated or not
     """
     if not pre_validated_id:
-        if not utility.validate_id(panelist_id, database_connection):
+        try:
+            int(panelist_id)
+        except ValueError:
             return None
 
     scores = retrieve_scores_by_id(panelist_id, database_connection)
-    ranks = retrieve_rank_info_by_id(panelist_id, database_connection)
-    if not scores or not ranks:
+    if not scores:
         return None
 
-    appearance_count = len(scores)
-    scoring = OrderedDict()
-    scoring["minimum"] = int(numpy.amin(scores))
-    scoring["maximum"] = int(numpy.amax(scores))
-    scoring["mean"] = round(numpy.mean(scores), 4)
-    scoring["median"] = int(numpy.median(scores))
-    scoring["standard_deviation"] = round(numpy.std(scores), 4)
-    scoring["total"] = int(numpy.sum(scores))
-
-    ranks_first = round(100 * (ranks["first"] / appearance_count), 4)
-    ranks_first_tied = round(100 * (ranks["first_tied"] / appearance_count), 4)
-    ranks_second = round(100 * (ranks["second"] / appearance_count), 4)
-    ranks_second_tied = round(100 * (ranks["second_tied"] / appearance_count), 4)
-    ranks_third = round(100 * (ranks["third"] / appearance_count), 4)
-
-    ranks_percentage = OrderedDict()
-    ranks_percentage["first"] = ranks_first
-    ranks_percentage["first_tied"] = ranks_first_tied
-    ranks_percentage["second"] = ranks_second
-    ranks_percentage["second_tied"] = ranks_second_tied
-    ranks_percentage["third"] = ranks_third
-
-    ranking = OrderedDict()
-    ranking["rank"] = ranks
-    ranking["percentage"] = ranks_percentage
+    ranks = retrieve_rank_info_by_id(panelist_id, database_connection)
+    if not ranks:
+        return None
 
-    statistics = OrderedDict()
-    statistics["scoring"] = scoring
-    statistics["ranking"] = ranking
-    return statistics
+    return _build_statistics(scores, ranks)
 
 def retrieve_statistics_by_slug(panelist_slug: str,
                                 database_connection: mysql.connector.connect
@@ -359,3 +560,268 @@ def retrieve_statistics_by_slug(panelist_slug: str,
     return None
 
 #endregion
+
+#region Bulk Retrieval Functions
+def retrieve_rank_info_all(database_connection: mysql.connector.connect
+                          ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts with ranking information
+    for all panelists with at least one ranked appearance, keyed by
+    panelist ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    try:
+        query = ("SELECT pm.panelistid, pm.showpnlrank AS pnlrank, "
+                 "COUNT(pm.showpnlrank) AS rankcount "
+                 "FROM ww_showpnlmap pm "
+                 "JOIN ww_shows s ON s.showid = pm.showid "
+                 "WHERE s.bestof = 0 AND s.repeatshowid IS NULL AND "
+                 "pm.showpnlrank IS NOT NULL "
+                 "GROUP BY pm.panelistid, pm.showpnlrank "
+                 "ORDER BY pm.panelistid ASC;")
+        result = executor.fetch_all(database_connection, query,
+                                    dictionary=True)
+
+        panelist_rank_counts = OrderedDict()
+        for row in result:
+            panelist_rank_counts.setdefault(row["panelistid"], []).append(row)
+
+        ranks = OrderedDict()
+        for panelist_id, rank_counts in panelist_rank_counts.items():
+            ranks[panelist_id] = _build_rank_info(rank_counts)
+
+        return ranks
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+def retrieve_details_info_all(database_connection: mysql.connector.connect
+                             ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing statistics,
+    Bluff the Listener information and appearance information for all
+    panelists, keyed by panelist ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_details_info(database_connection)
+
+def retrieve_details_info_by_ids(panelist_ids: List[int],
+                                 database_connection: mysql.connector.connect
+                                ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing statistics,
+    Bluff the Listener information and appearance information for the
+    requested panelist IDs, keyed by panelist ID. Panelist IDs that do
+    not exist are not included.
+
+    Arguments:
+        panelist_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_details_info(database_connection, list(panelist_ids))
+
+def retrieve_statistics_all(database_connection: mysql.connector.connect
+                           ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing panelist
+    statistics, ranking data, and scoring data for all panelists with
+    at least one scored appearance, keyed by panelist ID
+
+    Scoring data for all panelists is calculated at once using NumPy
+    and matches the values returned by retrieve_statistics_by_id,
+    rounded to four decimal places.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    try:
+        query = ("SELECT pm.panelistid, pm.panelistscore "
+                 "FROM ww_showpnlmap pm "
+                 "JOIN ww_shows s ON s.showid = pm.showid "
+                 "WHERE s.bestof = 0 AND s.repeatshowid IS NULL "
+                 "AND pm.panelistscore IS NOT NULL "
+                 "AND pm.panelistscore <> 0;")
+        result = executor.fetch_all(database_connection, query)
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+    rows = numpy.array(result, dtype=numpy.int64).reshape(-1, 2)
+    grouped_scoring = _build_grouped_scoring(rows[:, 0], rows[:, 1])
+    appearance_counts = dict(zip(*numpy.unique(rows[:, 0],
+                                               return_counts=True)))
+
+    ranks = retrieve_rank_info_all(database_connection)
+
+    statistics = OrderedDict()
+    for panelist_id, scoring in grouped_scoring.items():
+        panelist_ranks = ranks.get(panelist_id)
+        if not panelist_ranks:
+            panelist_ranks = _build_rank_info([])
+
+        panelist_statistics = OrderedDict()
+        panelist_statistics["scoring"] = scoring
+        panelist_statistics["ranking"] = _build_ranking(
+            panelist_ranks, int(appearance_counts[panelist_id]))
+        statistics[panelist_id] = panelist_statistics
+
+    return statistics
+
+#endregion
+
+#region Derived Value Functions
+def _retrieve_derived_value(name: str,
+                            query_function: Callable,
+                            ttl: int,
+                            database_connection: mysql.connector.connect
+                           ) -> Any:
+    """Returns a stored value derived from whole tables, querying the
+    database if the value has not been stored or has expired
+
+    Arguments:
+        name (str)
+        query_function (Callable): Function that queries the value
+        ttl (int): Number of seconds to keep the value
+        database_connection (mysql.connector.connect)
+    """
+    entry = _derived_values.get(name)
+    if entry is not None and time.monotonic() < entry[1]:
+        return entry[0]
+
+    return _refresh_derived_value(name, query_function, ttl,
+                                  database_connection)
+
+def _refresh_derived_value(name: str,
+                           query_function: Callable,
+                           ttl: int,
+                           database_connection: mysql.connector.connect = None
+                          ) -> Any:
+    """Discards a stored value derived from whole tables and, if a
+    database connection is provided, queries and stores the value again.
+    Values of None are not stored.
+
+    Arguments:
+        name (str)
+        query_function (Callable): Function that queries the value
+        ttl (int): Number of seconds to keep the value
+        database_connection (mysql.connector.connect)
+    """
+    value = None
+    if database_connection is not None:
+        value = query_function(database_connection)
+
+    with _derived_values_lock:
+        if value is None:
+            _derived_values.pop(name, None)
+        else:
+            _derived_values[name] = (value, time.monotonic() + ttl)
+
+    return value
+
+def _query_score_range(database_connection: mysql.connector.connect
+                      ) -> Tuple[int, int]:
+    """Returns a tuple containing the minimum and maximum panelist
+    scores across all shows, or None if there are no scores
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    try:
+        query = ("SELECT MIN(pm.panelistscore) AS min, "
+                 "MAX(pm.panelistscore) AS max "
+                 "FROM ww_showpnlmap pm;")
+        result = executor.fetch_one(database_connection, query)
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+    if not result or result[0] is None or result[1] is None:
+        return None
+
+    return result[0], result[1]
+
+def _query_show_years(database_connection: mysql.connector.connect
+                     ) -> Tuple[int]:
+    """Returns a tuple containing each year with at least one show, in
+    ascending order, or None if there are no shows
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    try:
+        query = ("SELECT DISTINCT YEAR(s.showdate) AS year FROM ww_shows s "
+                 "ORDER BY YEAR(s.showdate) ASC")
+        result = executor.fetch_all(database_connection, query)
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+    if not result:
+        return None
+
+    return tuple(row[0] for row in result)
+
+def retrieve_score_range(database_connection: mysql.connector.connect
+                        ) -> Tuple[int, int]:
+    """Returns a tuple containing the minimum and maximum panelist
+    scores across all shows, or None if there are no scores. The range
+    is kept for SCORE_RANGE_TTL seconds, or until it is refreshed or
+    panelist or show entries are invalidated using
+    wwdtm.cache.invalidate.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_derived_value("score_range", _query_score_range,
+                                   SCORE_RANGE_TTL, database_connection)
+
+def refresh_score_range(database_connection: mysql.connector.connect = None
+                       ) -> None:
+    """Discards the stored panelist score range. If a database
+    connection is provided, the range is queried again immediately;
+    otherwise, it is queried the next time it is used.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    _refresh_derived_value("score_range", _query_score_range,
+                           SCORE_RANGE_TTL, database_connection)
+
+def retrieve_show_years(database_connection: mysql.connector.connect
+                       ) -> List[int]:
+    """Returns a list of each year with at least one show, in ascending
+    order, or None if there are no shows. The list is kept for
+    SHOW_YEARS_TTL seconds, or until it is refreshed or show entries
+    are invalidated using wwdtm.cache.invalidate.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    years = _retrieve_derived_value("show_years", _query_show_years,
+                                    SHOW_YEARS_TTL, database_connection)
+    if years is None:
+        return None
+
+    return list(years)
+
+def refresh_show_years(database_connection: mysql.connector.connect = None
+                      ) -> None:
+    """Discards the stored list of show years. If a database connection
+    is provided, the list is queried again immediately; otherwise, it
+    is queried the next time it is used.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    _refresh_derived_value("show_years", _query_show_years,
+                           SHOW_YEARS_TTL, database_connection)
+
+cache.register_invalidation_callback("panelist", refresh_score_range)
+cache.register_invalidation_callback("show", refresh_score_range)
+cache.register_invalidation_callback("show", refresh_show_years)
+
+#endregion
@@ -5,11 +5,54 @@
 the Wait Wait... Don't Tell Me! Stats Page Database.
 """
 
-from typing import List, Dict
+from collections import OrderedDict
+from typing import Callable, List, Dict, Iterator, Tuple
 import mysql.connector
+from wwdtm import cache, fanout, records, streaming
 from wwdtm.panelist import core, info, utility
 
+#region Detail Assembly Functions
+def detail_calls(panelist_id: int,
+                 database_connection: mysql.connector.connect
+                ) -> List[Tuple[Callable, tuple]]:
+    """Returns a list of the functions and arguments used to retrieve
+    the panelist information, statistics, Bluff the Listener
+    information and appearances for the requested panelist ID. The
+    calls are independent of each other and can be run at the same
+    time.
+
+    Arguments:
+        panelist_id (int)
+        database_connection (mysql.connector.connect)
+    """
+    arguments = (panelist_id, database_connection, True)
+    return [(info.retrieve_by_id, arguments),
+            (core.retrieve_statistics_by_id, arguments),
+            (core.retrieve_bluffs_by_id, arguments),
+            (core.retrieve_appearances_by_id, arguments)]
+
+def assemble_details(results: List) -> Dict:
+    """Returns an OrderedDict with panelist details built from the
+    results of the calls returned by detail_calls, or None if no
+    panelist information was returned
+
+    Arguments:
+        results (List): Results of the calls returned by detail_calls,
+        in the same order
+    """
+    panelist, statistics, bluff_statistics, appearances = results
+    if not panelist:
+        return None
+
+    panelist["statistics"] = statistics
+    panelist["bluffs"] = bluff_statistics
+    panelist["appearances"] = appearances
+    return panelist
+
+#endregion
+
 #region Retrieval Functions
+@cache.cached("panelist")
 def retrieve_by_id(panelist_id: int,
                    database_connection: mysql.connector.connect,
                    pre_validated_id: bool = False) -> Dict:
@@ -23,26 +66,19 @@ def retrieve_by_id(panelist_id: int,
         has been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(panelist_id, database_connection):
+        try:
+            int(panelist_id)
+        except ValueError:
             return None
 
-    panelist = info.retrieve_by_id(panelist_id,
-                                   database_connection,
-                                   pre_validated_id=True)
-    statistics = core.retrieve_statistics_by_id(panelist_id,
-                                                database_connection,
-                                                pre_validated_id=True)
-    panelist["statistics"] = statistics
-    bluff_statistics = core.retrieve_bluffs_by_id(panelist_id,
-                                                  database_connection,
-                                                  pre_validated_id=True)
-    panelist["bluffs"] = bluff_statistics
-    appearances = core.retrieve_appearances_by_id(panelist_id,
-                                                  database_connection,
-                                                  pre_validated_id=True)
-    panelist["appearances"] = appearances
-    return panelist
+    # Retrieve the panelist information, statistics, Bluff the Listener
+    # information and appearances, at the same time if fan-out is active
+    return assemble_details(fanout.run_all(database_connection,
+                                           detail_calls(panelist_id,
+                                                        database_connection),
+                                           stop_if_empty=True))
 
+@cache.cached("panelist")
 def retrieve_by_slug(panelist_slug: str,
                      database_connection: mysql.connector.connect
                     ) -> Dict:
@@ -61,25 +97,98 @@ def retrieve_by_slug(panelist_slug: str,
                           database_connection,
                           pre_validated_id=True)
 
-def retrieve_all(database_connection: mysql.connector.connect) -> List[Dict]:
+def retrieve_all(database_connection: mysql.connector.connect,
+                 return_type: str = "dict") -> List[Dict]:
     """Returns a list of OrderedDicts with panelist details for all
     panelists
 
     Arguments:
         database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Panelist records
     """
-    panelist_ids = info.retrieve_all_ids(database_connection)
-    if not panelist_ids:
+    records.validate_return_type(return_type)
+
+    panelists_info = info.retrieve_all(database_connection)
+    if not panelists_info:
         return None
 
+    # Retrieve statistics, bluffs and appearances for all panelists
+    # at once and combine them with the panelist information
+    details_info = core.retrieve_details_info_all(database_connection)
+
     panelists = []
-    for panelist_id in panelist_ids:
-        panelist = retrieve_by_id(panelist_id,
-                                  database_connection,
-                                  pre_validated_id=True)
-        if panelist:
+    for panelist in panelists_info:
+        panelist_details = details_info.get(panelist["id"])
+        if panelist_details:
+            panelist.update(panelist_details)
             panelists.append(panelist)
 
-    return panelists
+    return records.convert_list(panelists, records.Panelist, return_type)
+
+def retrieve_by_ids(panelist_ids: List[int],
+                    database_connection: mysql.connector.connect,
+                    return_type: str = "dict") -> List[Dict]:
+    """Returns a list of OrderedDicts with panelist details for the
+    requested panelist IDs, in the order the panelist IDs were
+    requested. Invalid or unknown panelist IDs are skipped.
+
+    Arguments:
+        panelist_ids (List[int])
+        database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Panelist records
+    """
+    records.validate_return_type(return_type)
+
+    valid_ids = []
+    for panelist_id in panelist_ids:
+        try:
+            valid_ids.append(int(panelist_id))
+        except (TypeError, ValueError):
+            continue
+
+    if not valid_ids:
+        return None
+
+    query_ids = list(OrderedDict.fromkeys(valid_ids))
+    panelists = info.retrieve_by_ids(query_ids, database_connection)
+    details_info = core.retrieve_details_info_by_ids(query_ids,
+                                                     database_connection)
+    panelists_info = {panelist["id"]: panelist for panelist in panelists}
+
+    panelists_details = []
+    for panelist_id in valid_ids:
+        panelist = panelists_info.get(panelist_id)
+        panelist_details = details_info.get(panelist_id)
+        if panelist and panelist_details:
+            panelist.update(panelist_details)
+            panelists_details.append(panelist)
+
+    return records.convert_list(panelists_details, records.Panelist,
+                                return_type)
+
+def iter_all(database_connection: mysql.connector.connect,
+             batch_size: int = streaming.DEFAULT_BATCH_SIZE,
+             return_type: str = "dict") -> Iterator[Dict]:
+    """Returns an iterator that yields OrderedDicts with panelist
+    details for all panelists, in the same order as retrieve_all.
+    Details are retrieved for batch_size panelists at a time, so only
+    one batch is held in memory.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        batch_size (int): Number of panelists to retrieve at a time
+        return_type (str): Either "dict" to yield OrderedDicts or
+        "record" to yield wwdtm.records.Panelist records
+    """
+    records.validate_return_type(return_type)
+
+    panelist_ids = info.retrieve_all_ids(database_connection)
+    return streaming.iter_by_ids(
+        panelist_ids,
+        lambda batch_ids: retrieve_by_ids(batch_ids, database_connection,
+                                          return_type),
+        batch_size)
 
 #endregion
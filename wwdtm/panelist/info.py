@@ -9,27 +9,101 @@ from collections import OrderedDict
 from typing import List, Dict
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
+import numpy
 from slugify import slugify
-from wwdtm.panelist import utility
+from wwdtm import cache, executor, records
+from wwdtm.panelist import core, utility
+
+#region Internal Functions
+def _build_grouped_scores(score_counts: List[Dict],
+                          min_score: int,
+                          max_score: int) -> Dict:
+    """Returns an OrderedDict containing the number of instances of
+    each score between the minimum and maximum scores, keyed by score
+
+    Arguments:
+        score_counts (List[Dict]): List of score and score count rows
+        min_score (int)
+        max_score (int)
+    """
+    scores = OrderedDict()
+    for score in range(min_score, max_score + 1):
+        scores[score] = 0
+
+    for row in score_counts:
+        scores[row["score"]] = row["score_count"]
+
+    return scores
+
+def _build_appearance_columns(appearances: List[tuple]) -> Dict:
+    """Returns an OrderedDict of NumPy arrays, one for each column of
+    panelist appearance data. Missing lightning round and score values
+    are stored as NaN and missing ranks are stored as empty strings.
+
+    Arguments:
+        appearances (List[tuple]): Rows containing panelistid, showid,
+        showdate, bestof, repeatshowid, panelistlrndstart,
+        panelistlrndcorrect, panelistscore and showpnlrank values, in
+        that order
+    """
+    (panelist_ids, show_ids, dates, best_of, repeat_show_ids, start,
+     correct, scores, ranks) = zip(*appearances)
+
+    columns = OrderedDict()
+    columns["panelist_ids"] = numpy.array(panelist_ids, dtype=int)
+    columns["show_ids"] = numpy.array(show_ids, dtype=int)
+    columns["dates"] = numpy.array(dates, dtype="datetime64[D]")
+    columns["best_of"] = numpy.array(best_of, dtype=bool)
+    columns["repeat_show"] = numpy.array(repeat_show_ids, dtype=bool)
+    columns["lightning_round_start"] = numpy.array(start, dtype=float)
+    columns["lightning_round_correct"] = numpy.array(correct, dtype=float)
+    columns["scores"] = numpy.array(scores, dtype=float)
+    columns["ranks"] = numpy.array([rank or "" for rank in ranks],
+                                   dtype="U2")
+    return columns
+
+def _retrieve_show_years(appearance_years: List[int],
+                         database_connection: mysql.connector.connect
+                        ) -> List[int]:
+    """Returns a list of each year with at least one show, querying the
+    list again if any of the years with panelist appearances are
+    missing from the stored list, such as after shows for a new year
+    have been added
+
+    Arguments:
+        appearance_years (List[int]): Years with panelist appearances
+        database_connection (mysql.connector.connect)
+    """
+    show_years = core.retrieve_show_years(database_connection)
+    if show_years and not set(appearance_years) <= set(show_years):
+        core.refresh_show_years(database_connection)
+        show_years = core.retrieve_show_years(database_connection)
+
+    return show_years
+
+#endregion
 
 #region Retrieval Functions
-def retrieve_all(database_connection: mysql.connector.connect) -> List[Dict]:
+def retrieve_all(database_connection: mysql.connector.connect,
+                 return_type: str = "dict") -> List[Dict]:
     """Returns a list of OrderedDicts containing panelist details for
     all panelists
 
     Arguments:
         database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Panelist records
     """
+    records.validate_return_type(return_type)
+
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT panelistid, panelist, panelistslug, "
                  "panelistgender "
                  "FROM ww_panelists "
                  "WHERE panelistslug != 'multiple' "
                  "ORDER BY panelist ASC;")
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query,
+                                    dictionary=True)
 
         panelists = []
         for row in result:
@@ -44,7 +118,7 @@ def retrieve_all(database_connection: mysql.connector.connect) -> List[Dict]:
             panelist["gender"] = row["panelistgender"]
             panelists.append(panelist)
 
-        return panelists
+        return records.convert_list(panelists, records.Panelist, return_type)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
@@ -58,13 +132,10 @@ def retrieve_all_ids(database_connection: mysql.connector.connect
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT panelistid FROM ww_panelists "
                  "WHERE panelistslug != 'multiple' "
                  "ORDER BY panelist ASC;")
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query)
 
         panelists = []
         for row in result:
@@ -76,6 +147,7 @@ def retrieve_all_ids(database_connection: mysql.connector.connect
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+@cache.cached("panelist")
 def retrieve_by_id(panelist_id: int,
                    database_connection: mysql.connector.connect,
                    pre_validated_id: bool = False) -> Dict:
@@ -89,17 +161,17 @@ def retrieve_by_id(panelist_id: int,
         has been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(panelist_id, database_connection):
+        try:
+            int(panelist_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT panelist, panelistgender, panelistslug "
                  "FROM ww_panelists "
                  "WHERE panelistid = %s;")
-        cursor.execute(query, (panelist_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (panelist_id,),
+                                    dictionary=True)
 
         if result:
             panelist_dict = OrderedDict()
@@ -119,6 +191,50 @@ def retrieve_by_id(panelist_id: int,
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+def retrieve_by_ids(panelist_ids: List[int],
+                    database_connection: mysql.connector.connect
+                   ) -> List[Dict]:
+    """Returns a list of OrderedDicts with panelist information for the
+    requested panelist IDs, in the order the IDs were requested. Unknown
+    panelist IDs are skipped.
+
+    Arguments:
+        panelist_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    if not panelist_ids:
+        return []
+
+    try:
+        placeholders = ", ".join(["%s"] * len(panelist_ids))
+        query = ("SELECT panelistid, panelist, panelistslug, panelistgender "
+                 "FROM ww_panelists "
+                 "WHERE panelistid IN ({});".format(placeholders))
+        result = executor.fetch_all(database_connection, query,
+                                    tuple(panelist_ids), dictionary=True,
+                                    prepared=False)
+
+        panelists_info = {}
+        for row in result:
+            panelist_info = OrderedDict()
+            panelist_info["id"] = row["panelistid"]
+            panelist_info["name"] = row["panelist"]
+            if row["panelistslug"]:
+                panelist_info["slug"] = row["panelistslug"]
+            else:
+                panelist_info["slug"] = slugify(panelist_info["name"])
+
+            panelist_info["gender"] = row["panelistgender"]
+            panelists_info[row["panelistid"]] = panelist_info
+
+        return [panelists_info[panelist_id] for panelist_id in panelist_ids
+                if panelist_id in panelists_info]
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+@cache.cached("panelist")
 def retrieve_by_slug(panelist_slug: str,
                      database_connection: mysql.connector.connect) -> Dict:
     """Returns an OrderedDict with panelist information based on the
@@ -150,28 +266,12 @@ def retrieve_scores_grouped_list_by_id(panelist_id: int,
         has been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(panelist_id, database_connection):
+        try:
+            int(panelist_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT MIN(pm.panelistscore) AS min, "
-                 "MAX(pm.panelistscore) AS max "
-                 "FROM ww_showpnlmap pm;")
-        cursor.execute(query)
-        result = cursor.fetchone()
-
-        if not result:
-            return None
-
-        min_score = result["min"]
-        max_score = result["max"]
-
-        scores = OrderedDict()
-        for score in range(min_score, max_score + 1):
-            scores[score] = 0
-
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT pm.panelistscore AS score, "
                  "COUNT(pm.panelistscore) AS score_count "
                  "FROM ww_showpnlmap pm "
@@ -181,15 +281,17 @@ def retrieve_scores_grouped_list_by_id(panelist_id: int,
                  "AND pm.panelistscore IS NOT NULL "
                  "GROUP BY pm.panelistscore "
                  "ORDER BY pm.panelistscore ASC;")
-        cursor.execute(query, (panelist_id,))
-        result = cursor.fetchall()
-        cursor.close()
+        score_counts = executor.fetch_all(database_connection, query,
+                                          (panelist_id,), dictionary=True)
 
-        if not result:
+        if not score_counts:
             return None
 
-        for row in result:
-            scores[row["score"]] = row["score_count"]
+        score_range = core.retrieve_score_range(database_connection)
+        if not score_range:
+            return None
+
+        scores = _build_grouped_scores(score_counts, *score_range)
 
         scores_list = OrderedDict()
         scores_list["score"] = list(scores.keys())
@@ -235,28 +337,12 @@ def retrieve_scores_grouped_ordered_pair_by_id(panelist_id: int,
         has been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(panelist_id, database_connection):
+        try:
+            int(panelist_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT MIN(pm.panelistscore) AS min, "
-                 "MAX(pm.panelistscore) AS max "
-                 "FROM ww_showpnlmap pm;")
-        cursor.execute(query)
-        result = cursor.fetchone()
-
-        if not result:
-            return None
-
-        min_score = result["min"]
-        max_score = result["max"]
-
-        scores = OrderedDict()
-        for score in range(min_score, max_score + 1):
-            scores[score] = 0
-
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT pm.panelistscore AS score, "
                  "COUNT(pm.panelistscore) AS score_count "
                  "FROM ww_showpnlmap pm "
@@ -266,15 +352,17 @@ def retrieve_scores_grouped_ordered_pair_by_id(panelist_id: int,
                  "AND pm.panelistscore IS NOT NULL "
                  "GROUP BY pm.panelistscore "
                  "ORDER BY pm.panelistscore ASC;")
-        cursor.execute(query, (panelist_id,))
-        result = cursor.fetchall()
-        cursor.close()
+        score_counts = executor.fetch_all(database_connection, query,
+                                          (panelist_id,), dictionary=True)
 
-        if not result:
+        if not score_counts:
             return None
 
-        for row in result:
-            scores[row["score"]] = row["score_count"]
+        score_range = core.retrieve_score_range(database_connection)
+        if not score_range:
+            return None
+
+        scores = _build_grouped_scores(score_counts, *score_range)
 
         return list(scores.items())
     except ProgrammingError as err:
@@ -315,11 +403,12 @@ def retrieve_scores_list_by_id(panelist_id: int,
         has been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(panelist_id, database_connection):
+        try:
+            int(panelist_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT s.showdate, pm.panelistscore "
                  "FROM ww_showpnlmap pm "
                  "JOIN ww_shows s ON s.showid = pm.showid "
@@ -327,9 +416,8 @@ def retrieve_scores_list_by_id(panelist_id: int,
                  "AND s.bestof = 0 AND s.repeatshowid IS NULL "
                  "AND pm.panelistscore IS NOT NULL "
                  "ORDER BY s.showdate ASC;")
-        cursor.execute(query, (panelist_id,))
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query, (panelist_id,),
+                                    dictionary=True)
 
         if not result:
             return None
@@ -382,11 +470,12 @@ def retrieve_scores_ordered_pair_by_id(panelist_id: int,
         has been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(panelist_id, database_connection):
+        try:
+            int(panelist_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT s.showdate, pm.panelistscore "
                  "FROM ww_showpnlmap pm "
                  "JOIN ww_shows s ON s.showid = pm.showid "
@@ -394,9 +483,8 @@ def retrieve_scores_ordered_pair_by_id(panelist_id: int,
                  "AND s.bestof = 0 AND s.repeatshowid IS NULL "
                  "AND pm.panelistscore IS NOT NULL "
                  "ORDER BY s.showdate ASC;")
-        cursor.execute(query, (panelist_id,))
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query, (panelist_id,),
+                                    dictionary=True)
 
         if not result:
             return None
@@ -447,23 +535,11 @@ def retrieve_yearly_appearances_by_id(panelist_id: int,
         has been validated or not
     """
     if not pre_validated_id:
-        if not utility.validate_id(panelist_id, database_connection):
+        try:
+            int(panelist_id)
+        except ValueError:
             return None
 
-    years = OrderedDict()
-    cursor = database_connection.cursor(dictionary=True)
-    query = ("SELECT DISTINCT YEAR(s.showdate) AS year FROM ww_shows s "
-             "ORDER BY YEAR(s.showdate) ASC")
-    cursor.execute(query)
-    result = cursor.fetchall()
-
-    if not result:
-        return None
-
-    for row in result:
-        years[row["year"]] = 0
-
-    cursor = database_connection.cursor(dictionary=True)
     query = ("SELECT YEAR(s.showdate) AS year, COUNT(p.panelist) AS count "
              "FROM ww_showpnlmap pm "
              "JOIN ww_shows s ON s.showid = pm.showid "
@@ -472,14 +548,22 @@ def retrieve_yearly_appearances_by_id(panelist_id: int,
              "AND s.repeatshowid IS NULL "
              "GROUP BY p.panelist, YEAR(s.showdate) "
              "ORDER BY p.panelist ASC, YEAR(s.showdate) ASC")
-    cursor.execute(query, (panelist_id, ))
-    result = cursor.fetchall()
-    cursor.close()
+    year_counts = executor.fetch_all(database_connection, query,
+                                     (panelist_id,), dictionary=True)
 
-    if not result:
+    if not year_counts:
         return None
 
-    for row in result:
+    show_years = _retrieve_show_years([row["year"] for row in year_counts],
+                                      database_connection)
+    if not show_years:
+        return None
+
+    years = OrderedDict()
+    for year in show_years:
+        years[year] = 0
+
+    for row in year_counts:
         years[row["year"]] = row["count"]
 
     return years
@@ -506,3 +590,204 @@ def retrieve_yearly_appearances_by_slug(panelist_slug: str,
     return None
 
 #endregion
+
+#region Bulk Retrieval Functions
+def retrieve_scores_grouped_list_all(database_connection: mysql.connector.connect
+                                    ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts, each containing two lists,
+    one with panelist scores and one with corresponding number of
+    instances a panelist has scored that amount, for all panelists with
+    at least one score, keyed by panelist ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    try:
+        query = ("SELECT pm.panelistid, pm.panelistscore AS score, "
+                 "COUNT(pm.panelistscore) AS score_count "
+                 "FROM ww_showpnlmap pm "
+                 "JOIN ww_shows s ON s.showid = pm.showid "
+                 "WHERE s.bestof = 0 AND s.repeatshowid IS NULL "
+                 "AND pm.panelistscore IS NOT NULL "
+                 "GROUP BY pm.panelistid, pm.panelistscore "
+                 "ORDER BY pm.panelistid ASC, pm.panelistscore ASC;")
+        result = executor.fetch_all(database_connection, query,
+                                    dictionary=True)
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+    if not result:
+        return OrderedDict()
+
+    score_range = core.retrieve_score_range(database_connection)
+    if not score_range:
+        return OrderedDict()
+
+    panelist_score_counts = OrderedDict()
+    for row in result:
+        panelist_score_counts.setdefault(row["panelistid"], []).append(row)
+
+    panelists = OrderedDict()
+    for panelist_id, score_counts in panelist_score_counts.items():
+        scores = _build_grouped_scores(score_counts, *score_range)
+        scores_list = OrderedDict()
+        scores_list["score"] = list(scores.keys())
+        scores_list["count"] = list(scores.values())
+        panelists[panelist_id] = scores_list
+
+    return panelists
+
+def retrieve_yearly_appearances_matrix(database_connection: mysql.connector.connect
+                                      ) -> Dict:
+    """Returns an OrderedDict containing a NumPy array with the number
+    of appearances each panelist has made in each year, along with the
+    panelist IDs, panelist slugs and years that label the rows and
+    columns of the array. Panelists are sorted by name and years are
+    sorted in ascending order.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    try:
+        query = ("SELECT p.panelistid, p.panelist, p.panelistslug, "
+                 "YEAR(s.showdate) AS year, COUNT(s.showid) AS count "
+                 "FROM ww_panelists p "
+                 "LEFT JOIN (ww_showpnlmap pm "
+                 "JOIN ww_shows s ON s.showid = pm.showid "
+                 "AND s.bestof = 0 AND s.repeatshowid IS NULL) "
+                 "ON pm.panelistid = p.panelistid "
+                 "WHERE p.panelistslug != 'multiple' "
+                 "GROUP BY p.panelistid, p.panelistslug, p.panelist, "
+                 "YEAR(s.showdate) "
+                 "ORDER BY p.panelist ASC, p.panelistid ASC, "
+                 "YEAR(s.showdate) ASC;")
+        result = executor.fetch_all(database_connection, query,
+                                    dictionary=True)
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+    appearance_years = [row["year"] for row in result if row["year"]]
+    years = _retrieve_show_years(appearance_years, database_connection) or []
+    year_columns = {year: column for column, year in enumerate(years)}
+
+    panelist_rows = OrderedDict()
+    for row in result:
+        if row["panelistid"] not in panelist_rows:
+            if row["panelistslug"]:
+                panelist_rows[row["panelistid"]] = row["panelistslug"]
+            else:
+                panelist_rows[row["panelistid"]] = slugify(row["panelist"])
+
+    panelist_indexes = {panelist_id: index for index, panelist_id
+                        in enumerate(panelist_rows)}
+    appearances = numpy.zeros((len(panelist_rows), len(years)), dtype=int)
+    for row in result:
+        if row["year"] in year_columns:
+            appearances[panelist_indexes[row["panelistid"]],
+                        year_columns[row["year"]]] = row["count"]
+
+    matrix = OrderedDict()
+    matrix["panelist_ids"] = list(panelist_rows.keys())
+    matrix["panelist_slugs"] = list(panelist_rows.values())
+    matrix["years"] = years
+    matrix["appearances"] = appearances
+    return matrix
+
+#endregion
+
+#region Columnar Retrieval Functions
+def retrieve_appearance_columns_by_id(panelist_id: int,
+                                      database_connection: mysql.connector.connect,
+                                      pre_validated_id: bool = False) -> Dict:
+    """Returns an OrderedDict of NumPy arrays containing the panelist
+    ID, show ID, show date (as datetime64), Best Of and repeat show
+    flags, lightning round start and correct counts, score and rank for
+    each appearance made by the requested panelist ID, sorted by show
+    date
+
+    Arguments:
+        panelist_id (int)
+        database_connection (mysql.connector.connect)
+        pre_validated_id (bool): Flag whether or not the panelist ID
+        has been validated
+    """
+    if not pre_validated_id:
+        try:
+            int(panelist_id)
+        except ValueError:
+            return None
+
+    try:
+        query = ("SELECT pm.panelistid, pm.showid, s.showdate, s.bestof, "
+                 "s.repeatshowid, pm.panelistlrndstart, "
+                 "pm.panelistlrndcorrect, pm.panelistscore, "
+                 "pm.showpnlrank FROM ww_showpnlmap pm "
+                 "JOIN ww_shows s ON s.showid = pm.showid "
+                 "WHERE pm.panelistid = %s "
+                 "ORDER BY s.showdate ASC;")
+        result = executor.fetch_all(database_connection, query, (panelist_id,))
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+    if not result:
+        return None
+
+    return _build_appearance_columns(result)
+
+def retrieve_appearance_columns_by_slug(panelist_slug: str,
+                                        database_connection: mysql.connector.connect
+                                       ) -> Dict:
+    """Returns an OrderedDict of NumPy arrays containing appearance
+    data for the requested panelist slug, sorted by show date
+
+    Arguments:
+        panelist_slug (str)
+        database_connection (mysql.connector.connect)
+    """
+    panelist_id = utility.convert_slug_to_id(panelist_slug,
+                                             database_connection)
+    if not panelist_id:
+        return None
+
+    return retrieve_appearance_columns_by_id(panelist_id,
+                                             database_connection,
+                                             pre_validated_id=True)
+
+def retrieve_appearance_columns_all(database_connection: mysql.connector.connect
+                                   ) -> Dict:
+    """Returns an OrderedDict of NumPy arrays containing appearance
+    data for all panelists, sorted by panelist name and then by show
+    date. Rows for a panelist can be selected using the panelist_ids
+    array.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    try:
+        query = ("SELECT pm.panelistid, pm.showid, s.showdate, s.bestof, "
+                 "s.repeatshowid, pm.panelistlrndstart, "
+                 "pm.panelistlrndcorrect, pm.panelistscore, "
+                 "pm.showpnlrank FROM ww_showpnlmap pm "
+                 "JOIN ww_panelists p ON p.panelistid = pm.panelistid "
+                 "JOIN ww_shows s ON s.showid = pm.showid "
+                 "WHERE p.panelistslug != 'multiple' "
+                 "ORDER BY p.panelist ASC, pm.panelistid ASC, "
+                 "s.showdate ASC;")
+        result = executor.fetch_all(database_connection, query)
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+    if not result:
+        return None
+
+    return _build_appearance_columns(result)
+
+#endregion
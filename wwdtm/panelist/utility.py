@@ -7,6 +7,7 @@ information from the Wait Wait... Don't Tell Me! Stats Page Database.
 
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import executor, slug_index
 
 #region Utility Functions
 def convert_slug_to_id(panelist_slug: str,
@@ -17,14 +18,15 @@ def convert_slug_to_id(panelist_slug: str,
         panelist_slug (str)
         database_connect (mysql.connector.connect)
     """
+    index = slug_index.get_index("panelist", database_connection)
+    if index is not None:
+        return index.id_for_slug(panelist_slug)
+
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT panelistid FROM ww_panelists "
                  "WHERE panelistslug = %s;")
-        cursor.execute(query, (panelist_slug,))
-
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query,
+                                    (panelist_slug,))
 
         if result:
             return result[0]
@@ -49,14 +51,14 @@ def validate_id(panelist_id: int,
     except ValueError:
         return False
 
+    index = slug_index.get_index("panelist", database_connection)
+    if index is not None:
+        return index.has_id(panelist_id)
+
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT panelistid FROM ww_panelists "
                  "WHERE panelistid = %s;")
-        cursor.execute(query, (panelist_id,))
-
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (panelist_id,))
 
         return bool(result)
     except ProgrammingError as err:
@@ -77,14 +79,15 @@ def validate_slug(panelist_slug: str,
     if not panelist_slug:
         return False
 
+    index = slug_index.get_index("panelist", database_connection)
+    if index is not None:
+        return index.has_slug(panelist_slug)
+
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT panelistslug FROM ww_panelists "
                  "WHERE panelistslug = %s;")
-        cursor.execute(query, (panelist_slug,))
-
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query,
+                                    (panelist_slug,))
 
         return bool(result)
     except ProgrammingError as err:
@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""This module provides a connection pool wrapper that can be passed to
+any wwdtm function in place of a database connection.
+
+Each thread checks out a connection from the pool when it opens its
+first cursor and returns the connection to the pool once all of its
+cursors have been closed. Use ConnectionPool.connection() to keep the
+same connection checked out across several function calls.
+"""
+
+from collections import OrderedDict
+import contextlib
+import json
+import threading
+import time
+from typing import Callable, Dict, Iterator
+import weakref
+import mysql.connector
+from mysql.connector.errors import Error, PoolError
+from mysql.connector.pooling import MySQLConnectionPool
+
+#region Constants
+DEFAULT_POOL_NAME = "wwdtm"
+DEFAULT_POOL_SIZE = 5
+#endregion
+
+#region Internal Functions
+def _disconnect(connection) -> None:
+    """Closes the MySQL connection used by a pooled connection without
+    returning it to the pool, ignoring any errors raised by the
+    connector
+
+    Arguments:
+        connection (mysql.connector.pooling.PooledMySQLConnection)
+    """
+    try:
+        connection.disconnect()
+    except Error:
+        pass
+
+#endregion
+
+#region Internal Classes
+class _Lease:
+    """Tracks a connection checked out from the pool by a thread and
+    the number of open cursors and pinned blocks using it
+
+    Arguments:
+        connection (mysql.connector.pooling.PooledMySQLConnection)
+    """
+
+    __slots__ = ("connection", "cursors", "pins", "released", "lock")
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.cursors = 0
+        self.pins = 0
+        self.released = False
+        self.lock = threading.Lock()
+
+class _PooledCursor:
+    """Cursor wrapper that releases its connection lease when the
+    cursor is closed or garbage collected
+
+    Arguments:
+        cursor (mysql.connector.cursor.MySQLCursor)
+        release (Callable): Function that releases the cursor's
+        connection lease
+    """
+
+    __slots__ = ("_cursor", "_finalizer", "__weakref__")
+
+    def __init__(self, cursor, release: Callable):
+        self._cursor = cursor
+        self._finalizer = weakref.finalize(self, release)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the cursor and releases its connection lease"""
+        try:
+            return self._cursor.close()
+        finally:
+            self._finalizer()
+
+#endregion
+
+#region Pool Class
+class ConnectionPool:
+    """Connection pool wrapper that can be used in place of a database
+    connection for any wwdtm function
+
+    Arguments:
+        pool (mysql.connector.pooling.MySQLConnectionPool)
+        timeout (float): Maximum number of seconds to wait for an
+        available connection. Waits indefinitely if no timeout is
+        provided.
+    """
+
+    def __init__(self, pool: MySQLConnectionPool, timeout: float = None):
+        self._pool = pool
+        self.timeout = timeout
+        self._semaphore = threading.BoundedSemaphore(pool.pool_size)
+        self._local = threading.local()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._checked_out = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @classmethod
+    def from_config(cls,
+                    database_config: Dict,
+                    pool_size: int = DEFAULT_POOL_SIZE,
+                    pool_name: str = DEFAULT_POOL_NAME,
+                    timeout: float = None) -> "ConnectionPool":
+        """Returns a new connection pool using the connection settings
+        from a database configuration dictionary
+
+        Arguments:
+            database_config (Dict): Connection settings, as found in
+            the database section of config.dist.json
+            pool_size (int)
+            pool_name (str)
+            timeout (float): Maximum number of seconds to wait for an
+            available connection
+        """
+        pool = MySQLConnectionPool(pool_name=pool_name,
+                                   pool_size=pool_size,
+                                   **database_config)
+        return cls(pool, timeout=timeout)
+
+    @classmethod
+    def from_config_file(cls,
+                         config_file_path: str = "config.json",
+                         environment: str = "local",
+                         pool_size: int = DEFAULT_POOL_SIZE,
+                         pool_name: str = DEFAULT_POOL_NAME,
+                         timeout: float = None) -> "ConnectionPool":
+        """Returns a new connection pool using the database section of
+        the requested environment in a configuration file that follows
+        the format of config.dist.json
+
+        Arguments:
+            config_file_path (str)
+            environment (str): Name of the environment section, such as
+            local, development or production
+            pool_size (int)
+            pool_name (str)
+            timeout (float): Maximum number of seconds to wait for an
+            available connection
+        """
+        with open(config_file_path, "r") as config_file:
+            config_dict = json.load(config_file)
+
+        if environment not in config_dict:
+            raise ValueError("Missing '{}' section in config "
+                             "file".format(environment))
+
+        return cls.from_config(config_dict[environment]["database"],
+                               pool_size=pool_size,
+                               pool_name=pool_name,
+                               timeout=timeout)
+
+    @property
+    def pool_name(self) -> str:
+        """Returns the name of the underlying connection pool"""
+        return self._pool.pool_name
+
+    @property
+    def pool_size(self) -> int:
+        """Returns the number of connections in the pool"""
+        return self._pool.pool_size
+
+    def _acquire(self, cursor: bool = True) -> _Lease:
+        """Returns the connection lease for the current thread with a
+        cursor or pin added, checking out a connection from the pool if
+        needed
+
+        Arguments:
+            cursor (bool): Flag whether a cursor or a pin is added
+        """
+        if self._closed:
+            raise PoolError("Connection pool {} is closed".format(
+                self.pool_name))
+
+        lease = getattr(self._local, "lease", None)
+        if lease is not None:
+            with lease.lock:
+                if not lease.released:
+                    if cursor:
+                        lease.cursors += 1
+                    else:
+                        lease.pins += 1
+                    return lease
+
+        start_time = time.perf_counter()
+        if not self._semaphore.acquire(blocking=False):
+            if self.timeout is None:
+                acquired = self._semaphore.acquire()
+            else:
+                acquired = self._semaphore.acquire(timeout=self.timeout)
+
+            if not acquired:
+                raise PoolError("Timed out waiting for an available "
+                                "connection from pool "
+                                "{}".format(self.pool_name))
+            waited = True
+        else:
+            waited = False
+
+        wait_time = time.perf_counter() - start_time
+
+        try:
+            connection = self._pool.get_connection()
+        except Exception:
+            self._semaphore.release()
+            raise
+
+        with self._lock:
+            self._checked_out += 1
+            self._checkouts += 1
+            if waited:
+                self._waits += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+
+        lease = _Lease(connection)
+        if cursor:
+            lease.cursors = 1
+        else:
+            lease.pins = 1
+        self._local.lease = lease
+        return lease
+
+    def _release(self, lease: _Lease, cursor: bool = True) -> None:
+        """Releases a cursor or pin from a connection lease and returns
+        the connection to the pool once the lease is no longer in use
+
+        Arguments:
+            lease (_Lease)
+            cursor (bool): Flag whether a cursor or a pin is released
+        """
+        with lease.lock:
+            if cursor:
+                lease.cursors -= 1
+            else:
+                lease.pins -= 1
+
+            if lease.cursors > 0 or lease.pins > 0 or lease.released:
+                return
+
+            lease.released = True
+
+        try:
+            if self._closed:
+                _disconnect(lease.connection)
+            else:
+                lease.connection.close()
+        finally:
+            with self._lock:
+                self._checked_out -= 1
+            self._semaphore.release()
+
+
+    def _close_idle_connections(self) -> int:
+        """Checks out and closes the connections that are not checked
+        out of the underlying connection pool and returns the number of
+        connections closed"""
+        closed = 0
+        for _ in range(self.pool_size):
+            try:
+                connection = self._pool.get_connection()
+            except PoolError:
+                break
+            except Error:
+                continue
+
+            _disconnect(connection)
+            closed += 1
+
+        return closed
+
+    def cursor(self, *args, **kwargs):
+        """Returns a cursor from the connection checked out by the
+        current thread. The connection is returned to the pool once all
+        of the thread's cursors are closed.
+
+        Accepts the same arguments as
+        mysql.connector.connection.MySQLConnection.cursor
+        """
+        lease = self._acquire()
+        try:
+            cursor = lease.connection.cursor(*args, **kwargs)
+        except Exception:
+            self._release(lease)
+            raise
+
+        return _PooledCursor(cursor, lambda: self._release(lease))
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[mysql.connector.connect]:
+        """Context manager that keeps a connection checked out by the
+        current thread for the duration of the block and yields it.
+        Cursors opened through the pool within the block use the same
+        connection."""
+        lease = self._acquire(cursor=False)
+        try:
+            yield lease.connection
+        finally:
+            self._release(lease, cursor=False)
+
+    def close(self) -> int:
+        """Closes the connections that are not checked out and returns
+        the number of connections closed. Connections that are checked
+        out are closed when they are released instead of being returned
+        to the pool, and no more connections can be checked out."""
+        self._closed = True
+        return self._close_idle_connections()
+
+    def statistics(self) -> Dict:
+        """Returns an OrderedDict with the pool size, the number of
+        connections checked out and connection wait time metrics"""
+        with self._lock:
+            stats = OrderedDict()
+            stats["pool_name"] = self.pool_name
+            stats["pool_size"] = self.pool_size
+            stats["checked_out"] = self._checked_out
+            stats["available"] = self.pool_size - self._checked_out
+            stats["checkouts"] = self._checkouts
+            stats["waits"] = self._waits
+            stats["total_wait_time"] = round(self._total_wait_time, 6)
+            stats["max_wait_time"] = round(self._max_wait_time, 6)
+            if self._checkouts:
+                stats["average_wait_time"] = round(
+                    self._total_wait_time / self._checkouts, 6)
+            else:
+                stats["average_wait_time"] = 0.0
+            return stats
+
+    def reset_statistics(self) -> None:
+        """Resets the checkout and wait time counters"""
+        with self._lock:
+            self._checkouts = 0
+            self._waits = 0
+            self._total_wait_time = 0.0
+            self._max_wait_time = 0.0
+
+#endregion
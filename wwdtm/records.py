@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""This module provides compact record classes that can be returned by
+the bulk retrieval functions in place of OrderedDicts.
+
+Record classes use __slots__ rather than a per-instance dictionary.
+Fields that are not included in a response are left unset and are
+omitted by to_dict(), so to_dict() returns the same OrderedDict that
+the corresponding function returns when return_type is "dict".
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List
+
+#region Constants
+RETURN_TYPES = ("dict", "record")
+#endregion
+
+_UNSET = object()
+
+#region Internal Functions
+def _to_plain(value: Any) -> Any:
+    """Returns a value with any records converted to OrderedDicts
+
+    Arguments:
+        value (Any)
+    """
+    if isinstance(value, Record):
+        return value.to_dict()
+
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+
+    if isinstance(value, dict):
+        return OrderedDict((key, _to_plain(item))
+                           for key, item in value.items())
+
+    return value
+
+def _record_list(record_class: type) -> Callable:
+    """Returns a function that converts a list of dictionaries into a
+    list of records
+
+    Arguments:
+        record_class (type)
+    """
+    def convert(values: List[Dict]) -> List:
+        return [record_class.from_dict(value) for value in values]
+
+    return convert
+
+def _record(record_class: type) -> Callable:
+    """Returns a function that converts a dictionary into a record
+
+    Arguments:
+        record_class (type)
+    """
+    return record_class.from_dict
+
+def _appearances(values: Dict) -> Dict:
+    """Returns a copy of an appearance or recording OrderedDict with
+    its list of shows converted to Appearance records
+
+    Arguments:
+        values (Dict)
+    """
+    appearances = OrderedDict(values)
+    if appearances.get("shows"):
+        appearances["shows"] = [Appearance.from_dict(show)
+                                for show in appearances["shows"]]
+
+    return appearances
+
+#endregion
+
+#region Record Classes
+class Record:
+    """Base class for records. Subclasses list their fields, in output
+    order, in __slots__ and may map fields to functions that convert
+    nested dictionaries in _nested."""
+
+    __slots__ = ()
+    _nested = {}
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            if name not in self.__slots__:
+                raise TypeError("{} has no field named "
+                                "{}".format(type(self).__name__, name))
+            setattr(self, name, value)
+
+    @classmethod
+    def from_dict(cls, values: Dict) -> "Record":
+        """Returns a new record built from a dictionary returned by a
+        retrieval function
+
+        Arguments:
+            values (Dict)
+        """
+        record = cls.__new__(cls)
+        nested = cls._nested
+        for name, value in values.items():
+            if value is not None and name in nested:
+                value = nested[name](value)
+            setattr(record, name, value)
+
+        return record
+
+    def to_dict(self) -> Dict:
+        """Returns an OrderedDict containing the fields that are set,
+        with any nested records also converted to OrderedDicts"""
+        values = OrderedDict()
+        for name in self.__slots__:
+            value = getattr(self, name, _UNSET)
+            if value is not _UNSET:
+                values[name] = _to_plain(value)
+
+        return values
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return all(getattr(self, name, _UNSET) == getattr(other, name, _UNSET)
+                   for name in self.__slots__)
+
+    def __repr__(self):
+        fields = ", ".join("{}={!r}".format(name, getattr(self, name))
+                           for name in self.__slots__
+                           if getattr(self, name, _UNSET) is not _UNSET)
+        return "{}({})".format(type(self).__name__, fields)
+
+class Appearance(Record):
+    """Show appearance or recording for a panelist, guest, host,
+    scorekeeper or location"""
+
+    __slots__ = ("show_id", "date", "best_of", "repeat_show",
+                 "lightning_round_start", "lightning_round_correct", "score",
+                 "score_exception", "rank", "guest", "description")
+
+class Guest(Record):
+    """Guest information, show guest information or guest details"""
+
+    __slots__ = ("id", "name", "slug", "score", "score_exception",
+                 "appearances")
+    _nested = {"appearances": _appearances}
+
+class Host(Record):
+    """Host information, show host information or host details"""
+
+    __slots__ = ("id", "name", "slug", "gender", "guest", "appearances")
+    _nested = {"appearances": _appearances}
+
+class Location(Record):
+    """Location information, show location information or location
+    recordings"""
+
+    __slots__ = ("id", "slug", "city", "state", "venue", "recordings")
+    _nested = {"recordings": _appearances}
+
+class Panelist(Record):
+    """Panelist information, show panelist information or panelist
+    details"""
+
+    __slots__ = ("id", "name", "slug", "gender", "lightning_round_start",
+                 "lightning_round_correct", "score", "rank", "statistics",
+                 "bluffs", "appearances")
+    _nested = {"appearances": _appearances}
+
+class Scorekeeper(Record):
+    """Scorekeeper information, show scorekeeper information or
+    scorekeeper details"""
+
+    __slots__ = ("id", "name", "slug", "gender", "guest", "description",
+                 "appearances")
+    _nested = {"appearances": _appearances}
+
+class Show(Record):
+    """Show information or show details"""
+
+    __slots__ = ("id", "date", "best_of", "repeat_show", "original_show_id",
+                 "original_show_date", "location", "description", "notes",
+                 "host", "scorekeeper", "panelists", "bluff", "guests")
+    _nested = {
+        "location": _record(Location),
+        "host": _record(Host),
+        "scorekeeper": _record(Scorekeeper),
+        "panelists": _record_list(Panelist),
+        "guests": _record_list(Guest),
+    }
+
+#endregion
+
+#region Conversion Functions
+def validate_return_type(return_type: str) -> None:
+    """Raises a ValueError if the requested return type is not
+    supported
+
+    Arguments:
+        return_type (str): Either "dict" or "record"
+    """
+    if return_type not in RETURN_TYPES:
+        raise ValueError("Invalid return type: {}".format(return_type))
+
+def convert_list(values: List[Dict],
+                 record_class: type,
+                 return_type: str = "dict") -> List:
+    """Returns a list of dictionaries returned by a retrieval function
+    in the requested return type. Records replace the dictionaries in
+    the list one at a time, so each dictionary can be freed as soon as
+    it has been converted.
+
+    Arguments:
+        values (List[Dict])
+        record_class (type)
+        return_type (str): Either "dict" or "record"
+    """
+    validate_return_type(return_type)
+    if return_type == "dict" or not values:
+        return values
+
+    for index, value in enumerate(values):
+        values[index] = record_class.from_dict(value)
+
+    return values
+
+#endregion
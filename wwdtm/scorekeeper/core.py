@@ -5,12 +5,32 @@
 information from the Wait Wait... Don't Tell Me! Stats Page Database.
 """
 
-from collections import OrderedDict
 from typing import List, Dict
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import executor, showmap
 from wwdtm.scorekeeper import utility
 
+#region Internal Functions
+def _build_appearance(appearance: Dict) -> Dict:
+    """Returns an OrderedDict containing show information for a
+    scorekeeper appearance row
+
+    Arguments:
+        appearance (Dict): Row containing showid, showdate, bestof,
+        repeatshowid, guest and description values
+    """
+    info = showmap.build_show_info(appearance)
+    info["guest"] = bool(appearance["guest"])
+    if appearance["description"]:
+        info["description"] = appearance["description"]
+    else:
+        info["description"] = None
+
+    return info
+
+#endregion
+
 #region Core Functions
 def retrieve_appearances_by_id(scorekeeper_id: int,
                                database_connection: mysql.connector.connect,
@@ -25,69 +45,35 @@ def retrieve_appearances_by_id(scorekeeper_id: int,
         has been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(scorekeeper_id, database_connection):
+        try:
+            int(scorekeeper_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT ( "
-                 "SELECT COUNT(skm.showid) FROM ww_showskmap skm "
-                 "JOIN ww_shows s ON s.showid = skm.showid "
-                 "WHERE s.bestof = 0 AND s.repeatshowid IS NULL AND "
-                 "skm.scorekeeperid = %s ) AS regular, ( "
-                 "SELECT COUNT(skm.showid) FROM ww_showskmap skm "
-                 "JOIN ww_shows s ON s.showid = skm.showid "
-                 "WHERE skm.scorekeeperid = %s ) AS allshows;")
-        cursor.execute(query, (scorekeeper_id, scorekeeper_id,))
-        result = cursor.fetchone()
-
-        appearance_info = OrderedDict()
-        appearance_counts = OrderedDict()
-        appearance_counts["regular_shows"] = result["regular"]
-        appearance_counts["all_shows"] = result["allshows"]
-
-        query = ("SELECT skm.showid, s.showdate, s.bestof, "
+        query = ("SELECT sk.scorekeeperid, skm.showid, s.showdate, s.bestof, "
                  "s.repeatshowid, skm.guest, skm.description "
-                 "FROM ww_showskmap skm "
-                 "JOIN ww_scorekeepers sk ON "
-                 "sk.scorekeeperid = skm.scorekeeperid "
-                 "JOIN ww_shows s ON s.showid = skm.showid "
-                 "WHERE skm.scorekeeperid = %s "
+                 "FROM ww_scorekeepers sk "
+                 "LEFT JOIN (ww_showskmap skm "
+                 "JOIN ww_shows s ON s.showid = skm.showid) "
+                 "ON skm.scorekeeperid = sk.scorekeeperid "
+                 "WHERE sk.scorekeeperid = %s "
                  "ORDER BY s.showdate ASC;")
-
-        cursor.execute(query, (scorekeeper_id,))
-        result = cursor.fetchall()
-        cursor.close()
-
-        if result:
-            appearances = []
-            for appearance in result:
-                if appearance["description"]:
-                    description = appearance["description"]
-                else:
-                    description = None
-
-                info = OrderedDict()
-                info["show_id"] = appearance["showid"]
-                info["date"] = appearance["showdate"].isoformat()
-                info["best_of"] = bool(appearance["bestof"])
-                info["repeat_show"] = bool(appearance["repeatshowid"])
-                info["guest"] = bool(appearance["guest"])
-                info["description"] = description
-                appearances.append(info)
-
-            appearance_info["count"] = appearance_counts
-            appearance_info["shows"] = appearances
-        else:
-            appearance_info["count"] = 0
-            appearance_info["shows"] = None
-
-        return appearance_info
+        result = executor.fetch_all(database_connection, query,
+                                    (scorekeeper_id,), dictionary=True)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+    if not pre_validated_id and not result:
+        return None
+
+    # Appearance counts are derived from the same rows as the list of
+    # appearances
+    appearances = [row for row in result if row["showid"] is not None]
+    return showmap.build_appearances(appearances, _build_appearance)
+
 def retrieve_appearances_by_slug(scorekeeper_slug: str,
                                  database_connection: mysql.connector.connect
                                 ) -> List[Dict]:
@@ -105,4 +91,57 @@ def retrieve_appearances_by_slug(scorekeeper_slug: str,
 
     return None
 
+def _retrieve_appearances(database_connection: mysql.connector.connect,
+                          scorekeeper_ids: List[int] = None
+                         ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing appearance
+    information for all scorekeepers or the requested scorekeeper IDs,
+    keyed by scorekeeper ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        scorekeeper_ids (List[int]): List of scorekeeper IDs to
+        retrieve. All scorekeepers are retrieved if no list is provided.
+    """
+    if scorekeeper_ids is not None and not scorekeeper_ids:
+        return {}
+
+    query = ("SELECT sk.scorekeeperid, skm.showid, s.showdate, s.bestof, "
+             "s.repeatshowid, skm.guest, skm.description "
+             "FROM ww_scorekeepers sk "
+             "LEFT JOIN (ww_showskmap skm "
+             "JOIN ww_shows s ON s.showid = skm.showid) "
+             "ON skm.scorekeeperid = sk.scorekeeperid ")
+    if scorekeeper_ids:
+        query += "WHERE sk.scorekeeperid IN ({}) ".format(
+            ", ".join(["%s"] * len(scorekeeper_ids)))
+    query += "ORDER BY sk.scorekeeperid ASC, s.showdate ASC;"
+    return showmap.retrieve_grouped(
+        database_connection, query, "scorekeeperid",
+        lambda rows: showmap.build_appearances(rows, _build_appearance),
+        tuple(scorekeeper_ids) if scorekeeper_ids else None, prepared=False)
+
+def retrieve_appearances_all(database_connection: mysql.connector.connect
+                            ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing appearance
+    information for all scorekeepers, keyed by scorekeeper ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_appearances(database_connection)
+
+def retrieve_appearances_by_ids(scorekeeper_ids: List[int],
+                                database_connection: mysql.connector.connect
+                               ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts containing appearance
+    information for the requested scorekeeper IDs, keyed by scorekeeper
+    ID. Scorekeeper IDs that do not exist are not included.
+
+    Arguments:
+        scorekeeper_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_appearances(database_connection, list(scorekeeper_ids))
+
 #endregion
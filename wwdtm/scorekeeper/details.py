@@ -5,11 +5,14 @@
 from the Wait Wait... Don't Tell Me! Stats Page Database.
 """
 
-from typing import List, Dict
+from collections import OrderedDict
+from typing import List, Dict, Iterator
 import mysql.connector
+from wwdtm import cache, records, streaming
 from wwdtm.scorekeeper import core, info, utility
 
 #region Retrieval Functions
+@cache.cached("scorekeeper")
 def retrieve_by_id(scorekeeper_id: int,
                    database_connection: mysql.connector.connect,
                    pre_validated_id: bool = False) -> Dict:
@@ -22,18 +25,18 @@ def retrieve_by_id(scorekeeper_id: int,
         pre_validated_id (bool): Flag whether or not the scorekeeper ID
         has been validated
     """
-    if not pre_validated_id:
-        if not utility.validate_id(scorekeeper_id, database_connection):
-            return None
-
     scorekeeper = info.retrieve_by_id(scorekeeper_id,
                                       database_connection,
-                                      pre_validated_id=True)
+                                      pre_validated_id=pre_validated_id)
+    if not scorekeeper:
+        return None
+
     scorekeeper["appearances"] = core.retrieve_appearances_by_id(scorekeeper_id,
                                                                  database_connection,
                                                                  pre_validated_id=True)
     return scorekeeper
 
+@cache.cached("scorekeeper")
 def retrieve_by_slug(scorekeeper_slug: str,
                      database_connection: mysql.connector.connect
                     ) -> Dict:
@@ -52,26 +55,93 @@ def retrieve_by_slug(scorekeeper_slug: str,
                               pre_validated_id=True)
     return None
 
-def retrieve_all(database_connection: mysql.connector.connect
-                ) -> List[Dict]:
+def retrieve_all(database_connection: mysql.connector.connect,
+                 return_type: str = "dict") -> List[Dict]:
     """Returns a list of OrderedDicts with scorekeeper details for all
     scorekeepers
 
     Arguments:
         database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Scorekeeper records
     """
-    scorekeeper_ids = info.retrieve_all_ids(database_connection)
-    if not scorekeeper_ids:
+    records.validate_return_type(return_type)
+
+    scorekeepers = info.retrieve_all(database_connection)
+    if not scorekeepers:
         return None
 
-    scorekeepers = []
+    # Retrieve the appearances for all scorekeepers with one query and
+    # attach them to the scorekeeper information
+    appearances = core.retrieve_appearances_all(database_connection)
+    for scorekeeper in scorekeepers:
+        scorekeeper["appearances"] = appearances.get(scorekeeper["id"])
+
+    return records.convert_list(scorekeepers, records.Scorekeeper, return_type)
+
+def retrieve_by_ids(scorekeeper_ids: List[int],
+                    database_connection: mysql.connector.connect,
+                    return_type: str = "dict") -> List[Dict]:
+    """Returns a list of OrderedDicts with scorekeeper details for the
+    requested scorekeeper IDs, in the order the scorekeeper IDs were
+    requested. Invalid or unknown scorekeeper IDs are skipped.
+
+    Arguments:
+        scorekeeper_ids (List[int])
+        database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Scorekeeper records
+    """
+    records.validate_return_type(return_type)
+
+    valid_ids = []
     for scorekeeper_id in scorekeeper_ids:
-        scorekeeper = retrieve_by_id(scorekeeper_id,
-                                     database_connection,
-                                     pre_validated_id=True)
+        try:
+            valid_ids.append(int(scorekeeper_id))
+        except (TypeError, ValueError):
+            continue
+
+    if not valid_ids:
+        return None
+
+    query_ids = list(OrderedDict.fromkeys(valid_ids))
+    scorekeepers = info.retrieve_by_ids(query_ids, database_connection)
+    appearances = core.retrieve_appearances_by_ids(query_ids,
+                                                   database_connection)
+    scorekeepers_info = {scorekeeper["id"]: scorekeeper
+                         for scorekeeper in scorekeepers}
+
+    scorekeepers_details = []
+    for scorekeeper_id in valid_ids:
+        scorekeeper = scorekeepers_info.get(scorekeeper_id)
         if scorekeeper:
-            scorekeepers.append(scorekeeper)
+            scorekeeper["appearances"] = appearances.get(scorekeeper_id)
+            scorekeepers_details.append(scorekeeper)
+
+    return records.convert_list(scorekeepers_details, records.Scorekeeper,
+                                return_type)
+
+def iter_all(database_connection: mysql.connector.connect,
+             batch_size: int = streaming.DEFAULT_BATCH_SIZE,
+             return_type: str = "dict") -> Iterator[Dict]:
+    """Returns an iterator that yields OrderedDicts with scorekeeper
+    details for all scorekeepers, in the same order as retrieve_all.
+    Details are retrieved for batch_size scorekeepers at a time, so only
+    one batch is held in memory.
 
-    return scorekeepers
+    Arguments:
+        database_connection (mysql.connector.connect)
+        batch_size (int): Number of scorekeepers to retrieve at a time
+        return_type (str): Either "dict" to yield OrderedDicts or
+        "record" to yield wwdtm.records.Scorekeeper records
+    """
+    records.validate_return_type(return_type)
+
+    scorekeeper_ids = info.retrieve_all_ids(database_connection)
+    return streaming.iter_by_ids(
+        scorekeeper_ids,
+        lambda batch_ids: retrieve_by_ids(batch_ids, database_connection,
+                                          return_type),
+        batch_size)
 
 #endregion
@@ -10,25 +10,29 @@ from typing import List, Dict
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
 from slugify import slugify
+from wwdtm import cache, executor, records
 from wwdtm.scorekeeper import utility
 
 #region Retrieval Functions
-def retrieve_all(database_connection: mysql.connector.connect) -> List[Dict]:
+def retrieve_all(database_connection: mysql.connector.connect,
+                 return_type: str = "dict") -> List[Dict]:
     """Returns a list of OrderedDicts with scorekeeper information for
     all scorekeepers
 
     Arguments:
         database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Scorekeeper records
     """
+    records.validate_return_type(return_type)
+
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT scorekeeperid, scorekeeper, scorekeeperslug, "
                  "scorekeepergender "
                  "FROM ww_scorekeepers where scorekeeperslug != 'tbd' "
                  "ORDER BY scorekeeper ASC;")
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query,
+                                    dictionary=True)
 
         scorekeepers = []
         for row in result:
@@ -43,7 +47,8 @@ def retrieve_all(database_connection: mysql.connector.connect) -> List[Dict]:
             info["gender"] = row["scorekeepergender"]
             scorekeepers.append(info)
 
-        return scorekeepers
+        return records.convert_list(scorekeepers, records.Scorekeeper,
+                                    return_type)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
@@ -58,13 +63,10 @@ def retrieve_all_ids(database_connection: mysql.connector.connect
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT scorekeeperid FROM ww_scorekeepers "
                  "WHERE scorekeeperslug != 'tbd' "
                  "ORDER BY scorekeeper ASC;")
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query)
 
         panelists = []
         for row in result:
@@ -76,6 +78,7 @@ def retrieve_all_ids(database_connection: mysql.connector.connect
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+@cache.cached("scorekeeper")
 def retrieve_by_id(scorekeeper_id: int,
                    database_connection: mysql.connector.connect,
                    pre_validated_id: bool = False) -> Dict:
@@ -89,18 +92,18 @@ def retrieve_by_id(scorekeeper_id: int,
         has been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(scorekeeper_id, database_connection):
+        try:
+            int(scorekeeper_id)
+        except ValueError:
             return None
 
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT scorekeeper, scorekeeperslug, "
                  "scorekeepergender "
                  "FROM ww_scorekeepers "
                  "WHERE scorekeeperid = %s;")
-        cursor.execute(query, (scorekeeper_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query,
+                                    (scorekeeper_id,), dictionary=True)
 
         if result:
             scorekeeper_dict = OrderedDict()
@@ -120,6 +123,51 @@ def retrieve_by_id(scorekeeper_id: int,
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+def retrieve_by_ids(scorekeeper_ids: List[int],
+                    database_connection: mysql.connector.connect
+                   ) -> List[Dict]:
+    """Returns a list of OrderedDicts with scorekeeper information for the
+    requested scorekeeper IDs, in the order the IDs were requested. Unknown
+    scorekeeper IDs are skipped.
+
+    Arguments:
+        scorekeeper_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    if not scorekeeper_ids:
+        return []
+
+    try:
+        placeholders = ", ".join(["%s"] * len(scorekeeper_ids))
+        query = ("SELECT scorekeeperid, scorekeeper, scorekeeperslug, "
+                 "scorekeepergender FROM ww_scorekeepers "
+                 "WHERE scorekeeperid IN ({});".format(placeholders))
+        result = executor.fetch_all(database_connection, query,
+                                    tuple(scorekeeper_ids), dictionary=True,
+                                    prepared=False)
+
+        scorekeepers_info = {}
+        for row in result:
+            scorekeeper_info = OrderedDict()
+            scorekeeper_info["id"] = row["scorekeeperid"]
+            scorekeeper_info["name"] = row["scorekeeper"]
+            if row["scorekeeperslug"]:
+                scorekeeper_info["slug"] = row["scorekeeperslug"]
+            else:
+                scorekeeper_info["slug"] = slugify(scorekeeper_info["name"])
+
+            scorekeeper_info["gender"] = row["scorekeepergender"]
+            scorekeepers_info[row["scorekeeperid"]] = scorekeeper_info
+
+        return [scorekeepers_info[scorekeeper_id]
+                for scorekeeper_id in scorekeeper_ids
+                if scorekeeper_id in scorekeepers_info]
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+@cache.cached("scorekeeper")
 def retrieve_by_slug(scorekeeper_slug: str,
                      database_connection: mysql.connector.connect) -> Dict:
     """Returns an OrderedDict with scorekeeper information for the
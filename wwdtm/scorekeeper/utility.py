@@ -7,6 +7,7 @@ information from the Wait Wait... Don't Tell Me! Stats Page Database.
 
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import executor, slug_index
 
 #region Utility Functions
 def convert_slug_to_id(scorekeeper_slug: str,
@@ -17,13 +18,15 @@ def convert_slug_to_id(scorekeeper_slug: str,
         scorekeeper_slug (str)
         database_connect (mysql.connector.connect)
     """
+    index = slug_index.get_index("scorekeeper", database_connection)
+    if index is not None:
+        return index.id_for_slug(scorekeeper_slug)
+
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT scorekeeperid FROM ww_scorekeepers "
                  "WHERE scorekeeperslug = %s;")
-        cursor.execute(query, (scorekeeper_slug,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query,
+                                    (scorekeeper_slug,))
 
         if result:
             return result[0]
@@ -48,13 +51,15 @@ def validate_id(scorekeeper_id: int,
     except ValueError:
         return False
 
+    index = slug_index.get_index("scorekeeper", database_connection)
+    if index is not None:
+        return index.has_id(scorekeeper_id)
+
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT scorekeeperid FROM ww_scorekeepers "
                  "WHERE scorekeeperid = %s;")
-        cursor.execute(query, (scorekeeper_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query,
+                                    (scorekeeper_id,))
 
         return bool(result)
     except ProgrammingError as err:
@@ -75,13 +80,15 @@ def validate_slug(scorekeeper_slug: str,
     if not scorekeeper_slug:
         return False
 
+    index = slug_index.get_index("scorekeeper", database_connection)
+    if index is not None:
+        return index.has_slug(scorekeeper_slug)
+
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT scorekeeperslug FROM ww_scorekeepers "
                  "WHERE scorekeeperslug = %s;")
-        cursor.execute(query, (scorekeeper_slug,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query,
+                                    (scorekeeper_slug,))
 
         return bool(result)
     except ProgrammingError as err:
@@ -10,9 +10,380 @@ from typing import List, Dict
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
 from slugify import slugify
+from wwdtm import executor
 from wwdtm.location import utility as location_utility
 from wwdtm.show import utility
 
+#region Internal Functions
+def _build_core_info(show_id: int,
+                     result: Dict,
+                     original_show_date: str = None) -> Dict:
+    """Returns an OrderedDict with core show information built from a
+    row returned by one of the core information queries
+
+    Arguments:
+        show_id (int)
+        result (Dict): Row returned from the core information query
+        original_show_date (str): Date of the original show if the
+        show is a repeat
+    """
+    repeat_show_id = result["repeatshowid"]
+
+    if result["showdescription"]:
+        show_description = str(result["showdescription"]).strip()
+    else:
+        show_description = None
+
+    if result["shownotes"]:
+        show_notes = str(result["shownotes"]).strip()
+    else:
+        show_notes = None
+
+    location_id = result["locationid"]
+    location_slug = result["locationslug"]
+    location_city = result["city"]
+    location_state = result["state"]
+    location_venue = result["venue"]
+
+    if not location_slug:
+        location_slug = location_utility.slugify_location(location_id=location_id,
+                                                          city=location_city,
+                                                          state=location_state,
+                                                          venue=location_venue)
+
+    location_info = OrderedDict()
+    location_info["id"] = location_id
+    location_info["slug"] = location_slug
+    location_info["city"] = location_city
+    location_info["state"] = location_state
+    location_info["venue"] = location_venue
+
+    host_info = OrderedDict()
+    host_info["id"] = result["hostid"]
+    host_info["name"] = result["host"]
+    if result["hostslug"]:
+        host_info["slug"] = result["hostslug"]
+    else:
+        host_info["slug"] = slugify(host_info["name"])
+
+    host_info["guest"] = bool(result["hostguest"])
+
+    if result["description"]:
+        scorekeeper_description = result["description"]
+    else:
+        scorekeeper_description = None
+
+    scorekeeper_info = OrderedDict()
+    scorekeeper_info["id"] = result["scorekeeperid"]
+    scorekeeper_info["name"] = result["scorekeeper"]
+    if result["scorekeeperslug"]:
+        scorekeeper_info["slug"] = result["scorekeeperslug"]
+    else:
+        scorekeeper_info["slug"] = slugify(scorekeeper_info["name"])
+
+    scorekeeper_info["guest"] = bool(result["scorekeeperguest"])
+    scorekeeper_info["description"] = scorekeeper_description
+
+    show_info = OrderedDict()
+    show_info["id"] = show_id
+    show_info["date"] = result["showdate"].isoformat()
+    show_info["best_of"] = bool(result["bestof"])
+    show_info["repeat_show"] = bool(repeat_show_id)
+
+    if repeat_show_id:
+        show_info["original_show_id"] = repeat_show_id
+        show_info["original_show_date"] = original_show_date
+
+    show_info["description"] = show_description
+    show_info["notes"] = show_notes
+    show_info["location"] = location_info
+    show_info["host"] = host_info
+    show_info["scorekeeper"] = scorekeeper_info
+
+    return show_info
+
+def _build_panelist_info(panelist: Dict) -> Dict:
+    """Returns an OrderedDict with panelist information built from a
+    row returned by one of the panelist information queries
+
+    Arguments:
+        panelist (Dict): Row returned from the panelist query
+    """
+    if panelist["showpnlrank"]:
+        panelist_rank = panelist["showpnlrank"]
+    else:
+        panelist_rank = None
+
+    info = OrderedDict()
+    info["id"] = panelist["panelistid"]
+    info["name"] = panelist["panelist"]
+    if panelist["panelistslug"]:
+        info["slug"] = panelist["panelistslug"]
+    else:
+        info["slug"] = slugify(info["name"])
+
+    info["lightning_round_start"] = panelist["start"]
+    info["lightning_round_correct"] = panelist["correct"]
+    info["score"] = panelist["panelistscore"]
+    info["rank"] = panelist_rank
+    return info
+
+def _build_bluff_panelist_info(panelist_id: int,
+                               panelist_name: str,
+                               panelist_slug: str) -> Dict:
+    """Returns an OrderedDict with the ID, name and slug of a panelist
+    referenced by a Bluff the Listener entry
+
+    Arguments:
+        panelist_id (int)
+        panelist_name (str)
+        panelist_slug (str)
+    """
+    info = OrderedDict()
+    info["id"] = panelist_id
+    info["name"] = panelist_name
+    if panelist_slug:
+        info["slug"] = panelist_slug
+    else:
+        info["slug"] = slugify(info["name"])
+
+    return info
+
+def _build_bluff_info(chosen_bluff_info: Dict = None,
+                      correct_bluff_info: Dict = None) -> Dict:
+    """Returns an OrderedDict containing the chosen and correct Bluff
+    the Listener panelist information
+
+    Arguments:
+        chosen_bluff_info (Dict)
+        correct_bluff_info (Dict)
+    """
+    bluff_info = OrderedDict()
+    bluff_info["chosen_panelist"] = chosen_bluff_info
+    bluff_info["correct_panelist"] = correct_bluff_info
+    return bluff_info
+
+def _build_guest_info(guest: Dict) -> Dict:
+    """Returns an OrderedDict with guest information built from a row
+    returned by one of the guest information queries
+
+    Arguments:
+        guest (Dict): Row returned from the guest query
+    """
+    info = OrderedDict()
+    info["id"] = guest["guestid"]
+    info["name"] = guest["guest"]
+    if guest["guestslug"]:
+        info["slug"] = guest["guestslug"]
+    else:
+        info["slug"] = slugify(info["name"])
+
+    info["score"] = guest["guestscore"]
+    info["score_exception"] = bool(guest["exception"])
+    return info
+
+def _build_show_ids_clause(show_ids: List[int]) -> str:
+    """Returns a WHERE condition matching the requested show IDs, with
+    one placeholder per show ID
+
+    Arguments:
+        show_ids (List[int])
+    """
+    return "s.showid IN ({})".format(", ".join(["%s"] * len(show_ids)))
+
+def _retrieve_core_info(database_connection: mysql.connector.connect,
+                        filter_clause: str = None,
+                        filter_values: tuple = ()) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts with core information for
+    all shows matching the filter clause, keyed by show ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        filter_clause (str): Optional WHERE condition against the
+        ww_shows table, aliased as s
+        filter_values (tuple): Values for the filter clause
+    """
+    try:
+        query = ("SELECT s.showid, s.showdate, s.bestof, "
+                 "s.repeatshowid, os.showdate AS originalshowdate, "
+                 "l.locationid, l.city, l.state, "
+                 "l.venue, l.locationslug , h.hostid, h.host, "
+                 "h.hostslug, hm.guest as hostguest, "
+                 "sk.scorekeeperid, sk.scorekeeper, "
+                 "sk.scorekeeperslug, skm.guest AS scorekeeperguest, "
+                 "skm.description, sd.showdescription, sn.shownotes "
+                 "FROM ww_shows s "
+                 "JOIN ww_showlocationmap lm ON lm.showid = s.showid "
+                 "JOIN ww_locations l ON l.locationid = lm.locationid "
+                 "JOIN ww_showhostmap hm ON hm.showid = s.showid "
+                 "JOIN ww_hosts h ON h.hostid = hm.hostid "
+                 "JOIN ww_showskmap skm ON skm.showid = s.showid "
+                 "JOIN ww_scorekeepers sk ON "
+                 "sk.scorekeeperid = skm.scorekeeperid "
+                 "JOIN ww_showdescriptions sd ON sd.showid = s.showid "
+                 "JOIN ww_shownotes sn ON sn.showid = s.showid "
+                 "LEFT JOIN ww_shows os ON os.showid = s.repeatshowid ")
+        if filter_clause:
+            query = query + "WHERE {} ".format(filter_clause)
+
+        query = query + "ORDER BY s.showdate ASC;"
+        result = executor.fetch_all(database_connection, query, filter_values,
+                                    dictionary=True, prepared=False)
+
+        shows = OrderedDict()
+        for row in result:
+            show_id = row["showid"]
+            if show_id in shows:
+                continue
+
+            original_show_date = None
+            if row["originalshowdate"]:
+                original_show_date = row["originalshowdate"].isoformat()
+
+            shows[show_id] = _build_core_info(show_id,
+                                              row,
+                                              original_show_date)
+
+        return shows
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+def _retrieve_panelist_info(database_connection: mysql.connector.connect,
+                            filter_clause: str = None,
+                            filter_values: tuple = ()
+                           ) -> Dict[int, List[Dict]]:
+    """Returns a dictionary of lists of OrderedDicts with panelist
+    information for all shows matching the filter clause, keyed by
+    show ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        filter_clause (str): Optional WHERE condition against the
+        ww_shows table, aliased as s
+        filter_values (tuple): Values for the filter clause
+    """
+    try:
+        query = ("SELECT pm.showid, pm.panelistid, p.panelist, "
+                 "p.panelistslug, "
+                 "pm.panelistlrndstart as start, "
+                 "pm.panelistlrndcorrect as correct, "
+                 "pm.panelistscore, pm.showpnlrank "
+                 "FROM ww_showpnlmap pm "
+                 "JOIN ww_panelists p on p.panelistid = pm.panelistid "
+                 "JOIN ww_shows s on s.showid = pm.showid ")
+        if filter_clause:
+            query = query + "WHERE {} ".format(filter_clause)
+
+        query = query + ("ORDER by pm.showid ASC, pm.panelistscore DESC, "
+                         "pm.showpnlmapid ASC;")
+        result = executor.fetch_all(database_connection, query, filter_values,
+                                    dictionary=True, prepared=False)
+
+        shows = {}
+        for row in result:
+            shows.setdefault(row["showid"], []).append(_build_panelist_info(row))
+
+        return shows
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+def _retrieve_bluff_info(database_connection: mysql.connector.connect,
+                         filter_clause: str = None,
+                         filter_values: tuple = ()) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts with Bluff the Listener
+    information for all shows matching the filter clause, keyed by
+    show ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        filter_clause (str): Optional WHERE condition against the
+        ww_shows table, aliased as s
+        filter_values (tuple): Values for the filter clause
+    """
+    try:
+        query = ("SELECT blm.showid, "
+                 "pc.panelistid AS chosenid, pc.panelist AS chosen, "
+                 "pc.panelistslug AS chosenslug, "
+                 "pr.panelistid AS correctid, pr.panelist AS correct, "
+                 "pr.panelistslug AS correctslug "
+                 "FROM ww_showbluffmap blm "
+                 "JOIN ww_shows s ON s.showid = blm.showid "
+                 "LEFT JOIN ww_panelists pc ON "
+                 "pc.panelistid = blm.chosenbluffpnlid "
+                 "LEFT JOIN ww_panelists pr ON "
+                 "pr.panelistid = blm.correctbluffpnlid ")
+        if filter_clause:
+            query = query + "WHERE {} ".format(filter_clause)
+
+        query = query + "ORDER BY blm.showid ASC;"
+        result = executor.fetch_all(database_connection, query, filter_values,
+                                    dictionary=True, prepared=False)
+
+        shows = {}
+        for row in result:
+            bluff_info = shows.setdefault(row["showid"], _build_bluff_info())
+
+            # Mirror retrieve_bluff_info_by_id, which uses the first
+            # matching row for the chosen and correct panelists
+            if row["chosenid"] and not bluff_info["chosen_panelist"]:
+                bluff_info["chosen_panelist"] = _build_bluff_panelist_info(row["chosenid"],
+                                                                           row["chosen"],
+                                                                           row["chosenslug"])
+
+            if row["correctid"] and not bluff_info["correct_panelist"]:
+                bluff_info["correct_panelist"] = _build_bluff_panelist_info(row["correctid"],
+                                                                            row["correct"],
+                                                                            row["correctslug"])
+
+        return shows
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+def _retrieve_guest_info(database_connection: mysql.connector.connect,
+                         filter_clause: str = None,
+                         filter_values: tuple = ()
+                        ) -> Dict[int, List[Dict]]:
+    """Returns a dictionary of lists of OrderedDicts with guest
+    information for all shows matching the filter clause, keyed by
+    show ID
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        filter_clause (str): Optional WHERE condition against the
+        ww_shows table, aliased as s
+        filter_values (tuple): Values for the filter clause
+    """
+    try:
+        query = ("SELECT gm.showid, gm.guestid, g.guest, g.guestslug, "
+                 "gm.guestscore, gm.exception "
+                 "FROM ww_showguestmap gm "
+                 "JOIN ww_guests g on g.guestid = gm.guestid "
+                 "JOIN ww_shows s on s.showid = gm.showid ")
+        if filter_clause:
+            query = query + "WHERE {} ".format(filter_clause)
+
+        query = query + "ORDER by gm.showid ASC, gm.showguestmapid ASC;"
+        result = executor.fetch_all(database_connection, query, filter_values,
+                                    dictionary=True, prepared=False)
+
+        shows = {}
+        for row in result:
+            shows.setdefault(row["showid"], []).append(_build_guest_info(row))
+
+        return shows
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+#endregion
+
 #region Core Retrieval Functions
 def retrieve_core_info_by_id(show_id: int,
                              database_connection: mysql.connector.connect
@@ -25,9 +396,9 @@ def retrieve_core_info_by_id(show_id: int,
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT s.showid, s.showdate, s.bestof, "
-                 "s.repeatshowid, l.locationid, l.city, l.state, "
+                 "s.repeatshowid, os.showdate AS originalshowdate, "
+                 "l.locationid, l.city, l.state, "
                  "l.venue, l.locationslug , h.hostid, h.host, "
                  "h.hostslug, hm.guest as hostguest, "
                  "sk.scorekeeperid, sk.scorekeeper, "
@@ -43,90 +414,19 @@ def retrieve_core_info_by_id(show_id: int,
                  "sk.scorekeeperid = skm.scorekeeperid "
                  "JOIN ww_showdescriptions sd ON sd.showid = s.showid "
                  "JOIN ww_shownotes sn ON sn.showid = s.showid "
+                 "LEFT JOIN ww_shows os ON os.showid = s.repeatshowid "
                  "WHERE s.showid = %s;")
-        cursor.execute(query, (show_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (show_id,),
+                                    dictionary=True)
 
         if not result:
             return None
 
-        repeat_show_id = result["repeatshowid"]
-
-        if result["showdescription"]:
-            show_description = str(result["showdescription"]).strip()
-        else:
-            show_description = None
-
-        if result["shownotes"]:
-            show_notes = str(result["shownotes"]).strip()
-        else:
-            show_notes = None
-
-        location_id = result["locationid"]
-        location_slug = result["locationslug"]
-        location_city = result["city"]
-        location_state = result["state"]
-        location_venue = result["venue"]
-
-        if not location_slug:
-            location_slug = location_utility.slugify_location(location_id=location_id,
-                                                              city=location_city,
-                                                              state=location_state,
-                                                              venue=location_venue)
-
-        location_info = OrderedDict()
-        location_info["id"] = location_id
-        location_info["slug"] = location_slug
-        location_info["city"] = location_city
-        location_info["state"] = location_state
-        location_info["venue"] = location_venue
-
-        host_info = OrderedDict()
-        host_info["id"] = result["hostid"]
-        host_info["name"] = result["host"]
-        if result["hostslug"]:
-            host_info["slug"] = result["hostslug"]
-        else:
-            host_info["slug"] = slugify(host_info["name"])
-
-        host_info["guest"] = bool(result["hostguest"])
-
-        if result["description"]:
-            scorekeeper_description = result["description"]
-        else:
-            scorekeeper_description = None
+        original_show_date = None
+        if result["originalshowdate"]:
+            original_show_date = result["originalshowdate"].isoformat()
 
-        scorekeeper_info = OrderedDict()
-        scorekeeper_info["id"] = result["scorekeeperid"]
-        scorekeeper_info["name"] = result["scorekeeper"]
-        if result["scorekeeperslug"]:
-            scorekeeper_info["slug"] = result["scorekeeperslug"]
-        else:
-            scorekeeper_info["slug"] = slugify(scorekeeper_info["name"])
-
-        scorekeeper_info["guest"] = bool(result["scorekeeperguest"])
-        scorekeeper_info["description"] = scorekeeper_description
-
-        show_info = OrderedDict()
-        show_info["id"] = show_id
-        show_info["date"] = result["showdate"].isoformat()
-        show_info["best_of"] = bool(result["bestof"])
-        show_info["repeat_show"] = bool(repeat_show_id)
-
-        if repeat_show_id:
-            original_date = utility.convert_id_to_date(repeat_show_id,
-                                                       database_connection)
-            show_info["original_show_id"] = repeat_show_id
-            show_info["original_show_date"] = original_date
-
-        show_info["description"] = show_description
-        show_info["notes"] = show_notes
-        show_info["location"] = location_info
-        show_info["host"] = host_info
-        show_info["scorekeeper"] = scorekeeper_info
-
-        return show_info
+        return _build_core_info(show_id, result, original_show_date)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
@@ -143,7 +443,6 @@ def retrieve_panelist_info_by_id(show_id: int,
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT pm.panelistid, p.panelist, p.panelistslug, "
                  "pm.panelistlrndstart as start, "
                  "pm.panelistlrndcorrect as correct, "
@@ -152,33 +451,15 @@ def retrieve_panelist_info_by_id(show_id: int,
                  "JOIN ww_panelists p on p.panelistid = pm.panelistid "
                  "WHERE pm.showid = %s "
                  "ORDER by pm.panelistscore DESC, pm.showpnlmapid ASC;")
-        cursor.execute(query, (show_id,))
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query, (show_id,),
+                                    dictionary=True)
 
         if not result:
             return None
 
         panelists = []
         for panelist in result:
-            if panelist["showpnlrank"]:
-                panelist_rank = panelist["showpnlrank"]
-            else:
-                panelist_rank = None
-
-            info = OrderedDict()
-            info["id"] = panelist["panelistid"]
-            info["name"] = panelist["panelist"]
-            if panelist["panelistslug"]:
-                info["slug"] = panelist["panelistslug"]
-            else:
-                info["slug"] = slugify(info["name"])
-
-            info["lightning_round_start"] = panelist["start"]
-            info["lightning_round_correct"] = panelist["correct"]
-            info["score"] = panelist["panelistscore"]
-            info["rank"] = panelist_rank
-            panelists.append(info)
+            panelists.append(_build_panelist_info(panelist))
 
         return panelists
     except ProgrammingError as err:
@@ -197,7 +478,6 @@ def retrieve_bluff_info_by_id(show_id: int,
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT blm.chosenbluffpnlid, p.panelist, "
                  "p.panelistslug "
                  "FROM ww_showbluffmap blm "
@@ -205,17 +485,13 @@ def retrieve_bluff_info_by_id(show_id: int,
                  "JOIN ww_panelists p ON "
                  "p.panelistid = blm.chosenbluffpnlid "
                  "WHERE s.showid = %s;")
-        cursor.execute(query, (show_id,))
-        chosen_result = cursor.fetchone()
+        chosen_result = executor.fetch_one(database_connection, query,
+                                           (show_id,), dictionary=True)
 
         if chosen_result:
-            chosen_bluff_info = OrderedDict()
-            chosen_bluff_info["id"] = chosen_result["chosenbluffpnlid"]
-            chosen_bluff_info["name"] = chosen_result["panelist"]
-            if chosen_result["panelistslug"]:
-                chosen_bluff_info["slug"] = chosen_result["panelistslug"]
-            else:
-                chosen_bluff_info["slug"] = slugify(chosen_bluff_info["name"])
+            chosen_bluff_info = _build_bluff_panelist_info(chosen_result["chosenbluffpnlid"],
+                                                           chosen_result["panelist"],
+                                                           chosen_result["panelistslug"])
         else:
             chosen_bluff_info = None
 
@@ -226,26 +502,17 @@ def retrieve_bluff_info_by_id(show_id: int,
                  "JOIN ww_panelists p ON "
                  "p.panelistid = blm.correctbluffpnlid "
                  "WHERE s.showid = %s;")
-        cursor.execute(query, (show_id,))
-        correct_result = cursor.fetchone()
-        cursor.close()
+        correct_result = executor.fetch_one(database_connection, query,
+                                            (show_id,), dictionary=True)
 
         if correct_result:
-            correct_bluff_info = OrderedDict()
-            correct_bluff_info["id"] = correct_result["correctbluffpnlid"]
-            correct_bluff_info["name"] = correct_result["panelist"]
-            if correct_result["panelistslug"]:
-                correct_bluff_info["slug"] = correct_result["panelistslug"]
-            else:
-                correct_bluff_info["slug"] = slugify(correct_bluff_info["name"])
+            correct_bluff_info = _build_bluff_panelist_info(correct_result["correctbluffpnlid"],
+                                                            correct_result["panelist"],
+                                                            correct_result["panelistslug"])
         else:
             correct_bluff_info = None
 
-        bluff_info = OrderedDict()
-        bluff_info["chosen_panelist"] = chosen_bluff_info
-        bluff_info["correct_panelist"] = correct_bluff_info
-
-        return bluff_info
+        return _build_bluff_info(chosen_bluff_info, correct_bluff_info)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
@@ -262,7 +529,6 @@ def retrieve_guest_info_by_id(show_id: int,
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT gm.guestid, g.guest, g.guestslug, "
                  "gm.guestscore, gm.exception "
                  "FROM ww_showguestmap gm "
@@ -270,26 +536,15 @@ def retrieve_guest_info_by_id(show_id: int,
                  "JOIN ww_shows s on s.showid = gm.showid "
                  "WHERE gm.showid = %s "
                  "ORDER by gm.showguestmapid ASC;")
-        cursor.execute(query, (show_id,))
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query, (show_id,),
+                                    dictionary=True)
 
         if not result:
             return None
 
         guests = []
         for guest in result:
-            info = OrderedDict()
-            info["id"] = guest["guestid"]
-            info["name"] = guest["guest"]
-            if guest["guestslug"]:
-                info["slug"] = guest["guestslug"]
-            else:
-                info["slug"] = slugify(info["name"])
-
-            info["score"] = guest["guestscore"]
-            info["score_exception"] = bool(guest["exception"])
-            guests.append(info)
+            guests.append(_build_guest_info(guest))
 
         return guests
     except ProgrammingError as err:
@@ -298,3 +553,182 @@ def retrieve_guest_info_by_id(show_id: int,
         raise DatabaseError("Unexpected database error") from err
 
 #endregion
+
+#region Bulk Retrieval Functions
+def retrieve_core_info_all(database_connection: mysql.connector.connect
+                          ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts with core information for
+    all shows, keyed by show ID and sorted by show date
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_core_info(database_connection)
+
+def retrieve_panelist_info_all(database_connection: mysql.connector.connect
+                              ) -> Dict[int, List[Dict]]:
+    """Returns a dictionary of lists of OrderedDicts with panelist
+    information for all shows, keyed by show ID. Shows without any
+    panelists are not included.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_panelist_info(database_connection)
+
+def retrieve_bluff_info_all(database_connection: mysql.connector.connect
+                           ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts with panelist bluff
+    information for all shows, keyed by show ID. Shows without any
+    Bluff the Listener data are not included.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_bluff_info(database_connection)
+
+def retrieve_guest_info_all(database_connection: mysql.connector.connect
+                           ) -> Dict[int, List[Dict]]:
+    """Returns a dictionary of lists of OrderedDicts with guest
+    information for all shows, keyed by show ID. Shows without any
+    guests are not included.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_guest_info(database_connection)
+
+def retrieve_core_info_by_ids(show_ids: List[int],
+                              database_connection: mysql.connector.connect
+                             ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts with core information for
+    the requested show IDs, keyed by show ID
+
+    Arguments:
+        show_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_core_info(database_connection,
+                               _build_show_ids_clause(show_ids),
+                               tuple(show_ids))
+
+def retrieve_panelist_info_by_ids(show_ids: List[int],
+                                  database_connection: mysql.connector.connect
+                                 ) -> Dict[int, List[Dict]]:
+    """Returns a dictionary of lists of OrderedDicts with panelist
+    information for the requested show IDs, keyed by show ID. Shows
+    without any panelists are not included.
+
+    Arguments:
+        show_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_panelist_info(database_connection,
+                                   _build_show_ids_clause(show_ids),
+                                   tuple(show_ids))
+
+def retrieve_bluff_info_by_ids(show_ids: List[int],
+                               database_connection: mysql.connector.connect
+                              ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts with panelist bluff
+    information for the requested show IDs, keyed by show ID. Shows
+    without any Bluff the Listener data are not included.
+
+    Arguments:
+        show_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_bluff_info(database_connection,
+                                _build_show_ids_clause(show_ids),
+                                tuple(show_ids))
+
+def retrieve_guest_info_by_ids(show_ids: List[int],
+                               database_connection: mysql.connector.connect
+                              ) -> Dict[int, List[Dict]]:
+    """Returns a dictionary of lists of OrderedDicts with guest
+    information for the requested show IDs, keyed by show ID. Shows
+    without any guests are not included.
+
+    Arguments:
+        show_ids (List[int])
+        database_connection (mysql.connector.connect)
+    """
+    return _retrieve_guest_info(database_connection,
+                                _build_show_ids_clause(show_ids),
+                                tuple(show_ids))
+
+def retrieve_core_info_by_date_range(start_date: str,
+                                     end_date: str,
+                                     database_connection: mysql.connector.connect
+                                    ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts with core information for
+    shows between the start and end dates (inclusive), keyed by show
+    ID and sorted by show date
+
+    Arguments:
+        start_date (str): Start date in YYYY-MM-DD format
+        end_date (str): End date in YYYY-MM-DD format
+        database_connection (mysql.connector.connect)
+    """
+    date_filter, date_values = utility.date_range_filter("s.showdate",
+                                                         start_date,
+                                                         end_date)
+    return _retrieve_core_info(database_connection, date_filter, date_values)
+
+def retrieve_panelist_info_by_date_range(start_date: str,
+                                         end_date: str,
+                                         database_connection: mysql.connector.connect
+                                        ) -> Dict[int, List[Dict]]:
+    """Returns a dictionary of lists of OrderedDicts with panelist
+    information for shows between the start and end dates (inclusive),
+    keyed by show ID. Shows without any panelists are not included.
+
+    Arguments:
+        start_date (str): Start date in YYYY-MM-DD format
+        end_date (str): End date in YYYY-MM-DD format
+        database_connection (mysql.connector.connect)
+    """
+    date_filter, date_values = utility.date_range_filter("s.showdate",
+                                                         start_date,
+                                                         end_date)
+    return _retrieve_panelist_info(database_connection, date_filter,
+                                   date_values)
+
+def retrieve_bluff_info_by_date_range(start_date: str,
+                                      end_date: str,
+                                      database_connection: mysql.connector.connect
+                                     ) -> Dict[int, Dict]:
+    """Returns a dictionary of OrderedDicts with panelist bluff
+    information for shows between the start and end dates (inclusive),
+    keyed by show ID. Shows without any Bluff the Listener data are not
+    included.
+
+    Arguments:
+        start_date (str): Start date in YYYY-MM-DD format
+        end_date (str): End date in YYYY-MM-DD format
+        database_connection (mysql.connector.connect)
+    """
+    date_filter, date_values = utility.date_range_filter("s.showdate",
+                                                         start_date,
+                                                         end_date)
+    return _retrieve_bluff_info(database_connection, date_filter, date_values)
+
+def retrieve_guest_info_by_date_range(start_date: str,
+                                      end_date: str,
+                                      database_connection: mysql.connector.connect
+                                     ) -> Dict[int, List[Dict]]:
+    """Returns a dictionary of lists of OrderedDicts with guest
+    information for shows between the start and end dates (inclusive),
+    keyed by show ID. Shows without any guests are not included.
+
+    Arguments:
+        start_date (str): Start date in YYYY-MM-DD format
+        end_date (str): End date in YYYY-MM-DD format
+        database_connection (mysql.connector.connect)
+    """
+    date_filter, date_values = utility.date_range_filter("s.showdate",
+                                                         start_date,
+                                                         end_date)
+    return _retrieve_guest_info(database_connection, date_filter, date_values)
+
+#endregion
@@ -5,15 +5,162 @@
 Wait Wait... Don't Tell Me! Stats Page Database.
 """
 
+import calendar
 from collections import OrderedDict
 import datetime
-from typing import List, Dict
+from typing import Callable, List, Dict, Iterator, Tuple
 import dateutil.parser as parser
 import mysql.connector
-from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import cache, fanout, records, streaming
 from wwdtm.show import core, info, utility
 
+#region Internal Functions
+def _build_show_details(show_info: Dict,
+                        show_panelists: List[Dict],
+                        show_bluff: Dict,
+                        show_guests: List[Dict]) -> Dict:
+    """Returns an OrderedDict with show details built from the core
+    show information, panelists, Bluff the Listener and guest data
+
+    Arguments:
+        show_info (Dict): Core show information
+        show_panelists (List[Dict])
+        show_bluff (Dict)
+        show_guests (List[Dict])
+    """
+    show_details = OrderedDict()
+    show_details["id"] = show_info["id"]
+    show_details["date"] = show_info["date"]
+    show_details["best_of"] = show_info["best_of"]
+    show_details["repeat_show"] = show_info["repeat_show"]
+
+    if "original_show_date" in show_info:
+        show_details["original_show_id"] = show_info["original_show_id"]
+        show_details["original_show_date"] = show_info["original_show_date"]
+
+    show_details["location"] = show_info["location"]
+    show_details["description"] = show_info["description"]
+    show_details["notes"] = show_info["notes"]
+    show_details["host"] = show_info["host"]
+    show_details["scorekeeper"] = show_info["scorekeeper"]
+    show_details["panelists"] = show_panelists
+    show_details["bluff"] = show_bluff
+    show_details["guests"] = show_guests
+    return show_details
+
+def _build_shows_details(show_ids: List[int],
+                         shows_info: Dict[int, Dict],
+                         shows_panelists: Dict[int, List[Dict]],
+                         shows_bluff: Dict[int, Dict],
+                         shows_guests: Dict[int, List[Dict]]) -> List[Dict]:
+    """Returns a list of OrderedDicts with show details for the
+    requested show IDs, stitched together from the results of the
+    show.core bulk retrieval functions. Show IDs without core show
+    information are skipped.
+
+    Arguments:
+        show_ids (List[int])
+        shows_info (Dict[int, Dict])
+        shows_panelists (Dict[int, List[Dict]])
+        shows_bluff (Dict[int, Dict])
+        shows_guests (Dict[int, List[Dict]])
+    """
+    shows = []
+    for show_id in show_ids:
+        show_info = shows_info.get(show_id)
+        if not show_info:
+            continue
+
+        show_bluff = shows_bluff.get(show_id)
+        if not show_bluff:
+            show_bluff = OrderedDict()
+            show_bluff["chosen_panelist"] = None
+            show_bluff["correct_panelist"] = None
+
+        shows.append(_build_show_details(show_info,
+                                         shows_panelists.get(show_id),
+                                         show_bluff,
+                                         shows_guests.get(show_id)))
+
+    return shows
+
+def _retrieve_by_date_range(start_date: str,
+                            end_date: str,
+                            database_connection: mysql.connector.connect
+                           ) -> List[Dict]:
+    """Returns a list of OrderedDicts with show details for shows
+    between the start and end dates (inclusive), sorted by show date
+
+    Arguments:
+        start_date (str)
+        end_date (str)
+        database_connection (mysql.connector.connect)
+    """
+    shows_info = core.retrieve_core_info_by_date_range(start_date,
+                                                       end_date,
+                                                       database_connection)
+    if not shows_info:
+        return None
+
+    shows_panelists = core.retrieve_panelist_info_by_date_range(start_date,
+                                                                end_date,
+                                                                database_connection)
+    shows_bluff = core.retrieve_bluff_info_by_date_range(start_date,
+                                                         end_date,
+                                                         database_connection)
+    shows_guests = core.retrieve_guest_info_by_date_range(start_date,
+                                                          end_date,
+                                                          database_connection)
+
+    return _build_shows_details(list(shows_info.keys()),
+                                shows_info,
+                                shows_panelists,
+                                shows_bluff,
+                                shows_guests)
+
+#endregion
+
+#region Detail Assembly Functions
+def detail_calls(show_id: int,
+                 database_connection: mysql.connector.connect
+                ) -> List[Tuple[Callable, tuple]]:
+    """Returns a list of the functions and arguments used to retrieve
+    the core show information, panelists, Bluff the Listener and guest
+    information for the requested show ID. The calls are independent of
+    each other and can be run at the same time.
+
+    Arguments:
+        show_id (int)
+        database_connection (mysql.connector.connect)
+    """
+    arguments = (show_id, database_connection)
+    return [(core.retrieve_core_info_by_id, arguments),
+            (core.retrieve_panelist_info_by_id, arguments),
+            (core.retrieve_bluff_info_by_id, arguments),
+            (core.retrieve_guest_info_by_id, arguments)]
+
+def assemble_details(results: List) -> Dict:
+    """Returns an OrderedDict with show details built from the results
+    of the calls returned by detail_calls, or None if no core show
+    information was returned
+
+    Arguments:
+        results (List): Results of the calls returned by detail_calls,
+        in the same order
+    """
+    show_info, show_panelists, show_bluff, show_guests = results
+    if not show_info:
+        return None
+
+    return _build_show_details(show_info,
+                               show_panelists,
+                               show_bluff,
+                               show_guests)
+
+#endregion
+
 #region Show Details Retrieval Functions
+@cache.cached("show")
 def retrieve_by_id(show_id: int,
                    database_connection: mysql.connector.connect,
                    pre_validated_id: bool = False) -> Dict:
@@ -27,61 +174,114 @@ def retrieve_by_id(show_id: int,
         been validated
     """
     if not pre_validated_id:
-        if not utility.validate_id(show_id, database_connection):
+        try:
+            int(show_id)
+        except ValueError:
             return None
 
-    # Pull in the base show data, including date, host, scorekeeeper and notes
-    show_info = core.retrieve_core_info_by_id(show_id, database_connection)
-    if show_info:
-        show_panelists = core.retrieve_panelist_info_by_id(show_id,
-                                                           database_connection)
-        show_bluff = core.retrieve_bluff_info_by_id(show_id,
-                                                    database_connection)
-        show_guests = core.retrieve_guest_info_by_id(show_id,
-                                                     database_connection)
-
-        show_details = OrderedDict()
-        show_details["id"] = show_info["id"]
-        show_details["date"] = show_info["date"]
-        show_details["best_of"] = show_info["best_of"]
-        show_details["repeat_show"] = show_info["repeat_show"]
-
-        if "original_show_date" in show_info:
-            show_details["original_show_id"] = show_info["original_show_id"]
-            show_details["original_show_date"] = show_info["original_show_date"]
-
-        show_details["location"] = show_info["location"]
-        show_details["description"] = show_info["description"]
-        show_details["notes"] = show_info["notes"]
-        show_details["host"] = show_info["host"]
-        show_details["scorekeeper"] = show_info["scorekeeper"]
-        show_details["panelists"] = show_panelists
-        show_details["bluff"] = show_bluff
-        show_details["guests"] = show_guests
-        return show_details
-
-    return None
+    # Pull in the base show data, including date, host, scorekeeeper and
+    # notes, followed by the panelists, Bluff the Listener and guest
+    # information. The queries run at the same time if fan-out is active.
+    return assemble_details(fanout.run_all(database_connection,
+                                           detail_calls(show_id,
+                                                        database_connection),
+                                           stop_if_empty=True))
 
-def retrieve_all(database_connection: mysql.connector.connect) -> List[Dict]:
+def retrieve_all(database_connection: mysql.connector.connect,
+                 return_type: str = "dict") -> List[Dict]:
     """Returns a list of OrderedDicts with show details for all shows
 
     Arguments:
         database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Show records
     """
+    records.validate_return_type(return_type)
+
     show_ids = info.retrieve_all_ids(database_connection)
     if not show_ids:
         return None
 
-    shows = []
+    # Retrieve the data for all shows with one query per table and
+    # stitch the show details together in memory
+    shows_info = core.retrieve_core_info_all(database_connection)
+    shows_panelists = core.retrieve_panelist_info_all(database_connection)
+    shows_bluff = core.retrieve_bluff_info_all(database_connection)
+    shows_guests = core.retrieve_guest_info_all(database_connection)
+
+    shows = _build_shows_details(show_ids,
+                                 shows_info,
+                                 shows_panelists,
+                                 shows_bluff,
+                                 shows_guests)
+    return records.convert_list(shows, records.Show, return_type)
+
+def retrieve_by_ids(show_ids: List[int],
+                    database_connection: mysql.connector.connect,
+                    return_type: str = "dict") -> List[Dict]:
+    """Returns a list of OrderedDicts with show details for the
+    requested show IDs, in the order the show IDs were requested.
+    Invalid or unknown show IDs are skipped.
+
+    Arguments:
+        show_ids (List[int])
+        database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Show records
+    """
+    records.validate_return_type(return_type)
+
+    valid_ids = []
     for show_id in show_ids:
-        show_detail = retrieve_by_id(show_id,
-                                     database_connection,
-                                     pre_validated_id=True)
+        try:
+            valid_ids.append(int(show_id))
+        except (TypeError, ValueError):
+            continue
 
-        if show_detail:
-            shows.append(show_detail)
+    if not valid_ids:
+        return None
 
-    return shows
+    query_ids = list(OrderedDict.fromkeys(valid_ids))
+    shows_info = core.retrieve_core_info_by_ids(query_ids, database_connection)
+    if not shows_info:
+        return None
+
+    shows_panelists = core.retrieve_panelist_info_by_ids(query_ids,
+                                                         database_connection)
+    shows_bluff = core.retrieve_bluff_info_by_ids(query_ids,
+                                                  database_connection)
+    shows_guests = core.retrieve_guest_info_by_ids(query_ids,
+                                                   database_connection)
+
+    shows = _build_shows_details(valid_ids,
+                                 shows_info,
+                                 shows_panelists,
+                                 shows_bluff,
+                                 shows_guests)
+    return records.convert_list(shows, records.Show, return_type)
+
+def iter_all(database_connection: mysql.connector.connect,
+             batch_size: int = streaming.DEFAULT_BATCH_SIZE,
+             return_type: str = "dict") -> Iterator[Dict]:
+    """Returns an iterator that yields OrderedDicts with show details
+    for all shows, in the same order as retrieve_all. Details are
+    retrieved for batch_size shows at a time, so only one batch is held
+    in memory.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        batch_size (int): Number of shows to retrieve at a time
+        return_type (str): Either "dict" to yield OrderedDicts or
+        "record" to yield wwdtm.records.Show records
+    """
+    records.validate_return_type(return_type)
+
+    show_ids = info.retrieve_all_ids(database_connection)
+    return streaming.iter_by_ids(
+        show_ids,
+        lambda batch_ids: retrieve_by_ids(batch_ids, database_connection,
+                                          return_type),
+        batch_size)
 
 def retrieve_by_date(show_year: int,
                      show_month: int,
@@ -142,30 +342,11 @@ def retrieve_by_year(show_year: int,
     except ValueError:
         return None
 
-    try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT showid FROM ww_shows "
-                 "WHERE YEAR(showdate) = %s "
-                 "ORDER BY showdate ASC;")
-        cursor.execute(query, (parsed_show_year.year,))
-        result = cursor.fetchall()
-        cursor.close()
-
-        if not result:
-            return None
-
-        shows = []
-        for show in result:
-            show_detail = retrieve_by_id(show["showid"],
-                                         database_connection,
-                                         pre_validated_id=True)
-            shows.append(show_detail)
-
-        return shows
-    except ProgrammingError as err:
-        raise ProgrammingError("Unable to query the database") from err
-    except DatabaseError as err:
-        raise DatabaseError("Unexpected database error") from err
+    year_start = datetime.date(parsed_show_year.year, 1, 1)
+    year_end = datetime.date(parsed_show_year.year, 12, 31)
+    return _retrieve_by_date_range(year_start.isoformat(),
+                                   year_end.isoformat(),
+                                   database_connection)
 
 def retrieve_by_year_month(show_year: int,
                            show_month: int,
@@ -186,32 +367,17 @@ def retrieve_by_year_month(show_year: int,
     except ValueError:
         return None
 
-    try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT showid FROM ww_shows "
-                 "WHERE YEAR(showdate) = %s "
-                 "AND MONTH(showdate) = %s "
-                 "ORDER BY showdate ASC;")
-        cursor.execute(query, (parsed_show_year_month.year,
-                               parsed_show_year_month.month,))
-        result = cursor.fetchall()
-        cursor.close()
-
-        if not result:
-            return None
-
-        shows = []
-        for show in result:
-            show_detail = retrieve_by_id(show["showid"],
-                                         database_connection,
-                                         pre_validated_id=True)
-            shows.append(show_detail)
-
-        return shows
-    except ProgrammingError as err:
-        raise ProgrammingError("Unable to query the database") from err
-    except DatabaseError as err:
-        raise DatabaseError("Unexpected database error") from err
+    _, days_in_month = calendar.monthrange(parsed_show_year_month.year,
+                                           parsed_show_year_month.month)
+    month_start = datetime.date(parsed_show_year_month.year,
+                                parsed_show_year_month.month,
+                                1)
+    month_end = datetime.date(parsed_show_year_month.year,
+                              parsed_show_year_month.month,
+                              days_in_month)
+    return _retrieve_by_date_range(month_start.isoformat(),
+                                   month_end.isoformat(),
+                                   database_connection)
 
 def retrieve_recent(database_connection: mysql.connector.connect,
                     include_days_ahead: int = 7,
@@ -238,31 +404,8 @@ def retrieve_recent(database_connection: mysql.connector.connect,
     except OverflowError:
         return None
 
-    try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT showid FROM ww_shows "
-                 "WHERE showdate >= %s AND "
-                 "showdate <= %s ORDER BY showdate ASC;")
-        cursor.execute(query,
-                       (past_date.isoformat(),
-                        future_date.isoformat()))
-        result = cursor.fetchall()
-        cursor.close()
-
-        if not result:
-            return None
-
-        shows = []
-        for show in result:
-            show_detail = retrieve_by_id(show["showid"],
-                                         database_connection,
-                                         pre_validated_id=True)
-            shows.append(show_detail)
-
-        return shows
-    except ProgrammingError as err:
-        raise ProgrammingError("Unable to query the database") from err
-    except DatabaseError as err:
-        raise DatabaseError("Unexpected database error") from err
+    return _retrieve_by_date_range(past_date.isoformat(),
+                                   future_date.isoformat(),
+                                   database_connection)
 
 #endregion
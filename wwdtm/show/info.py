@@ -11,8 +11,75 @@ from typing import List, Dict
 import dateutil.parser as parser
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import cache, executor, records
 from wwdtm.show import utility
 
+#region Internal Functions
+def _build_show_info(show_id: int, result: Dict) -> Dict:
+    """Returns an OrderedDict with show information built from a row
+    returned by one of the show information queries
+
+    Arguments:
+        show_id (int)
+        result (Dict): Row returned from the show information query
+    """
+    repeat_show_id = result["repeatshowid"]
+    show_info = OrderedDict()
+    show_info["id"] = show_id
+    show_info["date"] = result["showdate"].isoformat()
+    show_info["best_of"] = bool(result["bestof"])
+    show_info["repeat_show"] = bool(repeat_show_id)
+
+    if repeat_show_id:
+        show_info["original_show_id"] = repeat_show_id
+        if result["originalshowdate"]:
+            show_info["original_show_date"] = result["originalshowdate"].isoformat()
+        else:
+            show_info["original_show_date"] = None
+
+    return show_info
+
+def _retrieve_shows(database_connection: mysql.connector.connect,
+                    filter_clause: str = None,
+                    filter_values: tuple = ()) -> List[Dict]:
+    """Returns a list of OrderedDicts with show information for all
+    shows matching the filter clause, sorted by show date
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        filter_clause (str): Optional WHERE condition against the
+        ww_shows table, aliased as s
+        filter_values (tuple): Values for the filter clause
+    """
+    try:
+        # Original show dates for repeat shows are pulled in through
+        # a self-join rather than a query per repeat show
+        query = ("SELECT s.showid, s.showdate, s.bestof, s.repeatshowid, "
+                 "os.showdate AS originalshowdate "
+                 "FROM ww_shows s "
+                 "LEFT JOIN ww_shows os ON os.showid = s.repeatshowid ")
+        if filter_clause:
+            query = query + "WHERE {} ".format(filter_clause)
+
+        query = query + "ORDER BY s.showdate ASC;"
+        result = executor.fetch_all(database_connection, query, filter_values,
+                                    dictionary=True, prepared=False)
+
+        if not result:
+            return None
+
+        shows = []
+        for row in result:
+            shows.append(_build_show_info(row["showid"], row))
+
+        return shows
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+#endregion
+
 #region Show Basic Info Retrieval Functions
 def retrieve_all_ids(database_connection: mysql.connector.connect
                     ) -> List[int]:
@@ -22,11 +89,39 @@ def retrieve_all_ids(database_connection: mysql.connector.connect
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor()
         query = "SELECT showid FROM ww_shows ORDER BY showdate ASC;"
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query)
+
+        show_ids = []
+        for show in result:
+            show_ids.append(show[0])
+
+        return show_ids
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+def retrieve_ids_since(show_date: str,
+                       database_connection: mysql.connector.connect
+                      ) -> List[int]:
+    """Returns a list of show IDs for shows on or after the requested
+    show date, sorted by show date
+
+    Arguments:
+        show_date (str): Show date in YYYY-MM-DD format
+        database_connection (mysql.connector.connect)
+    """
+    try:
+        parsed_show_date = parser.parse(show_date)
+    except ValueError:
+        return None
+
+    try:
+        query = ("SELECT showid FROM ww_shows WHERE showdate >= %s "
+                 "ORDER BY showdate ASC;")
+        result = executor.fetch_all(database_connection, query,
+                                    (parsed_show_date.date().isoformat(),))
 
         show_ids = []
         for show in result:
@@ -46,11 +141,8 @@ def retrieve_all_dates(database_connection: mysql.connector.connect
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor()
         query = "SELECT showdate FROM ww_shows ORDER BY showdate ASC;"
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query)
 
         show_dates = []
         for show in result:
@@ -71,13 +163,10 @@ def retrieve_all_dates_tuple(database_connection: mysql.connector.connect
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT YEAR(showdate), MONTH(showdate), DAY(showdate) "
                  "FROM ww_shows "
                  "ORDER BY showdate ASC;")
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query)
 
         show_dates = []
         for show in result:
@@ -100,22 +189,24 @@ def retrieve_scores_by_year(show_year: int,
     """
     try:
         _ = parser.parse("{:04d}".format(show_year))
+        date_filter, date_values = utility.date_range_filter(
+            "s.showdate", *utility.year_date_range(show_year))
     except ValueError as err:
         raise ValueError("Invalid year value") from err
 
     try:
         show_scores = []
         shows = OrderedDict()
-        cursor = database_connection.cursor(dictionary=True)
         query = ("SELECT s.showdate, pm.panelistscore AS score "
                  "FROM ww_showpnlmap pm "
                  "JOIN ww_shows s ON s.showid = pm.showid "
                  "WHERE s.bestof = 0 AND s.repeatshowid IS NULL "
                  "AND pm.panelistscore IS NOT NULL "
-                 "AND YEAR(s.showdate) = %s "
-                 "ORDER BY s.showdate ASC, pm.panelistscore ASC;")
-        cursor.execute(query, (show_year,))
-        result = cursor.fetchall()
+                 "AND {} "
+                 "ORDER BY s.showdate ASC, pm.panelistscore ASC;"
+                 .format(date_filter))
+        result = executor.fetch_all(database_connection, query, date_values,
+                                    dictionary=True)
 
         if not result:
             return None
@@ -147,13 +238,10 @@ def retrieve_all_show_years_months(database_connection: mysql.connector.connect
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT DISTINCT YEAR(showdate), MONTH(showdate) "
                  "FROM ww_shows "
                  "ORDER BY showdate ASC;")
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query)
 
         show_years_months = []
         for row in result:
@@ -175,13 +263,10 @@ def retrieve_all_show_years_months_tuple(database_connection: mysql.connector.co
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT DISTINCT YEAR(showdate), MONTH(showdate) "
                  "FROM ww_shows "
                  "ORDER BY showdate ASC;")
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query)
 
         show_years_months = []
         for row in result:
@@ -193,6 +278,7 @@ def retrieve_all_show_years_months_tuple(database_connection: mysql.connector.co
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
+@cache.cached("show")
 def retrieve_by_id(show_id: int,
                    database_connection: mysql.connector.connect,
                    pre_validated_id: bool = False) -> Dict:
@@ -207,61 +293,46 @@ def retrieve_by_id(show_id: int,
     """
 
     if not pre_validated_id:
-        if not utility.validate_id(show_id, database_connection):
+        try:
+            int(show_id)
+        except ValueError:
             return None
 
     try:
         # Pull in base show information, including: show ID, date,
-        # Best Of flag and, if applicable, the show ID of the original
-        # show if it is a repeat
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT showid, showdate, bestof, repeatshowid "
-                 "FROM ww_shows "
-                 "WHERE showid = %s;")
-        cursor.execute(query, (show_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        # Best Of flag and, if applicable, the show ID and date of the
+        # original show if it is a repeat
+        query = ("SELECT s.showid, s.showdate, s.bestof, s.repeatshowid, "
+                 "os.showdate AS originalshowdate "
+                 "FROM ww_shows s "
+                 "LEFT JOIN ww_shows os ON os.showid = s.repeatshowid "
+                 "WHERE s.showid = %s;")
+        result = executor.fetch_one(database_connection, query, (show_id,),
+                                    dictionary=True)
 
         if not result:
             return None
 
-        repeat_show_id = result["repeatshowid"]
-        show_info = OrderedDict()
-        show_info["id"] = show_id
-        show_info["date"] = result["showdate"].isoformat()
-        show_info["best_of"] = bool(result["bestof"])
-        show_info["repeat_show"] = bool(repeat_show_id)
-
-        if repeat_show_id:
-            show_info["original_show_id"] = repeat_show_id
-            show_info["original_show_date"] = utility.convert_id_to_date(repeat_show_id,
-                                                                         database_connection)
-
-        return show_info
+        return _build_show_info(show_id, result)
     except ProgrammingError as err:
         raise ProgrammingError("Unable to query the database") from err
     except DatabaseError as err:
         raise DatabaseError("Unexpected database error") from err
 
-def retrieve_all(database_connection: mysql.connector.connect) -> List[Dict]:
+def retrieve_all(database_connection: mysql.connector.connect,
+                 return_type: str = "dict") -> List[Dict]:
     """Returns a list of OrderedDicts with show information for all
     shows
 
     Arguments:
         database_connection (mysql.connector.connect)
+        return_type (str): Either "dict" to return OrderedDicts or
+        "record" to return wwdtm.records.Show records
     """
-    show_ids = retrieve_all_ids(database_connection)
-    if not show_ids:
-        return None
-
-    shows = []
-    for show_id in show_ids:
-        show_info = retrieve_by_id(show_id, database_connection, True)
+    records.validate_return_type(return_type)
 
-        if show_info:
-            shows.append(show_info)
-
-    return shows
+    shows = _retrieve_shows(database_connection)
+    return records.convert_list(shows, records.Show, return_type)
 
 def retrieve_by_date(show_year: int,
                      show_month: int,
@@ -319,18 +390,17 @@ def retrieve_months_by_year(show_year: int,
     """
     try:
         _ = parser.parse("{:04d}".format(show_year))
+        date_filter, date_values = utility.date_range_filter(
+            "showdate", *utility.year_date_range(show_year))
     except ValueError as err:
         raise ValueError("Invalid year value") from err
 
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT DISTINCT MONTH(showdate) "
                  "FROM ww_shows "
-                 "WHERE YEAR(showdate) = %s "
-                 "ORDER BY MONTH(showdate) ASC;")
-        cursor.execute(query, (show_year,))
-        result = cursor.fetchall()
-        cursor.close()
+                 "WHERE {} "
+                 "ORDER BY MONTH(showdate) ASC;".format(date_filter))
+        result = executor.fetch_all(database_connection, query, date_values)
 
         if not result:
             return None
@@ -352,13 +422,10 @@ def retrieve_years(database_connection: mysql.connector.connect) -> List[int]:
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor()
         query = ("SELECT DISTINCT YEAR(showdate) "
                  "FROM ww_shows "
                  "ORDER BY YEAR(showdate) ASC;")
-        cursor.execute(query)
-        result = cursor.fetchall()
-        cursor.close()
+        result = executor.fetch_all(database_connection, query)
 
         if not result:
             return None
@@ -384,33 +451,12 @@ def retrieve_by_year(show_year: int,
     """
     try:
         parsed_show_year = parser.parse("{:04d}".format(show_year))
+        date_filter, date_values = utility.date_range_filter(
+            "s.showdate", *utility.year_date_range(parsed_show_year.year))
     except ValueError as err:
         raise ValueError("Invalid year value") from err
 
-    try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT showid FROM ww_shows "
-                 "WHERE YEAR(showdate) = %s "
-                 "ORDER BY showdate ASC;")
-        cursor.execute(query, (parsed_show_year.year,))
-        result = cursor.fetchall()
-        cursor.close()
-
-        if not result:
-            return None
-
-        shows = []
-        for show in result:
-            show_info = retrieve_by_id(show["showid"],
-                                       database_connection,
-                                       pre_validated_id=True)
-            shows.append(show_info)
-
-        return shows
-    except ProgrammingError as err:
-        raise ProgrammingError("Unable to query the database") from err
-    except DatabaseError as err:
-        raise DatabaseError("Unexpected database error") from err
+    return _retrieve_shows(database_connection, date_filter, date_values)
 
 def retrieve_by_year_month(show_year: int,
                            show_month: int,
@@ -429,34 +475,14 @@ def retrieve_by_year_month(show_year: int,
         # the first day of the year/month
         parsed_show_year_month = parser.parse("{:04d}-{:02d}-01".format(show_year,
                                                                         show_month))
+        date_filter, date_values = utility.date_range_filter(
+            "s.showdate",
+            *utility.year_month_date_range(parsed_show_year_month.year,
+                                           parsed_show_year_month.month))
     except ValueError as err:
         raise ValueError("Invalid year and month value") from err
 
-    try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT showid FROM ww_shows "
-                 "WHERE YEAR(showdate) = %s "
-                 "AND MONTH(showdate) = %s ORDER BY showdate ASC;")
-        cursor.execute(query, (parsed_show_year_month.year,
-                               parsed_show_year_month.month,))
-        result = cursor.fetchall()
-        cursor.close()
-
-        if not result:
-            return None
-
-        shows = []
-        for show in result:
-            show_info = retrieve_by_id(show["showid"],
-                                       database_connection,
-                                       pre_validated_id=True)
-            shows.append(show_info)
-
-        return shows
-    except ProgrammingError as err:
-        raise ProgrammingError("Unable to query the database") from err
-    except DatabaseError as err:
-        raise DatabaseError("Unexpected database error") from err
+    return _retrieve_shows(database_connection, date_filter, date_values)
 
 def retrieve_recent(database_connection: mysql.connector.connect,
                     include_days_ahead: int = 7,
@@ -483,31 +509,9 @@ def retrieve_recent(database_connection: mysql.connector.connect,
     except OverflowError:
         return None
 
-    try:
-        cursor = database_connection.cursor(dictionary=True)
-        query = ("SELECT showid FROM ww_shows "
-                 "WHERE showdate >= %s AND "
-                 "showdate <= %s ORDER BY showdate ASC;")
-        cursor.execute(query,
-                       (past_date.isoformat(),
-                        future_date.isoformat()))
-        result = cursor.fetchall()
-        cursor.close()
-
-        if not result:
-            return None
-
-        shows = []
-        for show in result:
-            show_info = retrieve_by_id(show["showid"],
-                                       database_connection,
-                                       pre_validated_id=True)
-            shows.append(show_info)
-
-        return shows
-    except ProgrammingError as err:
-        raise ProgrammingError("Unable to query the database") from err
-    except DatabaseError as err:
-        raise DatabaseError("Unexpected database error") from err
+    return _retrieve_shows(database_connection,
+                           "s.showdate >= %s AND s.showdate <= %s",
+                           (past_date.isoformat(),
+                            future_date.isoformat(),))
 
 #endregion
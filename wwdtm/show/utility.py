@@ -5,9 +5,13 @@
 information from the Wait Wait... Don't Tell Me! Stats Page Database.
 """
 
+import calendar
 import datetime
+from typing import Tuple
+import dateutil.parser as parser
 import mysql.connector
 from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import executor
 
 #region Utility Functions
 def validate_id(show_id: int,
@@ -24,11 +28,8 @@ def validate_id(show_id: int,
         return False
 
     try:
-        cursor = database_connection.cursor()
         query = "SELECT showid from ww_shows where showid = %s;"
-        cursor.execute(query, (show_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (show_id,))
 
         return bool(result)
     except ProgrammingError as err:
@@ -58,11 +59,9 @@ def convert_date_to_id(show_year: int,
 
     try:
         show_date_str = show_date.isoformat()
-        cursor = database_connection.cursor()
         query = "SELECT showid from ww_shows WHERE showdate = %s;"
-        cursor.execute(query, (show_date_str,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query,
+                                    (show_date_str,))
 
         if result:
             return result[0]
@@ -83,11 +82,8 @@ def convert_id_to_date(show_id: int,
         database_connection (mysql.connector.connect)
     """
     try:
-        cursor = database_connection.cursor()
         query = "SELECT showdate FROM ww_shows WHERE showid = %s;"
-        cursor.execute(query, (show_id,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query, (show_id,))
 
         if result:
             return result[0].isoformat()
@@ -129,11 +125,9 @@ def date_exists(show_year: int,
 
     try:
         show_date_str = show_date.isoformat()
-        cursor = database_connection.cursor()
         query = "SELECT showid from ww_shows WHERE showdate = %s;"
-        cursor.execute(query, (show_date_str,))
-        result = cursor.fetchone()
-        cursor.close()
+        result = executor.fetch_one(database_connection, query,
+                                    (show_date_str,))
 
         return bool(result)
     except ProgrammingError as err:
@@ -142,3 +136,56 @@ def date_exists(show_year: int,
         raise DatabaseError("Unexpected database error") from err
 
 #endregion
+
+#region Date Range Functions
+def year_date_range(show_year: int) -> Tuple[str, str]:
+    """Returns a tuple containing the first and last days of the
+    requested year, in YYYY-MM-DD format
+
+    Arguments:
+        show_year (int): Four digit year is required
+    """
+    range_start = datetime.date(show_year, 1, 1)
+    range_end = datetime.date(show_year, 12, 31)
+    return range_start.isoformat(), range_end.isoformat()
+
+def year_month_date_range(show_year: int,
+                          show_month: int) -> Tuple[str, str]:
+    """Returns a tuple containing the first and last days of the
+    requested year and month, in YYYY-MM-DD format
+
+    Arguments:
+        show_year (int): Four digit year is required
+        show_month (int)
+    """
+    _, days_in_month = calendar.monthrange(show_year, show_month)
+    range_start = datetime.date(show_year, show_month, 1)
+    range_end = datetime.date(show_year, show_month, days_in_month)
+    return range_start.isoformat(), range_end.isoformat()
+
+def date_range_filter(column: str,
+                      start_date: str,
+                      end_date: str) -> Tuple[str, tuple]:
+    """Returns a tuple containing a SQL condition that matches the
+    requested date column against the dates between the start and end
+    dates (inclusive), and the values for the condition.
+
+    The condition is a half-open range ending on the day after the end
+    date so that an index on the column can be used, unless the end
+    date is the last date that can be represented.
+
+    Arguments:
+        column (str)
+        start_date (str): Start date in YYYY-MM-DD format
+        end_date (str): End date in YYYY-MM-DD format
+    """
+    range_end = parser.parse(end_date).date()
+    if range_end == datetime.date.max:
+        return ("{0} >= %s AND {0} <= %s".format(column),
+                (start_date, range_end.isoformat(),))
+
+    range_end = range_end + datetime.timedelta(days=1)
+    return ("{0} >= %s AND {0} < %s".format(column),
+            (start_date, range_end.isoformat(),))
+
+#endregion
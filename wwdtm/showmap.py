@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""This module provides functions for loading entity-to-show map tables,
+such as ww_showguestmap, ww_showhostmap, ww_showskmap and
+ww_showlocationmap, with a single query and grouping the rows by entity
+in memory.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, List
+import mysql.connector
+from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import executor
+
+#region Building Functions
+def build_show_info(row: Dict) -> Dict:
+    """Returns an OrderedDict containing the show ID, show date and
+    Best Of and repeat show flags for an entity-to-show map row
+
+    Arguments:
+        row (Dict): Row containing showid, showdate, bestof and
+        repeatshowid values
+    """
+    info = OrderedDict()
+    info["show_id"] = row["showid"]
+    info["date"] = row["showdate"].isoformat()
+    info["best_of"] = bool(row["bestof"])
+    info["repeat_show"] = bool(row["repeatshowid"])
+    return info
+
+def build_show_counts(rows: List[Dict]) -> Dict:
+    """Returns an OrderedDict containing the number of regular shows and
+    the number of all shows in a list of entity-to-show map rows
+
+    Arguments:
+        rows (List[Dict]): Rows containing bestof and repeatshowid
+        values
+    """
+    counts = OrderedDict()
+    counts["regular_shows"] = len([row for row in rows
+                                   if row["bestof"] == 0
+                                   and row["repeatshowid"] is None])
+    counts["all_shows"] = len(rows)
+    return counts
+
+def build_appearances(rows: List[Dict],
+                      build_show: Callable[[Dict], Dict] = build_show_info
+                     ) -> Dict:
+    """Returns an OrderedDict containing appearance counts and a list of
+    appearances for a list of entity-to-show map rows. If there are no
+    rows, the count is set to 0 and the list of shows is set to None.
+
+    Arguments:
+        rows (List[Dict])
+        build_show (Callable[[Dict], Dict]): Function that returns an
+        OrderedDict for a single row
+    """
+    appearance_info = OrderedDict()
+    if not rows:
+        appearance_info["count"] = 0
+        appearance_info["shows"] = None
+        return appearance_info
+
+    appearance_info["count"] = build_show_counts(rows)
+    appearance_info["shows"] = [build_show(row) for row in rows]
+    return appearance_info
+
+#endregion
+
+#region Grouping Functions
+def group_rows(rows: List[Dict], entity_column: str) -> Dict[int, List[Dict]]:
+    """Returns a dictionary of lists of rows, keyed by the value of the
+    entity ID column and in the order the entity IDs first appear.
+    Rows without a show ID, returned by a LEFT JOIN for an entity with
+    no shows, add the entity ID with an empty list.
+
+    Arguments:
+        rows (List[Dict])
+        entity_column (str): Name of the entity ID column
+    """
+    grouped_rows = OrderedDict()
+    for row in rows:
+        entity_rows = grouped_rows.setdefault(row[entity_column], [])
+        if row["showid"] is not None:
+            entity_rows.append(row)
+
+    return grouped_rows
+
+def retrieve_grouped(database_connection: mysql.connector.connect,
+                     query: str,
+                     entity_column: str,
+                     build_function: Callable[[List[Dict]], Dict] =
+                     build_appearances,
+                     parameters: tuple = None,
+                     prepared: bool = True) -> Dict[int, Dict]:
+    """Runs a query against an entity-to-show map table and returns a
+    dictionary of OrderedDicts built from the rows for each entity,
+    keyed by entity ID. The query must return the entity ID column and
+    showid values, with rows for each entity sorted by show date.
+
+    Arguments:
+        database_connection (mysql.connector.connect)
+        query (str)
+        entity_column (str): Name of the entity ID column
+        build_function (Callable[[List[Dict]], Dict]): Function that
+        returns an OrderedDict for the list of rows for an entity
+        parameters (tuple)
+        prepared (bool): Flag whether or not the query can use a
+        prepared statement. Set to False for queries built at runtime.
+    """
+    try:
+        result = executor.fetch_all(database_connection, query, parameters,
+                                    dictionary=True, prepared=prepared)
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+    grouped = OrderedDict()
+    for entity_id, rows in group_rows(result, entity_column).items():
+        grouped[entity_id] = build_function(rows)
+
+    return grouped
+
+#endregion
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""This module provides an opt-in, in-memory slug and ID index for the
+guest, host, location, panelist and scorekeeper modules.
+
+The index is disabled by default. Once enabled, the slug and ID
+utility functions for each module resolve and validate slugs and IDs
+using an index that is built from the corresponding table the first
+time it is needed, rather than querying the database for each call.
+Indexes are not updated automatically when rows are added or changed
+and need to be refreshed by calling refresh().
+"""
+
+import threading
+from typing import Dict
+import mysql.connector
+from mysql.connector.errors import DatabaseError, ProgrammingError
+from wwdtm import executor
+
+#region Constants
+# Table, ID column and slug column for each entity type
+ENTITY_TABLES = {
+    "guest": ("ww_guests", "guestid", "guestslug"),
+    "host": ("ww_hosts", "hostid", "hostslug"),
+    "location": ("ww_locations", "locationid", "locationslug"),
+    "panelist": ("ww_panelists", "panelistid", "panelistslug"),
+    "scorekeeper": ("ww_scorekeepers", "scorekeeperid", "scorekeeperslug"),
+}
+#endregion
+
+#region Index Class
+class SlugIndex:
+    """Bidirectional slug and ID index for a single entity type
+
+    Slugs are matched case-insensitively to match the default
+    collation used by the database.
+
+    Arguments:
+        slugs (Dict[int, str]): Stored slugs keyed by ID. IDs without a
+        stored slug are included with a value of None.
+    """
+
+    def __init__(self, slugs: Dict[int, str]):
+        self._id_to_slug = dict(slugs)
+        self._slug_to_id = {}
+        for entity_id, slug in self._id_to_slug.items():
+            if slug:
+                self._slug_to_id.setdefault(slug.lower(), entity_id)
+
+    def __len__(self) -> int:
+        return len(self._id_to_slug)
+
+    def id_for_slug(self, slug: str) -> int:
+        """Returns the ID for a slug, or None if the slug does not
+        exist
+
+        Arguments:
+            slug (str)
+        """
+        if not isinstance(slug, str):
+            return None
+
+        return self._slug_to_id.get(slug.lower())
+
+    def slug_for_id(self, entity_id: int) -> str:
+        """Returns the stored slug for an ID, or None if the ID does
+        not exist or does not have a stored slug
+
+        Arguments:
+            entity_id (int)
+        """
+        return self._id_to_slug.get(entity_id)
+
+    def has_id(self, entity_id: int) -> bool:
+        """Returns true or false based on whether or not an ID exists
+
+        Arguments:
+            entity_id (int)
+        """
+        return entity_id in self._id_to_slug
+
+    def has_slug(self, slug: str) -> bool:
+        """Returns true or false based on whether or not a slug exists
+
+        Arguments:
+            slug (str)
+        """
+        return self.id_for_slug(slug) is not None
+
+#endregion
+
+_indexes = None
+_lock = threading.Lock()
+
+#region Internal Functions
+def _build_index(entity_type: str,
+                 database_connection: mysql.connector.connect) -> SlugIndex:
+    """Returns a new slug index built from the table for the requested
+    entity type
+
+    Arguments:
+        entity_type (str)
+        database_connection (mysql.connector.connect)
+    """
+    table, id_column, slug_column = ENTITY_TABLES[entity_type]
+    try:
+        query = "SELECT {}, {} FROM {};".format(id_column, slug_column, table)
+        result = executor.fetch_all(database_connection, query, prepared=False)
+    except ProgrammingError as err:
+        raise ProgrammingError("Unable to query the database") from err
+    except DatabaseError as err:
+        raise DatabaseError("Unexpected database error") from err
+
+    return SlugIndex({row[0]: row[1] for row in result})
+
+#endregion
+
+#region Index Management Functions
+def enable() -> None:
+    """Enables slug and ID indexes. Each index is built the first time
+    it is used."""
+    global _indexes
+    with _lock:
+        if _indexes is None:
+            _indexes = {}
+
+def disable() -> None:
+    """Disables and discards all slug and ID indexes"""
+    global _indexes
+    with _lock:
+        _indexes = None
+
+def is_enabled() -> bool:
+    """Returns true or false based on whether or not slug and ID
+    indexes are enabled"""
+    return _indexes is not None
+
+def get_index(entity_type: str,
+              database_connection: mysql.connector.connect) -> SlugIndex:
+    """Returns the slug index for the requested entity type, building
+    the index if needed. Returns None if indexes are not enabled.
+
+    Arguments:
+        entity_type (str)
+        database_connection (mysql.connector.connect)
+    """
+    if entity_type not in ENTITY_TABLES:
+        raise ValueError("Invalid entity type: {}".format(entity_type))
+
+    indexes = _indexes
+    if indexes is None:
+        return None
+
+    index = indexes.get(entity_type)
+    if index is not None:
+        return index
+
+    with _lock:
+        index = indexes.get(entity_type)
+        if index is None:
+            index = _build_index(entity_type, database_connection)
+            indexes[entity_type] = index
+
+    return index
+
+def refresh(entity_type: str = None,
+            database_connection: mysql.connector.connect = None) -> None:
+    """Discards the slug index for an entity type, or all indexes if no
+    entity type is provided. If a database connection is provided, the
+    indexes are rebuilt immediately; otherwise, they are rebuilt the
+    next time they are used.
+
+    Arguments:
+        entity_type (str)
+        database_connection (mysql.connector.connect)
+    """
+    if entity_type is not None and entity_type not in ENTITY_TABLES:
+        raise ValueError("Invalid entity type: {}".format(entity_type))
+
+    indexes = _indexes
+    if indexes is None:
+        return
+
+    if entity_type:
+        entity_types = [entity_type]
+    else:
+        entity_types = list(ENTITY_TABLES)
+
+    for refresh_type in entity_types:
+        if database_connection:
+            index = _build_index(refresh_type, database_connection)
+            with _lock:
+                indexes[refresh_type] = index
+        else:
+            with _lock:
+                indexes.pop(refresh_type, None)
+
+#endregion
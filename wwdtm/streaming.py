@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2021 Linh Pham
+# wwdtm is relased under the terms of the Apache License 2.0
+"""This module provides the batching used by the iter_all functions in
+the guest, host, location, panelist, scorekeeper and show modules.
+
+The iter_all functions retrieve the list of IDs up front, then retrieve
+details for a bounded batch of IDs at a time and yield one entry at a
+time. Only the current batch is kept in memory and the first entry is
+available as soon as the first batch has been retrieved.
+"""
+
+from typing import Callable, Iterator, List
+
+#region Constants
+DEFAULT_BATCH_SIZE = 100
+#endregion
+
+#region Internal Functions
+def _iter_by_ids(ids: List[int],
+                 retrieve_batch: Callable[[List[int]], List],
+                 batch_size: int) -> Iterator:
+    """Returns a generator that yields the entries returned by
+    retrieve_batch for each batch of IDs
+
+    Arguments:
+        ids (List[int])
+        retrieve_batch (Callable[[List[int]], List])
+        batch_size (int)
+    """
+    for batch in iter_batches(ids, batch_size):
+        entries = retrieve_batch(batch)
+        if entries:
+            yield from entries
+
+#endregion
+
+#region Batching Functions
+def iter_batches(values: List, batch_size: int) -> Iterator[List]:
+    """Returns a generator that yields consecutive lists of at most
+    batch_size values
+
+    Arguments:
+        values (List)
+        batch_size (int)
+    """
+    for index in range(0, len(values), batch_size):
+        yield values[index:index + batch_size]
+
+def iter_by_ids(ids: List[int],
+                retrieve_batch: Callable[[List[int]], List],
+                batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator:
+    """Returns an iterator that calls retrieve_batch with consecutive
+    batches of at most batch_size IDs and yields each entry returned,
+    in order
+
+    Arguments:
+        ids (List[int])
+        retrieve_batch (Callable[[List[int]], List]): Function that
+        returns a list of entries for a list of IDs
+        batch_size (int): Maximum number of IDs to retrieve at a time
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+
+    return _iter_by_ids(ids or [], retrieve_batch, batch_size)
+
+#endregion